@@ -12,18 +12,34 @@ from flask_restx import Api
 # Load environment variables BEFORE importing config
 load_dotenv()
 
+from app.commands.archive_commands import logs_cli  # noqa: E402
+from app.commands.consumption_commands import consumptions_cli  # noqa: E402
+from app.commands.event_commands import events_cli  # noqa: E402
+from app.commands.item_commands import items_cli  # noqa: E402
+from app.commands.query_plan_commands import explain_queries_command  # noqa: E402
+from app.commands.token_commands import tokens_cli  # noqa: E402
 from app.controllers.health_controller import health_ns  # noqa: E402
 from app.extensions import cors, db  # noqa: E402
+from app.models.consumption_daily import ConsumptionDaily  # noqa: E402
 from app.models.consumption_log import ConsumptionLog  # noqa: E402
 from app.models.item import Item  # noqa: E402
+from app.models.item_tombstone import ItemTombstone  # noqa: E402
 from app.models.kitchen import Kitchen  # noqa: E402
+from app.models.kitchen_event import KitchenEvent  # noqa: E402
+from app.models.log_archive import LogArchive  # noqa: E402
 from app.models.restock_log import RestockLog  # noqa: E402
+from app.models.revoked_token import RevokedToken  # noqa: E402
 from app.models.user_model import User  # noqa: E402
 from app.routes.auth_routes import auth_ns  # noqa: E402
 from app.routes.consumption_log_routes import consumption_ns  # noqa: E402
 from app.routes.item_routes import item_ns  # noqa: E402
 from app.routes.kitchen_routes import kitchen_ns  # noqa: E402
 from app.routes.restock_log_routes import restock_ns  # noqa: E402
+from app.services.event_broker import EventBroker  # noqa: E402
+from app.services.lookup_cache import init_lookup_caches  # noqa: E402
+from app.services.password_hasher import PasswordHasher  # noqa: E402
+from app.services.rate_limiter import RateLimiter  # noqa: E402
+from app.services.token_blocklist import TokenBlocklist  # noqa: E402
 from config import get_config  # noqa: E402
 
 
@@ -54,6 +70,11 @@ def create_app(config_name: str = None) -> Flask:
     # Initialize extensions
     db.init_app(app)
     JWTManager(app)
+    TokenBlocklist(app)
+    EventBroker(app)
+    PasswordHasher(app)
+    init_lookup_caches(app)
+    RateLimiter(app)
 
     # Initialize CORS with configuration
     cors.init_app(
@@ -81,6 +102,14 @@ def create_app(config_name: str = None) -> Flask:
     api.add_namespace(restock_ns)
     api.add_namespace(consumption_ns)
 
+    # Register CLI commands
+    app.cli.add_command(explain_queries_command)
+    app.cli.add_command(items_cli)
+    app.cli.add_command(events_cli)
+    app.cli.add_command(tokens_cli)
+    app.cli.add_command(consumptions_cli)
+    app.cli.add_command(logs_cli)
+
     # Create database tables
     with app.app_context():
         try:
@@ -0,0 +1,72 @@
+"""
+Log retention. Usage::
+
+    flask logs archive
+    flask logs archive --older-than-days 180 --table consumption_logs
+    flask logs archives
+"""
+
+from __future__ import annotations
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from app.services.log_archive_service import ARCHIVED_TABLES, LogArchiveService
+
+logs_cli = AppGroup("logs", help="Consumption and restock log commands.")
+
+
+@logs_cli.command("archive")
+@click.option(
+    "--older-than-days",
+    type=int,
+    default=None,
+    help="Archive whole days older than this (default: LOG_RETENTION_DAYS).",
+)
+@click.option(
+    "--table",
+    "tables",
+    type=click.Choice(sorted(ARCHIVED_TABLES)),
+    multiple=True,
+    help="Table to archive; repeatable (default: both).",
+)
+@click.option(
+    "--dir", "directory", default=None, help="Output directory (default: LOG_ARCHIVE_DIR)."
+)
+@click.option(
+    "--chunk-size",
+    type=int,
+    default=None,
+    help="Rows deleted per transaction (default: LOG_ARCHIVE_CHUNK_SIZE).",
+)
+def archive_command(older_than_days, tables, directory, chunk_size):
+    """Write old logs to gzip NDJSON files and delete them from the database."""
+    config = current_app.config
+    try:
+        report = LogArchiveService.archive(
+            config["LOG_RETENTION_DAYS"] if older_than_days is None else older_than_days,
+            directory or config["LOG_ARCHIVE_DIR"],
+            tables=list(tables) or None,
+            chunk_size=config["LOG_ARCHIVE_CHUNK_SIZE"] if chunk_size is None else chunk_size,
+        )
+    except ValueError as exc:
+        raise click.BadParameter(str(exc)) from exc
+
+    click.echo(f"Archiving logs before {report['cutoff']}")
+    for table_name, counts in report["tables"].items():
+        resumed = f", finished {counts['resumed']} interrupted" if counts["resumed"] else ""
+        click.echo(
+            f"{table_name}: archived {counts['archived']} row(s) from {counts['days']} day(s), "
+            f"deleted {counts['deleted']}{resumed}"
+        )
+
+
+@logs_cli.command("archives")
+@click.option("--table", type=click.Choice(sorted(ARCHIVED_TABLES)), default=None)
+def archives_command(table):
+    """List archive files and the totals they hold."""
+    for manifest in LogArchiveService.get_archives(table):
+        usage = f" {manifest.percent_used:.1f}%" if manifest.percent_used is not None else ""
+        status = "" if manifest.deleted_at else " (delete pending)"
+        click.echo(f"{manifest.day} {manifest.row_count:>7}{usage}  {manifest.path}{status}")
@@ -0,0 +1,38 @@
+"""
+Consumption rollup maintenance. Usage::
+
+    flask consumptions backfill
+    flask consumptions backfill --from 2026-01-01 --to 2026-02-01
+"""
+
+from __future__ import annotations
+
+import click
+from flask.cli import AppGroup
+
+from app.services.consumption_rollup_service import ConsumptionRollupService
+
+consumptions_cli = AppGroup("consumptions", help="Consumption log commands.")
+
+
+@consumptions_cli.command("backfill")
+@click.option(
+    "--from",
+    "start",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="First day to rebuild, inclusive (default: all history).",
+)
+@click.option(
+    "--to",
+    "end",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="Day to stop at, exclusive (default: no limit).",
+)
+def backfill_command(start, end):
+    """Rebuild the consumption_daily rollup from consumption_logs."""
+    written = ConsumptionRollupService.rebuild(
+        start.date() if start else None, end.date() if end else None
+    )
+    click.echo(f"Wrote {written} daily rollup row(s)")
@@ -0,0 +1,32 @@
+"""
+Kitchen event outbox maintenance. Usage::
+
+    flask events prune
+    flask events prune --days 1
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from app.services.kitchen_event_service import KitchenEventService
+
+events_cli = AppGroup("events", help="Kitchen event outbox commands.")
+
+
+@events_cli.command("prune")
+@click.option(
+    "--days",
+    type=int,
+    default=None,
+    help="Keep events newer than this many days (default: EVENT_RETENTION_DAYS).",
+)
+def prune_events_command(days: int | None):
+    """Delete kitchen events older than the retention window."""
+    days = days if days is not None else current_app.config["EVENT_RETENTION_DAYS"]
+    deleted = KitchenEventService.prune_events(datetime.utcnow() - timedelta(days=days))
+    click.echo(f"Deleted {deleted} event(s) older than {days} day(s)")
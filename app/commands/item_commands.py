@@ -0,0 +1,56 @@
+"""
+Item maintenance commands. Usage::
+
+    flask items import 1 inventory.csv
+    flask items import 1 inventory.ndjson --batch-size 1000
+"""
+
+from __future__ import annotations
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from app.services.item_import_service import IMPORT_FORMATS, ItemImportService
+
+items_cli = AppGroup("items", help="Item maintenance commands.")
+
+
+@items_cli.command("import")
+@click.argument("kitchen_id", type=int)
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(IMPORT_FORMATS),
+    default=None,
+    help="File format (default: from the file extension).",
+)
+@click.option("--batch-size", type=int, default=None, help="Rows per INSERT and commit.")
+def import_items_command(kitchen_id: int, path: str, fmt: str | None, batch_size: int | None):
+    """Import items for KITCHEN_ID from a CSV or NDJSON file at PATH."""
+    if fmt is None:
+        extension = path.rsplit(".", 1)[-1].lower()
+        fmt = "ndjson" if extension in ("ndjson", "jsonl") else extension
+    if fmt not in IMPORT_FORMATS:
+        raise click.BadParameter(
+            "cannot infer format from extension; use --format", param_hint="--format"
+        )
+
+    with open(path, "rb") as stream:
+        try:
+            report = ItemImportService.import_items(
+                kitchen_id,
+                stream,
+                fmt,
+                batch_size=batch_size or current_app.config["ITEM_IMPORT_BATCH_SIZE"],
+            )
+        except ValueError as exc:
+            raise click.ClickException(str(exc)) from exc
+
+    click.echo(f"Imported {report['imported']} item(s), {report['failed']} row(s) failed")
+    for error in report["errors"]:
+        details = "; ".join(f"{field}: {message}" for field, message in error["errors"].items())
+        click.echo(f"  row {error['row']}: {details}")
+    if report["errors_truncated"]:
+        click.echo("  (further errors omitted)")
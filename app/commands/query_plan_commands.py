@@ -0,0 +1,316 @@
+"""
+Query-plan report for service-layer queries.
+
+Runs every read query the services issue, captures the SQL that reaches the
+database, and prints the EXPLAIN output for each statement, flagging full
+table scans. Usage::
+
+    flask explain-queries --seed 500
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models.consumption_log import ConsumptionLog
+from app.models.item import Item, ItemStatus
+from app.models.kitchen import Kitchen
+from app.models.restock_log import RestockLog
+from app.models.user_model import User
+from app.services.activity_service import ActivityService
+from app.services.auth_service import AuthService
+from app.services.consumption_log_service import ConsumptionLogService
+from app.services.consumption_rollup_service import ConsumptionRollupService
+from app.services.forecast_service import ForecastService
+from app.services.item_service import ItemService
+from app.services.kitchen_service import KitchenService
+from app.services.restock_interval_service import RestockIntervalService
+from app.services.restock_log_service import RestockLogService
+
+
+@dataclass
+class QuerySample:
+    """Ids of existing rows used as arguments for the service queries."""
+
+    kitchen_id: int
+    kitchen_code: str
+    user_id: int
+    display_name: str
+    item_id: int
+    consumption_log_id: int
+    restock_log_id: int
+
+
+SERVICE_QUERIES: list[tuple[str, Callable[[QuerySample], object]]] = [
+    ("KitchenService.get_kitchen_by_id", lambda s: KitchenService.get_kitchen_by_id(s.kitchen_id)),
+    (
+        "KitchenService.get_kitchen_by_code",
+        lambda s: KitchenService.get_kitchen_by_code(s.kitchen_code),
+    ),
+    (
+        "KitchenService.get_all_kitchens (next page)",
+        lambda s: KitchenService.get_all_kitchens(
+            limit=101, cursor=KitchenService.cursor_for(db.session.get(Kitchen, s.kitchen_id))
+        ),
+    ),
+    (
+        "KitchenService.get_all_kitchens (name_prefix, sort=name)",
+        lambda s: KitchenService.get_all_kitchens(limit=101, sort="name", name_prefix="Query"),
+    ),
+    (
+        "KitchenService.get_all_kitchens (created range, sort=-created_at)",
+        lambda s: KitchenService.get_all_kitchens(
+            limit=101,
+            sort="-created_at",
+            created_from=datetime(2000, 1, 1),
+            created_to=datetime(2100, 1, 1),
+        ),
+    ),
+    (
+        "AuthService.authenticate_user",
+        lambda s: AuthService.authenticate_user(s.display_name, "wrong-password", s.kitchen_code),
+    ),
+    ("AuthService.get_user_profile", lambda s: AuthService.get_user_profile(s.user_id)),
+    ("ItemService.get_item_by_id", lambda s: ItemService.get_item_by_id(s.item_id)),
+    (
+        "ItemService.get_items_by_kitchen",
+        lambda s: ItemService.get_items_by_kitchen(s.kitchen_id, limit=101),
+    ),
+    (
+        "ItemService.get_items_by_kitchen (status=needed)",
+        lambda s: ItemService.get_items_by_kitchen(
+            s.kitchen_id, limit=101, status=ItemStatus.NEEDED
+        ),
+    ),
+    (
+        "ItemService.get_items_by_kitchen (sort=name)",
+        lambda s: ItemService.get_items_by_kitchen(s.kitchen_id, limit=101, sort="name"),
+    ),
+    (
+        "ItemService.get_items_by_kitchen (sort=-quantity)",
+        lambda s: ItemService.get_items_by_kitchen(s.kitchen_id, limit=101, sort="-quantity"),
+    ),
+    (
+        "ItemService.get_items_by_kitchen (low_stock)",
+        lambda s: ItemService.get_items_by_kitchen(s.kitchen_id, limit=101, low_stock=True),
+    ),
+    (
+        "ItemService.count_items_by_kitchen",
+        lambda s: ItemService.count_items_by_kitchen(s.kitchen_id),
+    ),
+    (
+        "ItemService.get_item_changes",
+        lambda s: ItemService.get_item_changes(
+            s.kitchen_id, ItemService.get_item_changes(s.kitchen_id, limit=1)["next_cursor"]
+        ),
+    ),
+    (
+        "ConsumptionLogService.get_consumption_log_by_id",
+        lambda s: ConsumptionLogService.get_consumption_log_by_id(s.consumption_log_id),
+    ),
+    (
+        "ConsumptionLogService.get_consumption_logs_by_item",
+        lambda s: ConsumptionLogService.get_consumption_logs_by_item(s.item_id),
+    ),
+    (
+        "ConsumptionLogService.get_consumption_logs_by_kitchen",
+        lambda s: ConsumptionLogService.get_consumption_logs_by_kitchen(s.kitchen_id),
+    ),
+    (
+        "ConsumptionLogService.get_consumption_logs_by_user",
+        lambda s: ConsumptionLogService.get_consumption_logs_by_user(s.user_id),
+    ),
+    (
+        "ConsumptionRollupService.get_daily_usage (item)",
+        lambda s: ConsumptionRollupService.get_daily_usage(
+            date.today() - timedelta(days=90), date.today(), item_id=s.item_id
+        ),
+    ),
+    (
+        "ConsumptionRollupService.get_daily_usage (kitchen)",
+        lambda s: ConsumptionRollupService.get_daily_usage(
+            date.today() - timedelta(days=90), date.today(), kitchen_id=s.kitchen_id
+        ),
+    ),
+    (
+        "ForecastService.load_history",
+        lambda s: ForecastService.load_history(s.kitchen_id, datetime(2000, 1, 1)),
+    ),
+    (
+        "RestockIntervalService.compute_intervals",
+        lambda s: RestockIntervalService.compute_intervals(s.kitchen_id),
+    ),
+    (
+        "ActivityService.get_activity",
+        lambda s: ActivityService.get_activity(s.kitchen_id, limit=100),
+    ),
+    (
+        "RestockLogService.get_restock_log_by_id",
+        lambda s: RestockLogService.get_restock_log_by_id(s.restock_log_id),
+    ),
+    (
+        "RestockLogService.get_restock_logs_by_item",
+        lambda s: RestockLogService.get_restock_logs_by_item(s.item_id),
+    ),
+    (
+        "RestockLogService.get_restock_logs_by_kitchen",
+        lambda s: RestockLogService.get_restock_logs_by_kitchen(s.kitchen_id),
+    ),
+    (
+        "RestockLogService.get_restock_logs_by_user",
+        lambda s: RestockLogService.get_restock_logs_by_user(s.user_id),
+    ),
+]
+
+
+def seed_sample_data(item_count: int) -> QuerySample:
+    """Flush a synthetic kitchen into the current transaction and return its ids."""
+    kitchen = Kitchen(code="999999", name="Query plan sample")
+    db.session.add(kitchen)
+    db.session.flush()
+
+    user = User(display_name="planner", kitchen_id=kitchen.id, password_hash="x")
+    db.session.add(user)
+
+    items = [
+        Item(
+            name=f"Sample item {i}",
+            kitchen_id=kitchen.id,
+            status=ItemStatus.NEEDED if i % 3 == 0 else ItemStatus.IN_STOCK,
+        )
+        for i in range(max(item_count, 1))
+    ]
+    db.session.add_all(items)
+    db.session.flush()
+
+    consumptions = [
+        ConsumptionLog(user_id=user.id, item_id=item.id, percent_used=5.0) for item in items
+    ]
+    restocks = [RestockLog(user_id=user.id, item_id=item.id) for item in items]
+    db.session.add_all(consumptions + restocks)
+    db.session.flush()
+
+    return QuerySample(
+        kitchen_id=kitchen.id,
+        kitchen_code=kitchen.code,
+        user_id=user.id,
+        display_name=user.display_name,
+        item_id=items[0].id,
+        consumption_log_id=consumptions[0].id,
+        restock_log_id=restocks[0].id,
+    )
+
+
+def existing_sample_data() -> QuerySample | None:
+    """Pick ids from rows that already exist, or None if the database is empty."""
+    user = User.query.first()
+    item = Item.query.first()
+    consumption = ConsumptionLog.query.first()
+    restock = RestockLog.query.first()
+    if not (user and item and consumption and restock):
+        return None
+    return QuerySample(
+        kitchen_id=item.kitchen_id,
+        kitchen_code=user.kitchen.code,
+        user_id=user.id,
+        display_name=user.display_name,
+        item_id=item.id,
+        consumption_log_id=consumption.id,
+        restock_log_id=restock.id,
+    )
+
+
+def capture_selects(fn: Callable[[], object]) -> list[tuple[str, object]]:
+    """Run fn and return the SELECT statements it sent to the database."""
+    captured: list[tuple[str, object]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", _capture)
+    try:
+        fn()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _capture)
+    return captured
+
+
+def explain(statement: str, parameters) -> tuple[list[str], bool]:
+    """Return the plan lines for a statement and whether it contains a full table scan."""
+    dialect = db.engine.dialect.name
+    prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+    result = db.session.connection().exec_driver_sql(prefix + statement, parameters)
+    rows = [dict(row._mapping) for row in result]
+
+    if dialect == "sqlite":
+        details = [row["detail"] for row in rows]
+        # SEARCH rows are index seeks. SCAN rows read the whole table or
+        # index ("USING [COVERING] INDEX" included) unless they seek on the
+        # rowid. Scans of derived tables (subqueries, CTEs) read rows already
+        # narrowed down; only scans of stored tables count.
+        full_scan = any(
+            detail.startswith("SCAN ")
+            and "USING INTEGER PRIMARY KEY" not in detail
+            and detail.split()[1] in db.metadata.tables
+            for detail in details
+        )
+        return details, full_scan
+
+    if dialect == "mysql":
+        lines = [
+            f"table={row.get('table')} type={row.get('type')} key={row.get('key')} "
+            f"rows={row.get('rows')} extra={row.get('Extra')}"
+            for row in rows
+        ]
+        # "index" is a full index scan, as costly as "ALL" on large tables.
+        return lines, any(row.get("type") in ("ALL", "index") for row in rows)
+
+    return [" ".join(str(value) for value in row.values()) for row in rows], False
+
+
+@click.command("explain-queries")
+@click.option(
+    "--seed",
+    "seed_items",
+    type=int,
+    default=None,
+    help="Seed a synthetic kitchen with this many items (rolled back afterwards).",
+)
+@click.option(
+    "--fail-on-full-scan",
+    is_flag=True,
+    help="Exit with status 1 if any query plan contains a full table scan.",
+)
+@with_appcontext
+def explain_queries_command(seed_items: int | None, fail_on_full_scan: bool) -> None:
+    """Print EXPLAIN output for every service query and flag full table scans."""
+    try:
+        sample = seed_sample_data(seed_items) if seed_items else existing_sample_data()
+        if sample is None:
+            raise click.ClickException("Database has no data to explain against; use --seed N.")
+
+        flagged = []
+        for label, query in SERVICE_QUERIES:
+            for statement, parameters in capture_selects(lambda q=query: q(sample)):
+                plan, full_scan = explain(statement, parameters)
+                marker = "FULL SCAN" if full_scan else "ok"
+                click.echo(f"[{marker}] {label}")
+                click.echo(f"    {' '.join(statement.split())}")
+                for line in plan:
+                    click.echo(f"      {line}")
+                if full_scan:
+                    flagged.append(label)
+    finally:
+        db.session.rollback()
+
+    click.echo(f"{len(flagged)} statement(s) with full table scans")
+    if flagged and fail_on_full_scan:
+        raise SystemExit(1)
@@ -0,0 +1,35 @@
+"""
+JWT blocklist maintenance. Usage::
+
+    flask tokens purge
+    flask tokens revoke-user 42
+"""
+
+from __future__ import annotations
+
+import click
+from flask.cli import AppGroup
+
+from app.services.auth_service import AuthService
+
+tokens_cli = AppGroup("tokens", help="JWT revocation commands.")
+
+
+@tokens_cli.command("purge")
+def purge_tokens_command():
+    """Delete blocklist entries for tokens that have expired."""
+    deleted = AuthService.purge_revoked_tokens()
+    click.echo(f"Deleted {deleted} expired blocklist entr{'y' if deleted == 1 else 'ies'}")
+
+
+@tokens_cli.command("revoke-user")
+@click.argument("user_id", type=int)
+@click.option("--deactivate", is_flag=True, help="Also mark the user inactive.")
+def revoke_user_command(user_id: int, deactivate: bool):
+    """Revoke every token issued to a user so far."""
+    if deactivate:
+        if not AuthService.deactivate_user(user_id):
+            raise click.ClickException(f"User {user_id} not found")
+    else:
+        AuthService.revoke_user_tokens(user_id)
+    click.echo(f"Revoked tokens for user {user_id}")
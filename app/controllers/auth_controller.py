@@ -3,11 +3,11 @@ from __future__ import annotations
 import re
 
 from flask import request
-from flask_jwt_extended import get_jwt_identity, jwt_required
+from flask_jwt_extended import decode_token, get_jwt, get_jwt_identity, jwt_required
 from flask_restx import Resource
 
-from app.models.user_model import User
 from app.services.auth_service import AuthService
+from app.services.password_hasher import PasswordHasherBusy
 
 
 def _get_json() -> dict:
@@ -20,6 +20,14 @@ def _error(code: str, message: str, **kwargs) -> dict:
     return payload
 
 
+def _busy() -> tuple:
+    return (
+        _error("server_busy", "Too many sign-ins in progress, retry shortly"),
+        503,
+        {"Retry-After": "1"},
+    )
+
+
 def _is_strong_password(password: str) -> bool:
     if len(password) < 8:
         return False
@@ -80,9 +88,12 @@ class RegisterResource(Resource):
                 kitchen_code=data["kitchen_code"],
             )
             tokens = AuthService.generate_tokens(user)
-            return {"user": user.to_dict(), **tokens}, 201
+            profile = user.to_profile(kitchen_code=data["kitchen_code"])
+            return {"user": profile.to_dict(), **tokens}, 201
         except ValueError as exc:
             return _error("validation_error", str(exc)), 400
+        except PasswordHasherBusy:
+            return _busy()
 
 
 class LoginResource(Resource):
@@ -111,31 +122,68 @@ class LoginResource(Resource):
                 400,
             )
 
-        user = AuthService.authenticate_user(
-            display_name=display_name,
-            password=password,
-            kitchen_code=kitchen_code,
-        )
+        try:
+            user = AuthService.authenticate_user(
+                display_name=display_name,
+                password=password,
+                kitchen_code=kitchen_code,
+            )
+        except PasswordHasherBusy:
+            return _busy()
         if not user:
             return _error("auth_invalid_credentials", "Invalid credentials"), 401
 
         tokens = AuthService.generate_tokens(user)
-        return {"user": user.to_dict(), **tokens}, 200
+        return {"user": user.to_profile(kitchen_code=kitchen_code).to_dict(), **tokens}, 200
 
 
 class RefreshResource(Resource):
     @jwt_required(refresh=True)
     def post(self):
         user_id = int(get_jwt_identity())
-        access_token = AuthService.refresh_access_token(user_id=user_id)
+        access_token = AuthService.refresh_access_token(
+            user_id=user_id, kitchen_id=get_jwt().get("kitchen_id")
+        )
         return {"access_token": access_token}, 200
 
 
+class LogoutResource(Resource):
+    @jwt_required(verify_type=False)
+    def post(self):
+        claims = get_jwt()
+        user_id = int(claims["sub"])
+        tokens = [claims]
+
+        refresh_token = _get_json().get("refresh_token")
+        if refresh_token:
+            try:
+                refresh_claims = decode_token(refresh_token)
+            except Exception:
+                return (
+                    _error("validation_error", "Invalid refresh token", field="refresh_token"),
+                    400,
+                )
+            if refresh_claims["sub"] != claims["sub"]:
+                return (
+                    _error(
+                        "validation_error",
+                        "Refresh token belongs to another user",
+                        field="refresh_token",
+                    ),
+                    400,
+                )
+            tokens.append(refresh_claims)
+
+        for token in tokens:
+            AuthService.revoke_token(token["jti"], token["exp"], user_id=user_id)
+        return {"message": "Logged out successfully"}, 200
+
+
 class MeResource(Resource):
     @jwt_required()
     def get(self):
         user_id = int(get_jwt_identity())
-        user = User.query.get(user_id)
+        user = AuthService.get_user_profile(user_id)
         if not user:
             return _error("user_not_found", "User not found"), 404
-        return {"user": user.to_dict()}, 200
+        return {"user": user}, 200
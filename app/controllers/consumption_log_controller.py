@@ -1,46 +1,111 @@
 from __future__ import annotations
 
-from flask import request
+from datetime import date, datetime, timedelta
+
+from flask import current_app, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
 from flask_restx import Resource
 
+from app.controllers.http_cache import cache_headers, kitchen_etag, not_modified
+from app.controllers.log_pages import error_payload, log_page, parse_datetime, parse_log_page_args
+from app.controllers.streaming import EXPORT_FORMATS, stream_rows
 from app.services.consumption_log_service import ConsumptionLogService
+from app.services.consumption_rollup_service import ConsumptionRollupService
 
 
 def _get_json() -> dict:
     return request.get_json(silent=True) or {}
 
 
-def _error(code: str, message: str, **kwargs) -> dict:
-    payload = {"code": code, "message": message}
-    payload.update(kwargs)
-    return payload
+def _validate_batch_entry(entry) -> tuple[dict | None, dict | None]:
+    """Validate one batch entry, returning (entry, None) or (None, error)."""
+    if not isinstance(entry, dict):
+        return None, error_payload("validation_error", "Entry must be an object")
+
+    item_id = entry.get("item_id")
+    percent_used = entry.get("percent_used")
+    missing = [
+        field
+        for field, value in (("item_id", item_id), ("percent_used", percent_used))
+        if value is None
+    ]
+    if missing:
+        return None, error_payload("missing_fields", "Missing required fields", fields=missing)
+
+    # bool is a subclass of int, so JSON true/false would otherwise pass as 1/0.
+    if isinstance(item_id, bool) or not isinstance(item_id, int):
+        return None, error_payload(
+            "validation_error", "item_id must be an integer", field="item_id"
+        )
+
+    if (
+        isinstance(percent_used, bool)
+        or not isinstance(percent_used, int | float)
+        or not (0 <= percent_used <= 100)
+    ):
+        return None, error_payload(
+            "validation_error",
+            "percent_used must be between 0 and 100",
+            field="percent_used",
+        )
+
+    occurred_at = None
+    if entry.get("occurred_at"):
+        try:
+            occurred_at = parse_datetime(entry["occurred_at"])
+        except (TypeError, ValueError, AttributeError):
+            return None, error_payload(
+                "validation_error",
+                "occurred_at must be an ISO 8601 timestamp",
+                field="occurred_at",
+            )
+
+    return {
+        "item_id": item_id,
+        "percent_used": float(percent_used),
+        "occurred_at": occurred_at,
+    }, None
 
 
 class ConsumptionLogListResource(Resource):
     @jwt_required()
     def get(self):
-        """Get consumption logs filtered by item_id, kitchen_id, or user_id."""
+        """Get one page of consumption logs for an item, kitchen or user, newest first."""
         item_id = request.args.get("item_id", type=int)
         kitchen_id = request.args.get("kitchen_id", type=int)
         user_id = request.args.get("user_id", type=int)
 
-        if item_id:
-            logs = ConsumptionLogService.get_consumption_logs_by_item(item_id)
-        elif kitchen_id:
-            logs = ConsumptionLogService.get_consumption_logs_by_kitchen(kitchen_id)
-        elif user_id:
-            logs = ConsumptionLogService.get_consumption_logs_by_user(user_id)
-        else:
+        if not (item_id or kitchen_id or user_id):
             return (
-                _error(
+                error_payload(
                     "missing_parameter",
                     "One of item_id, kitchen_id, or user_id is required",
                 ),
                 400,
             )
 
-        return {"logs": [log.to_dict() for log in logs]}, 200
+        page_args, error = parse_log_page_args()
+        if error:
+            return error, 400
+
+        etag = None
+        try:
+            if item_id:
+                logs = ConsumptionLogService.get_consumption_logs_by_item(item_id, **page_args)
+            elif kitchen_id:
+                etag = kitchen_etag(kitchen_id)
+                cached = not_modified(etag)
+                if cached is not None:
+                    return cached
+                logs = ConsumptionLogService.get_consumption_logs_by_kitchen(
+                    kitchen_id, **page_args
+                )
+            else:
+                logs = ConsumptionLogService.get_consumption_logs_by_user(user_id, **page_args)
+        except ValueError as exc:
+            return error_payload("validation_error", str(exc), field="cursor"), 400
+
+        return log_page(logs, page_args["limit"]), 200, cache_headers(etag)
 
     @jwt_required()
     def post(self):
@@ -56,11 +121,11 @@ class ConsumptionLogListResource(Resource):
                 missing.append("item_id")
             if percent_used is None:
                 missing.append("percent_used")
-            return _error("missing_fields", "Missing required fields", fields=missing), 400
+            return error_payload("missing_fields", "Missing required fields", fields=missing), 400
 
         if not (0 <= percent_used <= 100):
             return (
-                _error(
+                error_payload(
                     "validation_error",
                     "percent_used must be between 0 and 100",
                     field="percent_used",
@@ -74,18 +139,169 @@ class ConsumptionLogListResource(Resource):
             percent_used=percent_used,
         )
         if not log:
-            return _error("not_found", "Item not found"), 404
+            return error_payload("not_found", "Item not found"), 404
 
         return {"log": log.to_dict()}, 201
 
 
+class ConsumptionLogBatchResource(Resource):
+    @jwt_required()
+    def post(self):
+        """Create many consumption logs in a single transaction."""
+        data = _get_json()
+        user_id = int(get_jwt_identity())
+        entries = data.get("entries")
+
+        if not isinstance(entries, list) or not entries:
+            return (
+                error_payload(
+                    "missing_fields", "entries must be a non-empty list", field="entries"
+                ),
+                400,
+            )
+
+        max_size = current_app.config["CONSUMPTION_BATCH_MAX_SIZE"]
+        if len(entries) > max_size:
+            return (
+                error_payload(
+                    "validation_error",
+                    f"A batch may contain at most {max_size} entries",
+                    field="entries",
+                ),
+                400,
+            )
+
+        valid = []
+        results: list[dict | None] = []
+        for entry in entries:
+            parsed, error = _validate_batch_entry(entry)
+            if error:
+                results.append({"status": "error", **error})
+            else:
+                valid.append(parsed)
+                results.append(None)
+
+        created = iter(
+            ConsumptionLogService.create_consumption_logs(user_id, valid) if valid else []
+        )
+        results = [result or next(created) for result in results]
+        for index, result in enumerate(results):
+            result["index"] = index
+
+        succeeded = sum(1 for result in results if result["status"] == "created")
+        return {
+            "results": results,
+            "created": succeeded,
+            "failed": len(results) - succeeded,
+        }, 200
+
+
+class ConsumptionLogExportResource(Resource):
+    @jwt_required()
+    def get(self):
+        """Stream a kitchen's consumption logs as NDJSON or CSV."""
+        kitchen_id = request.args.get("kitchen_id", type=int)
+        if not kitchen_id:
+            return error_payload("missing_parameter", "kitchen_id parameter is required"), 400
+
+        fmt = request.args.get("format", "ndjson")
+        if fmt not in EXPORT_FORMATS:
+            return (
+                error_payload(
+                    "validation_error", "format must be 'ndjson' or 'csv'", field="format"
+                ),
+                400,
+            )
+
+        bounds = {}
+        for param in ("from", "to"):
+            value = request.args.get(param)
+            if value:
+                try:
+                    bounds[param] = parse_datetime(value)
+                except ValueError:
+                    return (
+                        error_payload(
+                            "validation_error",
+                            f"{param} must be an ISO 8601 timestamp",
+                            field=param,
+                        ),
+                        400,
+                    )
+
+        rows = ConsumptionLogService.iter_consumption_logs_by_kitchen(
+            kitchen_id,
+            start=bounds.get("from"),
+            end=bounds.get("to"),
+        )
+        return stream_rows(
+            rows,
+            ["id", "user_id", "item_id", "percent_used", "created_at"],
+            fmt,
+            f"consumption_logs_kitchen_{kitchen_id}",
+        )
+
+
+class ConsumptionDailyResource(Resource):
+    @jwt_required()
+    def get(self):
+        """Get daily consumption totals for an item or a kitchen's items."""
+        item_id = request.args.get("item_id", type=int)
+        kitchen_id = request.args.get("kitchen_id", type=int)
+        if not item_id and not kitchen_id:
+            return (
+                error_payload("missing_parameter", "One of item_id or kitchen_id is required"),
+                400,
+            )
+
+        bounds = {}
+        for param in ("from", "to"):
+            value = request.args.get(param)
+            if value:
+                try:
+                    bounds[param] = date.fromisoformat(value)
+                except ValueError:
+                    return (
+                        error_payload(
+                            "validation_error",
+                            f"{param} must be an ISO 8601 date (YYYY-MM-DD)",
+                            field=param,
+                        ),
+                        400,
+                    )
+
+        end = bounds.get("to") or datetime.utcnow().date() + timedelta(days=1)
+        start = bounds.get("from") or end - timedelta(
+            days=current_app.config["CONSUMPTION_DAILY_DEFAULT_DAYS"]
+        )
+        max_days = current_app.config["CONSUMPTION_DAILY_MAX_DAYS"]
+        if not (0 < (end - start).days <= max_days):
+            return (
+                error_payload(
+                    "validation_error",
+                    f"to must be after from and at most {max_days} days later",
+                    field="to",
+                ),
+                400,
+            )
+
+        rows = ConsumptionRollupService.get_daily_usage(
+            start, end, item_id=item_id or None, kitchen_id=kitchen_id or None
+        )
+        return {
+            "from": start.isoformat(),
+            "to": end.isoformat(),
+            "days": [row.to_dict() for row in rows],
+        }, 200
+
+
 class ConsumptionLogResource(Resource):
     @jwt_required()
     def get(self, log_id: int):
         """Get a consumption log by ID."""
         log = ConsumptionLogService.get_consumption_log_by_id(log_id)
         if not log:
-            return _error("not_found", "Consumption log not found"), 404
+            return error_payload("not_found", "Consumption log not found"), 404
         return {"log": log.to_dict()}, 200
 
     @jwt_required()
@@ -93,5 +309,5 @@ class ConsumptionLogResource(Resource):
         """Delete a consumption log."""
         success = ConsumptionLogService.delete_consumption_log(log_id)
         if not success:
-            return _error("not_found", "Consumption log not found"), 404
+            return error_payload("not_found", "Consumption log not found"), 404
         return {"message": "Consumption log deleted successfully"}, 200
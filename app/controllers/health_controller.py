@@ -8,6 +8,7 @@ from flask import current_app
 from flask_restx import Namespace, Resource
 
 from app.extensions import db
+from app.services.lookup_cache import cache_stats
 
 health_ns = Namespace("health", description="Health check operations")
 
@@ -39,6 +40,8 @@ class HealthCheck(Resource):
             health_status["database_error"] = str(e)
             current_app.logger.error(f"Database health check failed: {e}")
 
+        health_status["caches"] = cache_stats()
+
         # Return 503 if service is degraded
         status_code = 200 if health_status["status"] == "healthy" else 503
 
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import hashlib
+from urllib.parse import urlencode
+
+from flask import Response, request
+from werkzeug.http import quote_etag
+
+from app.services.kitchen_version_service import KitchenVersionService
+
+
+def kitchen_etag(kitchen_id: int) -> str | None:
+    """Strong ETag for a kitchen-scoped listing, or None if the kitchen does not exist.
+
+    Built from the kitchen's change_version, which every write to its items
+    and logs bumps, plus the request path and query string so differently
+    filtered or paged responses get different tags. Costs one primary-key
+    lookup.
+    """
+    version = KitchenVersionService.get_version(kitchen_id)
+    if version is None:
+        return None
+    # urlencode escapes "&" and "=" inside values, so distinct queries stay distinct.
+    query = urlencode(sorted(request.args.items(multi=True)))
+    digest = hashlib.sha1(f"{request.path}?{query}".encode()).hexdigest()[:16]
+    return f"k{kitchen_id}-v{version}-{digest}"
+
+
+def cache_headers(etag: str | None) -> dict:
+    """Headers that let clients revalidate a listing with If-None-Match."""
+    if etag is None:
+        return {}
+    return {"ETag": quote_etag(etag), "Cache-Control": "private, no-cache"}
+
+
+def not_modified(etag: str | None) -> Response | None:
+    """Return a 304 response if the request's If-None-Match matches etag."""
+    if etag is None or not request.if_none_match.contains_weak(etag):
+        return None
+    return Response(status=304, headers=cache_headers(etag))
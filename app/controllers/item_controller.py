@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from flask import request
+from flask import current_app, request
 from flask_jwt_extended import jwt_required
 from flask_restx import Resource
 
+from app.controllers.http_cache import cache_headers, kitchen_etag, not_modified
 from app.models.item import ItemStatus
+from app.services.item_import_service import (
+    IMPORT_FORMATS,
+    ImportFileError,
+    ImportKitchenNotFound,
+    ItemImportService,
+)
 from app.services.item_service import ItemService
+from app.services.pagination import clamp_limit, split_page
 
 
 def _get_json() -> dict:
@@ -21,13 +29,77 @@ def _error(code: str, message: str, **kwargs) -> dict:
 class ItemListResource(Resource):
     @jwt_required()
     def get(self):
-        """Get all items for a kitchen."""
+        """Get one page of items for a kitchen."""
         kitchen_id = request.args.get("kitchen_id", type=int)
         if not kitchen_id:
             return _error("missing_parameter", "kitchen_id parameter is required"), 400
 
-        items = ItemService.get_items_by_kitchen(kitchen_id)
-        return {"items": [item.to_dict() for item in items]}, 200
+        limit = request.args.get("limit", type=int)
+        if limit is not None and limit < 1:
+            return (
+                _error("validation_error", "limit must be a positive integer", field="limit"),
+                400,
+            )
+        limit = clamp_limit(
+            limit,
+            default=current_app.config["DEFAULT_PAGE_SIZE"],
+            maximum=current_app.config["MAX_PAGE_SIZE"],
+        )
+
+        filters = {
+            "category": request.args.get("category"),
+            "name_prefix": request.args.get("name_prefix"),
+            "low_stock": request.args.get("low_stock", "false").lower() == "true",
+        }
+        if request.args.get("status"):
+            try:
+                filters["status"] = ItemStatus(request.args["status"])
+            except ValueError:
+                return (
+                    _error(
+                        "validation_error",
+                        "Invalid status. Must be 'needed' or 'in_stock'",
+                        field="status",
+                    ),
+                    400,
+                )
+
+        sort = request.args.get("sort", "id")
+        if sort.lstrip("-") not in ItemService.SORT_COLUMNS:
+            return (
+                _error(
+                    "validation_error",
+                    "sort must be one of: "
+                    + ", ".join(f"{key}, -{key}" for key in ItemService.SORT_COLUMNS),
+                    field="sort",
+                ),
+                400,
+            )
+
+        etag = kitchen_etag(kitchen_id)
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
+
+        try:
+            items = ItemService.get_items_by_kitchen(
+                kitchen_id,
+                limit=limit + 1,
+                cursor=request.args.get("cursor"),
+                sort=sort,
+                **filters,
+            )
+        except ValueError as exc:
+            return _error("validation_error", str(exc), field="cursor"), 400
+
+        items, has_more = split_page(items, limit)
+        payload = {
+            "items": [item.to_dict() for item in items],
+            "next_cursor": ItemService.cursor_for(items[-1], sort) if has_more else None,
+        }
+        if request.args.get("include_total", "false").lower() == "true":
+            payload["total"] = ItemService.count_items_by_kitchen(kitchen_id, **filters)
+        return payload, 200, cache_headers(etag)
 
     @jwt_required()
     def post(self):
@@ -64,6 +136,41 @@ class ItemListResource(Resource):
         return {"item": item.to_dict()}, 201
 
 
+class ItemChangesResource(Resource):
+    @jwt_required()
+    def get(self):
+        """Get a kitchen's item changes since a sync cursor."""
+        kitchen_id = request.args.get("kitchen_id", type=int)
+        if not kitchen_id:
+            return _error("missing_parameter", "kitchen_id parameter is required"), 400
+
+        limit = request.args.get("limit", type=int)
+        if limit is not None and limit < 1:
+            return (
+                _error("validation_error", "limit must be a positive integer", field="limit"),
+                400,
+            )
+        limit = clamp_limit(
+            limit,
+            default=current_app.config["DEFAULT_PAGE_SIZE"],
+            maximum=current_app.config["MAX_PAGE_SIZE"],
+        )
+
+        try:
+            changes = ItemService.get_item_changes(
+                kitchen_id, cursor=request.args.get("since"), limit=limit
+            )
+        except ValueError as exc:
+            return _error("validation_error", str(exc), field="since"), 400
+
+        return {
+            "items": [item.to_dict() for item in changes["items"]],
+            "deleted": [tombstone.to_dict() for tombstone in changes["deleted"]],
+            "has_more": changes["has_more"],
+            "next_cursor": changes["next_cursor"],
+        }, 200
+
+
 class ItemResource(Resource):
     @jwt_required()
     def get(self, item_id: int):
@@ -138,3 +245,43 @@ class ItemQuantityResource(Resource):
         if not item:
             return _error("not_found", "Item not found"), 404
         return {"item": item.to_dict()}, 200
+
+
+class ItemImportResource(Resource):
+    @jwt_required()
+    def post(self):
+        """Import items from an uploaded CSV or NDJSON file."""
+        kitchen_id = request.args.get("kitchen_id", type=int)
+        if not kitchen_id:
+            return _error("missing_parameter", "kitchen_id parameter is required"), 400
+
+        upload = request.files.get("file")
+        fmt = request.args.get("format")
+        if not fmt and upload and upload.filename:
+            fmt = upload.filename.rsplit(".", 1)[-1].lower()
+        if not fmt and request.mimetype == "text/csv":
+            fmt = "csv"
+        if fmt == "jsonl":
+            fmt = "ndjson"
+        if fmt not in IMPORT_FORMATS:
+            return (
+                _error(
+                    "validation_error",
+                    "format must be 'csv' or 'ndjson'",
+                    field="format",
+                ),
+                400,
+            )
+
+        try:
+            report = ItemImportService.import_items(
+                kitchen_id,
+                upload.stream if upload else request.stream,
+                fmt,
+                batch_size=current_app.config["ITEM_IMPORT_BATCH_SIZE"],
+            )
+        except ImportKitchenNotFound as exc:
+            return _error("not_found", str(exc)), 404
+        except ImportFileError as exc:
+            return _error("invalid_file", str(exc), imported=exc.imported), 400
+        return report, 200
@@ -1,35 +1,102 @@
 from __future__ import annotations
 
-from flask import request
+import json
+import queue
+
+from flask import Response, current_app, request
+from flask_jwt_extended import get_jwt_identity, jwt_required, verify_jwt_in_request
 from flask_restx import Resource
 
-from app.services.kitchen_service import KitchenService
+from app.controllers.http_cache import cache_headers, kitchen_etag, not_modified
+from app.controllers.log_pages import error_payload, parse_datetime, parse_log_page_args
+from app.services.activity_service import ActivityService
+from app.services.event_broker import format_sse
+from app.services.forecast_service import ForecastService
+from app.services.kitchen_event_service import KitchenEventService
+from app.services.kitchen_service import KitchenCodeUnavailable, KitchenService
+from app.services.kitchen_summary_service import KitchenSummaryService
+from app.services.pagination import clamp_limit, split_page
 
 
 def _get_json() -> dict:
     return request.get_json(silent=True) or {}
 
 
-def _error(code: str, message: str, **kwargs) -> dict:
-    payload = {"code": code, "message": message}
-    payload.update(kwargs)
-    return payload
-
-
 class KitchenListResource(Resource):
     def get(self):
-        """Get all kitchens."""
-        kitchens = KitchenService.get_all_kitchens()
-        return {"kitchens": [k.to_dict() for k in kitchens]}, 200
+        """Get one page of kitchens."""
+        limit = request.args.get("limit", type=int)
+        if limit is not None and limit < 1:
+            return (
+                error_payload(
+                    "validation_error", "limit must be a positive integer", field="limit"
+                ),
+                400,
+            )
+        limit = clamp_limit(
+            limit,
+            default=current_app.config["DEFAULT_PAGE_SIZE"],
+            maximum=current_app.config["MAX_PAGE_SIZE"],
+        )
+
+        sort = request.args.get("sort", "id")
+        if sort.lstrip("-") not in KitchenService.SORT_COLUMNS:
+            return (
+                error_payload(
+                    "validation_error",
+                    "sort must be one of: "
+                    + ", ".join(f"{key}, -{key}" for key in KitchenService.SORT_COLUMNS),
+                    field="sort",
+                ),
+                400,
+            )
+
+        filters = {"name_prefix": request.args.get("name_prefix")}
+        for field in ("created_from", "created_to"):
+            if request.args.get(field):
+                try:
+                    filters[field] = parse_datetime(request.args[field])
+                except ValueError:
+                    return (
+                        error_payload(
+                            "validation_error",
+                            f"{field} must be an ISO 8601 timestamp",
+                            field=field,
+                        ),
+                        400,
+                    )
+
+        try:
+            kitchens = KitchenService.get_all_kitchens(
+                limit=limit + 1,
+                cursor=request.args.get("cursor"),
+                sort=sort,
+                **filters,
+            )
+        except ValueError as exc:
+            return error_payload("validation_error", str(exc), field="cursor"), 400
+
+        kitchens, has_more = split_page(kitchens, limit)
+        return {
+            "kitchens": [k.to_dict() for k in kitchens],
+            "next_cursor": KitchenService.cursor_for(kitchens[-1], sort) if has_more else None,
+        }, 200
 
     def post(self):
         """Create a new kitchen."""
         data = _get_json()
         name = data.get("name")
         if not name:
-            return _error("missing_fields", "Missing required field", field="name"), 400
+            return error_payload("missing_fields", "Missing required field", field="name"), 400
 
-        kitchen = KitchenService.create_kitchen(name=name)
+        try:
+            kitchen = KitchenService.create_kitchen(name=name)
+        except KitchenCodeUnavailable:
+            return (
+                error_payload("code_unavailable", "No kitchen code available, retry shortly"),
+                503,
+                {"Retry-After": "1"},
+            )
         return {"kitchen": kitchen.to_dict()}, 201
 
 
@@ -38,7 +105,7 @@ class KitchenResource(Resource):
         """Get a kitchen by ID."""
         kitchen = KitchenService.get_kitchen_by_id(kitchen_id)
         if not kitchen:
-            return _error("not_found", "Kitchen not found"), 404
+            return error_payload("not_found", "Kitchen not found"), 404
         return {"kitchen": kitchen.to_dict()}, 200
 
     def put(self, kitchen_id: int):
@@ -46,25 +113,160 @@ class KitchenResource(Resource):
         data = _get_json()
         name = data.get("name")
         if not name:
-            return _error("missing_fields", "Missing required field", field="name"), 400
+            return error_payload("missing_fields", "Missing required field", field="name"), 400
 
         kitchen = KitchenService.update_kitchen(kitchen_id, name)
         if not kitchen:
-            return _error("not_found", "Kitchen not found"), 404
+            return error_payload("not_found", "Kitchen not found"), 404
         return {"kitchen": kitchen.to_dict()}, 200
 
     def delete(self, kitchen_id: int):
         """Delete a kitchen."""
         success = KitchenService.delete_kitchen(kitchen_id)
         if not success:
-            return _error("not_found", "Kitchen not found"), 404
+            return error_payload("not_found", "Kitchen not found"), 404
         return {"message": "Kitchen deleted successfully"}, 200
 
 
 class KitchenByCodeResource(Resource):
     def get(self, code: str):
         """Get a kitchen by its unique code."""
-        kitchen = KitchenService.get_kitchen_by_code(code)
+        kitchen = KitchenService.get_cached_kitchen_by_code(code)
         if not kitchen:
-            return _error("not_found", "Kitchen not found"), 404
-        return {"kitchen": kitchen.to_dict()}, 200
+            return error_payload("not_found", "Kitchen not found"), 404
+        return {"kitchen": kitchen}, 200
+
+
+class KitchenSummaryResource(Resource):
+    @jwt_required()
+    def get(self, kitchen_id: int):
+        """Get a kitchen's dashboard summary."""
+        if not KitchenService.get_kitchen_by_id(kitchen_id):
+            return error_payload("not_found", "Kitchen not found"), 404
+        return {"summary": KitchenSummaryService.get_summary(kitchen_id)}, 200
+
+
+class KitchenForecastResource(Resource):
+    @jwt_required()
+    def get(self, kitchen_id: int):
+        """Get projected low-stock dates for a kitchen's items."""
+        if not KitchenService.get_kitchen_by_id(kitchen_id):
+            return error_payload("not_found", "Kitchen not found"), 404
+        config = current_app.config
+        forecast = ForecastService.forecast_kitchen(
+            kitchen_id,
+            history_days=config["FORECAST_HISTORY_DAYS"],
+            half_life_days=config["FORECAST_HALF_LIFE_DAYS"],
+            min_span_days=config["FORECAST_MIN_SPAN_DAYS"],
+        )
+        return {"forecast": forecast}, 200
+
+
+class KitchenActivityResource(Resource):
+    @jwt_required()
+    def get(self, kitchen_id: int):
+        """Get one page of a kitchen's restocks and consumption, newest first."""
+        page_args, error = parse_log_page_args()
+        if error:
+            return error, 400
+
+        etag = kitchen_etag(kitchen_id)
+        if etag is None:
+            return error_payload("not_found", "Kitchen not found"), 404
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
+
+        try:
+            activity = ActivityService.get_activity(kitchen_id, **page_args)
+        except ValueError as exc:
+            return error_payload("validation_error", str(exc), field="cursor"), 400
+
+        activity, has_more = split_page(activity, page_args["limit"] - 1)
+        return (
+            {
+                "activity": activity,
+                "next_cursor": ActivityService.cursor_for(activity[-1]) if has_more else None,
+            },
+            200,
+            cache_headers(etag),
+        )
+
+
+class KitchenEventTicketResource(Resource):
+    @jwt_required()
+    def post(self, kitchen_id: int):
+        """Issue a short-lived ticket for opening the kitchen's event stream."""
+        if not KitchenService.get_kitchen_by_id(kitchen_id):
+            return error_payload("not_found", "Kitchen not found"), 404
+        ticket = KitchenEventService.create_stream_ticket(int(get_jwt_identity()), kitchen_id)
+        return {"ticket": ticket, "expires_in": current_app.config["EVENT_TICKET_SECONDS"]}, 201
+
+
+class KitchenEventsResource(Resource):
+    def get(self, kitchen_id: int):
+        """Stream a kitchen's changes as Server-Sent Events."""
+        ticket = request.args.get("ticket")
+        if ticket is None:
+            verify_jwt_in_request()
+        elif KitchenEventService.verify_stream_ticket(ticket, kitchen_id) is None:
+            return error_payload("invalid_ticket", "Stream ticket is invalid or expired"), 401
+        if not KitchenService.get_kitchen_by_id(kitchen_id):
+            return error_payload("not_found", "Kitchen not found"), 404
+
+        last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+        if last_event_id is not None and not last_event_id.isdigit():
+            return (
+                error_payload(
+                    "validation_error",
+                    "Last-Event-ID must be an event id",
+                    field="last_event_id",
+                ),
+                400,
+            )
+
+        broker = current_app.extensions["event_broker"]
+        heartbeat = current_app.config["EVENT_HEARTBEAT_SECONDS"]
+        replay_limit = current_app.config["EVENT_REPLAY_LIMIT"]
+
+        # Subscribe before reading the backlog so nothing committed in between
+        # is missed; the overlap is dropped by event id below.
+        subscription = broker.subscribe(kitchen_id)
+        last_id = 0
+        backlog = []
+        if last_event_id is not None:
+            last_id = int(last_event_id)
+            events = KitchenEventService.get_events_since(kitchen_id, last_id, replay_limit + 1)
+            if len(events) > replay_limit:
+                # Too far behind to replay: tell the client to resync with
+                # GET /items/changes and resume from the newest event.
+                last_id = KitchenEventService.get_last_event_id(kitchen_id)
+                backlog.append(f"id: {last_id}\nevent: resync\ndata: {json.dumps({})}\n\n")
+            else:
+                backlog.extend(format_sse(event) for event in events)
+                if events:
+                    last_id = events[-1].id
+
+        def stream(last_id: int):
+            try:
+                yield "retry: 3000\n\n"
+                yield from backlog
+                while True:
+                    if subscription.closed and subscription.queue.empty():
+                        return
+                    try:
+                        event_id, message = subscription.queue.get(timeout=heartbeat)
+                    except queue.Empty:
+                        yield ": keep-alive\n\n"
+                        continue
+                    if event_id > last_id:
+                        last_id = event_id
+                        yield message
+            finally:
+                broker.unsubscribe(subscription)
+
+        return Response(
+            stream(last_id),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
@@ -0,0 +1,70 @@
+"""
+Query parameters and response shape shared by the consumption and restock log
+listings, and the error payload and timestamp parsing used by the log and
+kitchen controllers.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from flask import current_app, request
+
+from app.services.pagination import clamp_limit, created_at_cursor, split_page
+
+
+def error_payload(code: str, message: str, **kwargs) -> dict:
+    payload = {"code": code, "message": message}
+    payload.update(kwargs)
+    return payload
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp into a naive UTC datetime."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
+
+
+def parse_log_page_args() -> tuple[dict | None, dict | None]:
+    """Read ``from``, ``to``, ``cursor`` and ``limit`` from the query string.
+
+    Returns (keyword arguments for the services' ``get_*_logs_by_*``
+    methods, None), asking for one row more than the page so the caller can
+    tell whether another page follows, or (None, error payload).
+    """
+    limit = request.args.get("limit", type=int)
+    if limit is not None and limit < 1:
+        return None, error_payload(
+            "validation_error", "limit must be a positive integer", field="limit"
+        )
+
+    args = {
+        "cursor": request.args.get("cursor") or None,
+        "limit": clamp_limit(
+            limit,
+            default=current_app.config["DEFAULT_PAGE_SIZE"],
+            maximum=current_app.config["MAX_PAGE_SIZE"],
+        )
+        + 1,
+    }
+    for param, key in (("from", "start"), ("to", "end")):
+        value = request.args.get(param)
+        if value:
+            try:
+                args[key] = parse_datetime(value)
+            except ValueError:
+                return None, error_payload(
+                    "validation_error", f"{param} must be an ISO 8601 timestamp", field=param
+                )
+    return args, None
+
+
+def log_page(logs: list, limit: int) -> dict:
+    """Response body for a ``limit + 1`` result of parse_log_page_args."""
+    logs, has_more = split_page(logs, limit - 1)
+    return {
+        "logs": [log.to_dict() for log in logs],
+        "next_cursor": created_at_cursor(logs[-1]) if has_more else None,
+    }
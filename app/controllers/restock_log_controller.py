@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from flask import request
+from flask import current_app, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
 from flask_restx import Resource
 
+from app.controllers.http_cache import cache_headers, kitchen_etag, not_modified
+from app.controllers.log_pages import error_payload, log_page, parse_datetime, parse_log_page_args
+from app.controllers.streaming import EXPORT_FORMATS, stream_rows
+from app.services.restock_interval_service import RestockIntervalService
 from app.services.restock_log_service import RestockLogService
 
 
@@ -11,36 +15,43 @@ def _get_json() -> dict:
     return request.get_json(silent=True) or {}
 
 
-def _error(code: str, message: str, **kwargs) -> dict:
-    payload = {"code": code, "message": message}
-    payload.update(kwargs)
-    return payload
-
-
 class RestockLogListResource(Resource):
     @jwt_required()
     def get(self):
-        """Get restock logs filtered by item_id, kitchen_id, or user_id."""
+        """Get one page of restock logs for an item, kitchen or user, newest first."""
         item_id = request.args.get("item_id", type=int)
         kitchen_id = request.args.get("kitchen_id", type=int)
         user_id = request.args.get("user_id", type=int)
 
-        if item_id:
-            logs = RestockLogService.get_restock_logs_by_item(item_id)
-        elif kitchen_id:
-            logs = RestockLogService.get_restock_logs_by_kitchen(kitchen_id)
-        elif user_id:
-            logs = RestockLogService.get_restock_logs_by_user(user_id)
-        else:
+        if not (item_id or kitchen_id or user_id):
             return (
-                _error(
+                error_payload(
                     "missing_parameter",
                     "One of item_id, kitchen_id, or user_id is required",
                 ),
                 400,
             )
 
-        return {"logs": [log.to_dict() for log in logs]}, 200
+        page_args, error = parse_log_page_args()
+        if error:
+            return error, 400
+
+        etag = None
+        try:
+            if item_id:
+                logs = RestockLogService.get_restock_logs_by_item(item_id, **page_args)
+            elif kitchen_id:
+                etag = kitchen_etag(kitchen_id)
+                cached = not_modified(etag)
+                if cached is not None:
+                    return cached
+                logs = RestockLogService.get_restock_logs_by_kitchen(kitchen_id, **page_args)
+            else:
+                logs = RestockLogService.get_restock_logs_by_user(user_id, **page_args)
+        except ValueError as exc:
+            return error_payload("validation_error", str(exc), field="cursor"), 400
+
+        return log_page(logs, page_args["limit"]), 200, cache_headers(etag)
 
     @jwt_required()
     def post(self):
@@ -50,22 +61,144 @@ class RestockLogListResource(Resource):
         item_id = data.get("item_id")
 
         if not item_id:
-            return _error("missing_fields", "item_id is required"), 400
+            return error_payload("missing_fields", "item_id is required"), 400
 
         log = RestockLogService.create_restock_log(user_id=user_id, item_id=item_id)
         if not log:
-            return _error("not_found", "Item not found"), 404
+            return error_payload("not_found", "Item not found"), 404
 
         return {"log": log.to_dict()}, 201
 
 
+class RestockLogBulkResource(Resource):
+    @jwt_required()
+    def post(self):
+        """Restock a list of items, or a filtered set of a kitchen's items."""
+        data = _get_json()
+        user_id = int(get_jwt_identity())
+        item_ids = data.get("item_ids")
+        kitchen_id = data.get("kitchen_id")
+        item_filter = data.get("filter", "needed")
+
+        if item_ids is None and not kitchen_id:
+            return (
+                error_payload(
+                    "missing_fields",
+                    "Either item_ids or kitchen_id is required",
+                    fields=["item_ids", "kitchen_id"],
+                ),
+                400,
+            )
+
+        if item_ids is not None:
+            if (
+                not isinstance(item_ids, list)
+                or not item_ids
+                or not all(isinstance(item_id, int) for item_id in item_ids)
+            ):
+                return (
+                    error_payload(
+                        "validation_error",
+                        "item_ids must be a non-empty list of integers",
+                        field="item_ids",
+                    ),
+                    400,
+                )
+            max_items = current_app.config["RESTOCK_BULK_MAX_ITEMS"]
+            if len(item_ids) > max_items:
+                return (
+                    error_payload(
+                        "validation_error",
+                        f"At most {max_items} item_ids may be restocked at once",
+                        field="item_ids",
+                    ),
+                    400,
+                )
+        elif item_filter not in RestockLogService.BULK_FILTERS:
+            return (
+                error_payload(
+                    "validation_error",
+                    "filter must be one of: " + ", ".join(RestockLogService.BULK_FILTERS),
+                    field="filter",
+                ),
+                400,
+            )
+
+        restocked = RestockLogService.bulk_restock(
+            user_id=user_id,
+            item_ids=item_ids,
+            kitchen_id=kitchen_id,
+            item_filter=item_filter,
+        )
+        payload = {"restocked_item_ids": restocked, "count": len(restocked)}
+        if item_ids is not None:
+            payload["not_found_item_ids"] = sorted(set(item_ids) - set(restocked))
+        return payload, 200
+
+
+class RestockLogExportResource(Resource):
+    @jwt_required()
+    def get(self):
+        """Stream a kitchen's restock logs as NDJSON or CSV."""
+        kitchen_id = request.args.get("kitchen_id", type=int)
+        if not kitchen_id:
+            return error_payload("missing_parameter", "kitchen_id parameter is required"), 400
+
+        fmt = request.args.get("format", "ndjson")
+        if fmt not in EXPORT_FORMATS:
+            return (
+                error_payload(
+                    "validation_error", "format must be 'ndjson' or 'csv'", field="format"
+                ),
+                400,
+            )
+
+        bounds = {}
+        for param in ("from", "to"):
+            value = request.args.get(param)
+            if value:
+                try:
+                    bounds[param] = parse_datetime(value)
+                except ValueError:
+                    return (
+                        error_payload(
+                            "validation_error",
+                            f"{param} must be an ISO 8601 timestamp",
+                            field=param,
+                        ),
+                        400,
+                    )
+
+        rows = RestockLogService.iter_restock_logs_by_kitchen(
+            kitchen_id,
+            start=bounds.get("from"),
+            end=bounds.get("to"),
+        )
+        return stream_rows(
+            rows,
+            ["id", "user_id", "item_id", "created_at"],
+            fmt,
+            f"restock_logs_kitchen_{kitchen_id}",
+        )
+
+
+class RestockIntervalResource(Resource):
+    @jwt_required()
+    def get(self):
+        """Get per-item restock interval statistics for a kitchen."""
+        kitchen_id = request.args.get("kitchen_id", type=int)
+        if not kitchen_id:
+            return error_payload("missing_parameter", "kitchen_id parameter is required"), 400
+        return {"items": RestockIntervalService.get_intervals(kitchen_id)}, 200
+
+
 class RestockLogResource(Resource):
     @jwt_required()
     def get(self, log_id: int):
         """Get a restock log by ID."""
         log = RestockLogService.get_restock_log_by_id(log_id)
         if not log:
-            return _error("not_found", "Restock log not found"), 404
+            return error_payload("not_found", "Restock log not found"), 404
         return {"log": log.to_dict()}, 200
 
     @jwt_required()
@@ -73,5 +206,5 @@ class RestockLogResource(Resource):
         """Delete a restock log."""
         success = RestockLogService.delete_restock_log(log_id)
         if not success:
-            return _error("not_found", "Restock log not found"), 404
+            return error_payload("not_found", "Restock log not found"), 404
         return {"message": "Restock log deleted successfully"}, 200
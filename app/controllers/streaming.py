@@ -0,0 +1,58 @@
+"""
+Helpers for streaming large result sets as NDJSON or CSV responses.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+
+from flask import Response, stream_with_context
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# Rows are buffered into chunks of roughly this many bytes before being sent.
+CHUNK_SIZE = 64 * 1024
+
+
+def _ndjson_chunks(rows: Iterable[dict]) -> Iterator[str]:
+    buffer: list[str] = []
+    size = 0
+    for row in rows:
+        line = json.dumps(row, separators=(",", ":")) + "\n"
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def _csv_chunks(rows: Iterable[dict], fieldnames: list[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def stream_rows(rows: Iterable[dict], fieldnames: list[str], fmt: str, filename: str) -> Response:
+    """Build a streaming download response that serializes rows as they are produced."""
+    chunks = _csv_chunks(rows, fieldnames) if fmt == "csv" else _ndjson_chunks(rows)
+    return Response(
+        stream_with_context(chunks),
+        mimetype=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
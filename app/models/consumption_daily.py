@@ -0,0 +1,28 @@
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.extensions import db
+
+
+class ConsumptionDaily(db.Model):
+    """Per-item, per-day (UTC) totals of ``consumption_logs``, kept in step with the log."""
+
+    __tablename__ = "consumption_daily"
+
+    item_id: Mapped[int] = mapped_column(ForeignKey("items.id"), primary_key=True)
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    percent_used: Mapped[float] = mapped_column(nullable=False, default=0.0)
+
+    events: Mapped[int] = mapped_column(nullable=False, default=0)
+
+    def to_dict(self) -> dict:
+        return {
+            "item_id": self.item_id,
+            "day": self.day.isoformat(),
+            "percent_used": round(self.percent_used, 4),
+            "events": self.events,
+        }
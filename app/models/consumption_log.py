@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy import DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.extensions import db
@@ -8,6 +8,11 @@ from app.extensions import db
 
 class ConsumptionLog(db.Model):
     __tablename__ = "consumption_logs"
+    __table_args__ = (
+        Index("ix_consumption_logs_item_id_created_at", "item_id", "created_at"),
+        Index("ix_consumption_logs_user_id_created_at", "user_id", "created_at"),
+        Index("ix_consumption_logs_created_at", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
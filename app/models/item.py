@@ -1,6 +1,7 @@
 import enum
+from datetime import datetime
 
-from sqlalchemy import Enum, ForeignKey, String
+from sqlalchemy import BigInteger, DateTime, Enum, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.extensions import db
@@ -13,6 +14,14 @@ class ItemStatus(enum.Enum):
 
 class Item(db.Model):
     __tablename__ = "items"
+    __table_args__ = (
+        Index("ix_items_kitchen_id_id", "kitchen_id", "id"),
+        Index("ix_items_kitchen_id_status", "kitchen_id", "status"),
+        Index("ix_items_kitchen_id_category", "kitchen_id", "category"),
+        Index("ix_items_kitchen_id_name", "kitchen_id", "name"),
+        Index("ix_items_kitchen_id_quantity_percent", "kitchen_id", "quantity_percent"),
+        Index("ix_items_kitchen_id_version", "kitchen_id", "version"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -28,6 +37,13 @@ class Item(db.Model):
 
     kitchen_id: Mapped[int] = mapped_column(ForeignKey("kitchens.id"), nullable=False)
 
+    # Kitchen change_version at the item's last change; drives delta sync.
+    version: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=True
+    )
+
     kitchen = relationship("Kitchen", back_populates="items")
     restocks = relationship("RestockLog", back_populates="item")
     consumptions = relationship("ConsumptionLog", back_populates="item")
@@ -41,4 +57,6 @@ class Item(db.Model):
             "low_stock_threshold": self.low_stock_threshold,
             "status": self.status.value if self.status else None,
             "kitchen_id": self.kitchen_id,
+            "version": self.version,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.extensions import db
+
+
+class ItemTombstone(db.Model):
+    """Record of a deleted item, kept so delta-sync clients can drop it."""
+
+    __tablename__ = "item_tombstones"
+    __table_args__ = (Index("ix_item_tombstones_kitchen_id_version", "kitchen_id", "version"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    item_id: Mapped[int] = mapped_column(nullable=False)
+
+    kitchen_id: Mapped[int] = mapped_column(ForeignKey("kitchens.id"), nullable=False)
+
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    deleted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.item_id,
+            "version": self.version,
+            "deleted_at": self.deleted_at.isoformat() if self.deleted_at else None,
+        }
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import BigInteger, DateTime, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.extensions import db
@@ -15,9 +15,14 @@ class Kitchen(db.Model):
         String(6), unique=True, nullable=False, index=True
     )  # Unique 6-digit room code
 
-    name: Mapped[str] = mapped_column(String(120), nullable=False)
+    # Indexed for the name-prefix filter and name/created_at keyset pages of
+    # GET /kitchens; secondary indexes carry the primary key as the tiebreaker.
+    name: Mapped[str] = mapped_column(String(120), nullable=False, index=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+
+    # Bumped by every change to the kitchen's items; see KitchenVersionService.
+    change_version: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
 
     users = relationship("User", back_populates="kitchen")
     items = relationship("Item", back_populates="kitchen")
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, BigInteger, DateTime, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.extensions import db
+
+
+class KitchenEvent(db.Model):
+    """Outbox row for a change to a kitchen, streamed to live clients."""
+
+    __tablename__ = "kitchen_events"
+    __table_args__ = (Index("ix_kitchen_events_kitchen_id_id", "kitchen_id", "id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    kitchen_id: Mapped[int] = mapped_column(ForeignKey("kitchens.id"), nullable=False)
+
+    type: Mapped[str] = mapped_column(String(32), nullable=False)
+
+    # Kitchen change_version the event was recorded under.
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "kitchen_id": self.kitchen_id,
+            "type": self.type,
+            "version": self.version,
+            "data": self.payload,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
@@ -0,0 +1,52 @@
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Index, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.extensions import db
+
+
+class LogArchive(db.Model):
+    """One archive file of a log table: the rows of one UTC day, moved out of the hot table.
+
+    Written before the rows are deleted, so an interrupted run knows which
+    rows (``first_id``..``last_id`` on ``day``) are safe to finish deleting.
+    """
+
+    __tablename__ = "log_archives"
+    __table_args__ = (
+        UniqueConstraint("table_name", "day", "first_id"),
+        Index("ix_log_archives_table_name_day", "table_name", "day"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    table_name: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+
+    path: Mapped[str] = mapped_column(String(512), nullable=False)
+
+    first_id: Mapped[int] = mapped_column(nullable=False)
+
+    last_id: Mapped[int] = mapped_column(nullable=False)
+
+    row_count: Mapped[int] = mapped_column(nullable=False)
+
+    # Sum of percent_used for consumption_logs; None for restock_logs.
+    percent_used: Mapped[float | None] = mapped_column(nullable=True)
+
+    archived_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Set once every archived row is gone from the hot table.
+    deleted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    def to_dict(self) -> dict:
+        return {
+            "table": self.table_name,
+            "day": self.day.isoformat(),
+            "path": self.path,
+            "rows": self.row_count,
+            "percent_used": self.percent_used,
+            "complete": self.deleted_at is not None,
+        }
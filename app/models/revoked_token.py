@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.extensions import db
+
+
+class RevokedToken(db.Model):
+    """A revoked JWT (by ``jti``) or every token a user was issued before ``revoked_at``."""
+
+    __tablename__ = "revoked_tokens"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    jti: Mapped[str | None] = mapped_column(String(64), unique=True, nullable=True)
+
+    # No foreign key: a revocation has to outlive the user it applies to.
+    user_id: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
+
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False, index=True
+    )
+
+    # After this the revoked token(s) would have expired anyway and the row can go.
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
@@ -1,12 +1,30 @@
-from sqlalchemy import Boolean, ForeignKey, String
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+from sqlalchemy import Boolean, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from werkzeug.security import check_password_hash, generate_password_hash
 
 from app.extensions import db
 
 
+@dataclass(frozen=True, slots=True)
+class UserProfile:
+    """Public view of a user, detached from the session."""
+
+    id: int
+    display_name: str
+    kitchen_id: int
+    kitchen_code: str | None
+    is_active: bool
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
 class User(db.Model):
     __tablename__ = "users"
+    __table_args__ = (Index("ix_users_kitchen_id_display_name", "kitchen_id", "display_name"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -22,17 +40,21 @@ class User(db.Model):
     restocks = relationship("RestockLog", back_populates="user")
     consumptions = relationship("ConsumptionLog", back_populates="user")
 
-    def set_password(self, password: str):
-        self.password_hash = generate_password_hash(password)
-
-    def check_password(self, password: str) -> bool:
-        return check_password_hash(self.password_hash, password)
+    def to_profile(self, kitchen_code: str | None = None) -> UserProfile:
+        """Build the read model; pass kitchen_code when the caller already knows it.
+
+        Without it the kitchen relationship is read, which costs a query unless
+        the user was loaded with ``joinedload(User.kitchen)``.
+        """
+        if kitchen_code is None and self.kitchen is not None:
+            kitchen_code = self.kitchen.code
+        return UserProfile(
+            id=self.id,
+            display_name=self.display_name,
+            kitchen_id=self.kitchen_id,
+            kitchen_code=kitchen_code,
+            is_active=self.is_active,
+        )
 
     def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "display_name": self.display_name,
-            "kitchen_id": self.kitchen_id,
-            "kitchen_code": self.kitchen.code if self.kitchen else None,
-            "is_active": self.is_active,
-        }
+        return self.to_profile().to_dict()
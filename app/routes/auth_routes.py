@@ -4,6 +4,7 @@ from flask_restx import Namespace, fields
 
 from app.controllers.auth_controller import (
     LoginResource,
+    LogoutResource,
     MeResource,
     RefreshResource,
     RegisterResource,
@@ -94,6 +95,22 @@ login_response_model = auth_ns.clone(
     register_response_model,
 )
 
+logout_model = auth_ns.model(
+    "LogoutRequest",
+    {
+        "refresh_token": fields.String(
+            description="Refresh token to revoke along with the token in the Authorization header"
+        ),
+    },
+)
+
+message_model = auth_ns.model(
+    "MessageResponse",
+    {
+        "message": fields.String(description="Result message"),
+    },
+)
+
 me_response_model = auth_ns.model(
     "MeResponse",
     {
@@ -151,6 +168,17 @@ class RefreshRoute(RefreshResource):
         return super().post()
 
 
+@auth_ns.route("/logout")
+class LogoutRoute(LogoutResource):
+    @auth_ns.expect(auth_header, logout_model)
+    @auth_ns.response(200, "Tokens revoked", message_model)
+    @auth_ns.response(400, "Validation error", error_model)
+    @auth_ns.response(401, "Missing, invalid or revoked token", error_model)
+    def post(self):
+        """Revoke the current access (or refresh) token, and optionally a refresh token."""
+        return super().post()
+
+
 @auth_ns.route("/me")
 class MeRoute(MeResource):
     @auth_ns.expect(auth_header)
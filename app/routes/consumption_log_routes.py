@@ -3,6 +3,9 @@ from __future__ import annotations
 from flask_restx import Namespace, fields
 
 from app.controllers.consumption_log_controller import (
+    ConsumptionDailyResource,
+    ConsumptionLogBatchResource,
+    ConsumptionLogExportResource,
     ConsumptionLogListResource,
     ConsumptionLogResource,
 )
@@ -32,10 +35,73 @@ create_consumption_log_model = consumption_ns.model(
     },
 )
 
+batch_entry_model = consumption_ns.model(
+    "ConsumptionBatchEntry",
+    {
+        "item_id": fields.Integer(required=True, description="Item that was consumed"),
+        "percent_used": fields.Float(required=True, description="Percentage consumed (0-100)"),
+        "occurred_at": fields.String(description="When the usage happened (ISO 8601)"),
+    },
+)
+
+batch_request_model = consumption_ns.model(
+    "ConsumptionBatchRequest",
+    {
+        "entries": fields.List(
+            fields.Nested(batch_entry_model),
+            required=True,
+            description="Usage events to record (at most CONSUMPTION_BATCH_MAX_SIZE)",
+        ),
+    },
+)
+
+batch_result_model = consumption_ns.model(
+    "ConsumptionBatchResult",
+    {
+        "index": fields.Integer(description="Position of the entry in the request"),
+        "status": fields.String(description="created or error"),
+        "id": fields.Integer(description="Created log ID (when the database reports it)"),
+        "code": fields.String(description="Error code for failed entries"),
+        "message": fields.String(description="Error message for failed entries"),
+    },
+)
+
+batch_response_model = consumption_ns.model(
+    "ConsumptionBatchResponse",
+    {
+        "results": fields.List(fields.Nested(batch_result_model)),
+        "created": fields.Integer(description="Number of logs created"),
+        "failed": fields.Integer(description="Number of entries rejected"),
+    },
+)
+
 consumption_log_list_response = consumption_ns.model(
     "ConsumptionLogListResponse",
     {
         "logs": fields.List(fields.Nested(consumption_log_model)),
+        "next_cursor": fields.String(description="Cursor for the next page (null on last page)"),
+    },
+)
+
+consumption_daily_model = consumption_ns.model(
+    "ConsumptionDaily",
+    {
+        "item_id": fields.Integer(description="Item ID"),
+        "day": fields.String(description="UTC day (YYYY-MM-DD)"),
+        "percent_used": fields.Float(description="Total percentage consumed that day"),
+        "events": fields.Integer(description="Number of consumption logs that day"),
+    },
+)
+
+consumption_daily_response = consumption_ns.model(
+    "ConsumptionDailyResponse",
+    {
+        "from": fields.String(description="First day included (YYYY-MM-DD)"),
+        "to": fields.String(description="Day after the last day included (YYYY-MM-DD)"),
+        "days": fields.List(
+            fields.Nested(consumption_daily_model),
+            description="One row per item and day with usage, ordered by item then day",
+        ),
     },
 )
 
@@ -71,8 +137,12 @@ class ConsumptionLogListRoute(ConsumptionLogListResource):
     @consumption_ns.param("item_id", "Filter by item ID", type=int)
     @consumption_ns.param("kitchen_id", "Filter by kitchen ID", type=int)
     @consumption_ns.param("user_id", "Filter by user ID", type=int)
+    @consumption_ns.param("from", "Only logs created at or after this ISO 8601 timestamp")
+    @consumption_ns.param("to", "Only logs created before this ISO 8601 timestamp")
+    @consumption_ns.param("limit", "Page size (default 100, max 500)", type=int)
+    @consumption_ns.param("cursor", "Opaque cursor from a previous page's next_cursor")
     @consumption_ns.response(200, "Success", consumption_log_list_response)
-    @consumption_ns.response(400, "Missing filter parameter", error_model)
+    @consumption_ns.response(400, "Missing filter parameter, invalid range or cursor", error_model)
     @consumption_ns.response(401, "Unauthorized", error_model)
     def get(self):
         """Get consumption logs (requires one of: item_id, kitchen_id, or user_id)."""
@@ -88,6 +158,48 @@ class ConsumptionLogListRoute(ConsumptionLogListResource):
         return super().post()
 
 
+@consumption_ns.route("/batch")
+class ConsumptionLogBatchRoute(ConsumptionLogBatchResource):
+    @consumption_ns.expect(auth_header, batch_request_model)
+    @consumption_ns.response(200, "Batch processed", batch_response_model)
+    @consumption_ns.response(400, "Validation error", error_model)
+    @consumption_ns.response(401, "Unauthorized", error_model)
+    def post(self):
+        """Record many consumption logs in one transaction (per-entry results)."""
+        return super().post()
+
+
+@consumption_ns.route("/export")
+class ConsumptionLogExportRoute(ConsumptionLogExportResource):
+    @consumption_ns.expect(auth_header)
+    @consumption_ns.param("kitchen_id", "Kitchen ID", type=int, required=True)
+    @consumption_ns.param("format", "ndjson (default) or csv")
+    @consumption_ns.param("from", "Only logs created at or after this ISO 8601 timestamp")
+    @consumption_ns.param("to", "Only logs created before this ISO 8601 timestamp")
+    @consumption_ns.produces(["application/x-ndjson", "text/csv"])
+    @consumption_ns.response(200, "Streamed export")
+    @consumption_ns.response(400, "Validation error", error_model)
+    @consumption_ns.response(401, "Unauthorized", error_model)
+    def get(self):
+        """Stream a kitchen's consumption logs in chronological order."""
+        return super().get()
+
+
+@consumption_ns.route("/daily")
+class ConsumptionDailyRoute(ConsumptionDailyResource):
+    @consumption_ns.expect(auth_header)
+    @consumption_ns.param("item_id", "Item ID", type=int)
+    @consumption_ns.param("kitchen_id", "Kitchen ID (all of its items)", type=int)
+    @consumption_ns.param("from", "First day, inclusive (YYYY-MM-DD; default: 90 days before to)")
+    @consumption_ns.param("to", "Last day, exclusive (YYYY-MM-DD; default: tomorrow, UTC)")
+    @consumption_ns.response(200, "Success", consumption_daily_response)
+    @consumption_ns.response(400, "Validation error", error_model)
+    @consumption_ns.response(401, "Unauthorized", error_model)
+    def get(self):
+        """Get daily consumption totals from the rollup (requires item_id or kitchen_id)."""
+        return super().get()
+
+
 @consumption_ns.route("/<int:log_id>")
 class ConsumptionLogRoute(ConsumptionLogResource):
     @consumption_ns.expect(auth_header)
@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from flask_restx import Namespace, fields
 
-from app.controllers.item_controller import ItemListResource, ItemQuantityResource, ItemResource
+from app.controllers.item_controller import (
+    ItemChangesResource,
+    ItemImportResource,
+    ItemListResource,
+    ItemQuantityResource,
+    ItemResource,
+)
 
 item_ns = Namespace(
     "items",
@@ -20,6 +26,8 @@ item_model = item_ns.model(
         "low_stock_threshold": fields.Float(description="Low stock threshold percentage"),
         "status": fields.String(description="Item status (needed, in_stock)"),
         "kitchen_id": fields.Integer(description="Kitchen ID"),
+        "version": fields.Integer(description="Kitchen change version of the last change"),
+        "updated_at": fields.String(description="Last change timestamp (ISO 8601)"),
     },
 )
 
@@ -61,9 +69,57 @@ item_list_response = item_ns.model(
     "ItemListResponse",
     {
         "items": fields.List(fields.Nested(item_model)),
+        "next_cursor": fields.String(description="Cursor for the next page (null on last page)"),
+        "total": fields.Integer(description="Total matching items (with include_total)"),
+    },
+)
+
+deleted_item_model = item_ns.model(
+    "DeletedItem",
+    {
+        "id": fields.Integer(description="ID of the deleted item"),
+        "version": fields.Integer(description="Kitchen change version of the delete"),
+        "deleted_at": fields.String(description="Deletion timestamp (ISO 8601)"),
+    },
+)
+
+item_changes_response = item_ns.model(
+    "ItemChangesResponse",
+    {
+        "items": fields.List(fields.Nested(item_model), description="Created or updated items"),
+        "deleted": fields.List(fields.Nested(deleted_item_model)),
+        "has_more": fields.Boolean(description="More changes are available right away"),
+        "next_cursor": fields.String(description="Pass as since on the next sync"),
     },
 )
 
+import_error_model = item_ns.model(
+    "ItemImportError",
+    {
+        "row": fields.Integer(description="Line number in the uploaded file"),
+        "errors": fields.Raw(description="Validation errors keyed by field"),
+    },
+)
+
+import_report_model = item_ns.model(
+    "ItemImportReport",
+    {
+        "imported": fields.Integer(description="Items created"),
+        "failed": fields.Integer(description="Rows rejected"),
+        "errors": fields.List(fields.Nested(import_error_model)),
+        "errors_truncated": fields.Boolean(description="More rows failed than are listed"),
+    },
+)
+
+import_parser = item_ns.parser()
+import_parser.add_argument(
+    "Authorization",
+    location="headers",
+    required=True,
+    help="Bearer <access_token>",
+)
+import_parser.add_argument("file", location="files", type="file", help="CSV or NDJSON file")
+
 item_response = item_ns.model(
     "ItemResponse",
     {
@@ -94,11 +150,19 @@ auth_header.add_argument(
 class ItemListRoute(ItemListResource):
     @item_ns.expect(auth_header)
     @item_ns.param("kitchen_id", "Kitchen ID", type=int, required=True)
+    @item_ns.param("limit", "Page size (default 100, max 500)", type=int)
+    @item_ns.param("cursor", "Opaque cursor from a previous page's next_cursor")
+    @item_ns.param("include_total", "Include the total count of matching items", type=bool)
+    @item_ns.param("status", "Only items with this status (needed, in_stock)")
+    @item_ns.param("category", "Only items in this category")
+    @item_ns.param("name_prefix", "Only items whose name starts with this text")
+    @item_ns.param("low_stock", "Only items at or below their low-stock threshold", type=bool)
+    @item_ns.param("sort", "id (default), name or quantity; prefix with '-' for descending")
     @item_ns.response(200, "Success", item_list_response)
-    @item_ns.response(400, "Missing kitchen_id parameter", error_model)
+    @item_ns.response(400, "Missing kitchen_id or invalid filter, sort or cursor", error_model)
     @item_ns.response(401, "Unauthorized", error_model)
     def get(self):
-        """Get all items for a kitchen."""
+        """Get a kitchen's items, filtered and sorted server-side, one page at a time."""
         return super().get()
 
     @item_ns.expect(auth_header, create_item_model)
@@ -110,6 +174,34 @@ class ItemListRoute(ItemListResource):
         return super().post()
 
 
+@item_ns.route("/import")
+class ItemImportRoute(ItemImportResource):
+    @item_ns.expect(import_parser)
+    @item_ns.param("kitchen_id", "Kitchen ID", type=int, required=True)
+    @item_ns.param("format", "csv or ndjson (default: from the file extension)")
+    @item_ns.response(200, "Import finished", import_report_model)
+    @item_ns.response(400, "Validation error or unreadable file", error_model)
+    @item_ns.response(401, "Unauthorized", error_model)
+    @item_ns.response(404, "Kitchen not found", error_model)
+    def post(self):
+        """Bulk-import items from a CSV or NDJSON upload with a per-row error report."""
+        return super().post()
+
+
+@item_ns.route("/changes")
+class ItemChangesRoute(ItemChangesResource):
+    @item_ns.expect(auth_header)
+    @item_ns.param("kitchen_id", "Kitchen ID", type=int, required=True)
+    @item_ns.param("since", "next_cursor from the previous sync (omit for a full sync)")
+    @item_ns.param("limit", "Maximum changes to return (default 100, max 500)", type=int)
+    @item_ns.response(200, "Success", item_changes_response)
+    @item_ns.response(400, "Missing kitchen_id or invalid cursor", error_model)
+    @item_ns.response(401, "Unauthorized", error_model)
+    def get(self):
+        """Get items created, updated or deleted since the last sync."""
+        return super().get()
+
+
 @item_ns.route("/<int:item_id>")
 class ItemRoute(ItemResource):
     @item_ns.expect(auth_header)
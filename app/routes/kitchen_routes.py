@@ -3,9 +3,14 @@ from __future__ import annotations
 from flask_restx import Namespace, fields
 
 from app.controllers.kitchen_controller import (
+    KitchenActivityResource,
     KitchenByCodeResource,
+    KitchenEventsResource,
+    KitchenEventTicketResource,
+    KitchenForecastResource,
     KitchenListResource,
     KitchenResource,
+    KitchenSummaryResource,
 )
 
 kitchen_ns = Namespace(
@@ -42,6 +47,7 @@ kitchen_list_response = kitchen_ns.model(
     "KitchenListResponse",
     {
         "kitchens": fields.List(fields.Nested(kitchen_model)),
+        "next_cursor": fields.String(description="Cursor for the next page (null on last page)"),
     },
 )
 
@@ -52,6 +58,121 @@ kitchen_response = kitchen_ns.model(
     },
 )
 
+item_counts_model = kitchen_ns.model(
+    "KitchenItemCounts",
+    {
+        "total": fields.Integer(description="Number of items"),
+        "needed": fields.Integer(description="Items with status needed"),
+        "in_stock": fields.Integer(description="Items with status in_stock"),
+        "low_stock": fields.Integer(description="Items at or below their low-stock threshold"),
+    },
+)
+
+consumption_totals_model = kitchen_ns.model(
+    "KitchenConsumptionTotals",
+    {
+        "days": fields.Integer(description="Length of the window in days"),
+        "count": fields.Integer(description="Consumption logs in the window"),
+        "percent_used": fields.Float(description="Sum of percent_used in the window"),
+    },
+)
+
+top_consumer_model = kitchen_ns.model(
+    "KitchenTopConsumer",
+    {
+        "user_id": fields.Integer(description="User ID"),
+        "display_name": fields.String(description="User display name"),
+        "count": fields.Integer(description="Consumption logs in the window"),
+        "percent_used": fields.Float(description="Sum of percent_used in the window"),
+    },
+)
+
+kitchen_summary_model = kitchen_ns.model(
+    "KitchenSummary",
+    {
+        "kitchen_id": fields.Integer(description="Kitchen ID"),
+        "items": fields.Nested(item_counts_model),
+        "last_restock_at": fields.String(description="Most recent restock (ISO format)"),
+        "consumption": fields.Nested(consumption_totals_model),
+        "top_consumers": fields.List(fields.Nested(top_consumer_model)),
+        "members": fields.Integer(description="Number of users in the kitchen"),
+        "generated_at": fields.String(description="When the summary was computed (ISO format)"),
+    },
+)
+
+kitchen_summary_response = kitchen_ns.model(
+    "KitchenSummaryResponse",
+    {
+        "summary": fields.Nested(kitchen_summary_model),
+    },
+)
+
+item_forecast_model = kitchen_ns.model(
+    "ItemForecast",
+    {
+        "item_id": fields.Integer(description="Item ID"),
+        "name": fields.String(description="Item name"),
+        "quantity_percent": fields.Float(description="Current quantity (0-100)"),
+        "low_stock_threshold": fields.Float(description="Low-stock threshold (0-100)"),
+        "burn_rate_per_day": fields.Float(description="Weighted usage in percent per day"),
+        "samples": fields.Integer(description="Consumption logs the rate is based on"),
+        "days_until_low_stock": fields.Float(
+            description="Days until the threshold is reached (0 if already low, null if unused)"
+        ),
+        "low_stock_at": fields.String(description="Projected low-stock time (ISO format)"),
+        "days_until_empty": fields.Float(description="Days until quantity reaches 0"),
+    },
+)
+
+kitchen_forecast_model = kitchen_ns.model(
+    "KitchenForecast",
+    {
+        "kitchen_id": fields.Integer(description="Kitchen ID"),
+        "generated_at": fields.String(description="Time the projection starts from (ISO format)"),
+        "half_life_days": fields.Float(description="Half-life of the usage weighting"),
+        "items": fields.List(
+            fields.Nested(item_forecast_model), description="Items, soonest to run low first"
+        ),
+    },
+)
+
+kitchen_forecast_response = kitchen_ns.model(
+    "KitchenForecastResponse",
+    {
+        "forecast": fields.Nested(kitchen_forecast_model),
+    },
+)
+
+activity_model = kitchen_ns.model(
+    "ActivityEntry",
+    {
+        "type": fields.String(description="restock or consumption"),
+        "id": fields.Integer(description="Restock or consumption log ID"),
+        "created_at": fields.String(description="Time of the event (ISO format)"),
+        "user_id": fields.Integer(description="User who logged it"),
+        "user_display_name": fields.String(description="That user's display name"),
+        "item_id": fields.Integer(description="Item ID"),
+        "item_name": fields.String(description="Item name"),
+        "percent_used": fields.Float(description="Percentage consumed (null for restocks)"),
+    },
+)
+
+kitchen_activity_response = kitchen_ns.model(
+    "KitchenActivityResponse",
+    {
+        "activity": fields.List(fields.Nested(activity_model)),
+        "next_cursor": fields.String(description="Cursor for the next page (null on last page)"),
+    },
+)
+
+event_ticket_response = kitchen_ns.model(
+    "EventTicketResponse",
+    {
+        "ticket": fields.String(description="Pass as ?ticket= when opening the event stream"),
+        "expires_in": fields.Integer(description="Seconds the ticket stays valid"),
+    },
+)
+
 error_model = kitchen_ns.model(
     "ErrorResponse",
     {
@@ -64,14 +185,22 @@ error_model = kitchen_ns.model(
 
 @kitchen_ns.route("")
 class KitchenListRoute(KitchenListResource):
+    @kitchen_ns.param("limit", "Page size (default 100, max 500)", type=int)
+    @kitchen_ns.param("cursor", "Opaque cursor from a previous page's next_cursor")
+    @kitchen_ns.param("name_prefix", "Only kitchens whose name starts with this text")
+    @kitchen_ns.param("created_from", "Only kitchens created at or after this ISO 8601 time")
+    @kitchen_ns.param("created_to", "Only kitchens created before this ISO 8601 time")
+    @kitchen_ns.param("sort", "id (default), name or created_at; prefix with '-' for descending")
     @kitchen_ns.response(200, "Success", kitchen_list_response)
+    @kitchen_ns.response(400, "Invalid filter, sort or cursor", error_model)
     def get(self):
-        """Get all kitchens."""
+        """List kitchens, filtered server-side, one page at a time."""
         return super().get()
 
     @kitchen_ns.expect(create_kitchen_model)
     @kitchen_ns.response(201, "Kitchen created", kitchen_response)
     @kitchen_ns.response(400, "Validation error", error_model)
+    @kitchen_ns.response(503, "No kitchen code available", error_model)
     def post(self):
         """Create a new kitchen with a unique code."""
         return super().post()
@@ -107,3 +236,85 @@ class KitchenByCodeRoute(KitchenByCodeResource):
     def get(self, code: str):
         """Get a kitchen by its unique 6-digit code."""
         return super().get(code)
+
+
+@kitchen_ns.route("/<int:kitchen_id>/summary")
+class KitchenSummaryRoute(KitchenSummaryResource):
+    @kitchen_ns.param("Authorization", "Bearer <access_token>", _in="header")
+    @kitchen_ns.response(200, "Success", kitchen_summary_response)
+    @kitchen_ns.response(401, "Unauthorized", error_model)
+    @kitchen_ns.response(404, "Kitchen not found", error_model)
+    def get(self, kitchen_id: int):
+        """Get item counts, last restock, recent consumption and top consumers for a kitchen.
+
+        Computed with aggregate queries and cached briefly; the figures can
+        lag writes by up to SUMMARY_CACHE_FRESH_SECONDS (longer while a
+        stale copy is being refreshed).
+        """
+        return super().get(kitchen_id)
+
+
+@kitchen_ns.route("/<int:kitchen_id>/forecast")
+class KitchenForecastRoute(KitchenForecastResource):
+    @kitchen_ns.param("Authorization", "Bearer <access_token>", _in="header")
+    @kitchen_ns.response(200, "Success", kitchen_forecast_response)
+    @kitchen_ns.response(401, "Unauthorized", error_model)
+    @kitchen_ns.response(404, "Kitchen not found", error_model)
+    def get(self, kitchen_id: int):
+        """Project when each item in a kitchen will run low, from its recent burn rate."""
+        return super().get(kitchen_id)
+
+
+@kitchen_ns.route("/<int:kitchen_id>/activity")
+class KitchenActivityRoute(KitchenActivityResource):
+    @kitchen_ns.param("Authorization", "Bearer <access_token>", _in="header")
+    @kitchen_ns.param("from", "Only events at or after this ISO 8601 timestamp")
+    @kitchen_ns.param("to", "Only events before this ISO 8601 timestamp")
+    @kitchen_ns.param("limit", "Page size (default 100, max 500)", type=int)
+    @kitchen_ns.param("cursor", "Opaque cursor from a previous page's next_cursor")
+    @kitchen_ns.response(200, "Success", kitchen_activity_response)
+    @kitchen_ns.response(304, "Not modified since the ETag in If-None-Match")
+    @kitchen_ns.response(400, "Invalid range, limit or cursor", error_model)
+    @kitchen_ns.response(401, "Unauthorized", error_model)
+    @kitchen_ns.response(404, "Kitchen not found", error_model)
+    def get(self, kitchen_id: int):
+        """Get restocks and consumption in a kitchen as one timeline, newest first."""
+        return super().get(kitchen_id)
+
+
+@kitchen_ns.route("/<int:kitchen_id>/events/ticket")
+class KitchenEventTicketRoute(KitchenEventTicketResource):
+    @kitchen_ns.param("Authorization", "Bearer <access_token>", _in="header")
+    @kitchen_ns.response(201, "Ticket issued", event_ticket_response)
+    @kitchen_ns.response(401, "Unauthorized", error_model)
+    @kitchen_ns.response(404, "Kitchen not found", error_model)
+    def post(self, kitchen_id: int):
+        """Get a short-lived ticket for GET /kitchens/{id}/events?ticket=...
+
+        For EventSource clients, which cannot send an Authorization header.
+        The ticket only opens this kitchen's stream and expires after
+        EVENT_TICKET_SECONDS; fetch a new one before reconnecting.
+        """
+        return super().post(kitchen_id)
+
+
+@kitchen_ns.route("/<int:kitchen_id>/events")
+class KitchenEventsRoute(KitchenEventsResource):
+    @kitchen_ns.param("Authorization", "Bearer <access_token>", _in="header")
+    @kitchen_ns.param("ticket", "Stream ticket from POST /kitchens/{id}/events/ticket")
+    @kitchen_ns.param("Last-Event-ID", "Replay events after this id", _in="header")
+    @kitchen_ns.param("last_event_id", "Replay events after this id (query alternative)", type=int)
+    @kitchen_ns.produces(["text/event-stream"])
+    @kitchen_ns.response(200, "Event stream")
+    @kitchen_ns.response(400, "Invalid Last-Event-ID", error_model)
+    @kitchen_ns.response(401, "Unauthorized", error_model)
+    @kitchen_ns.response(404, "Kitchen not found", error_model)
+    def get(self, kitchen_id: int):
+        """Stream item, consumption and restock changes for a kitchen (Server-Sent Events).
+
+        Event types: item.created, item.updated, item.deleted, items.changed,
+        consumption.created, consumption.deleted, restock.created,
+        restock.deleted, kitchen.updated and resync. Reconnects resume from
+        Last-Event-ID.
+        """
+        return super().get(kitchen_id)
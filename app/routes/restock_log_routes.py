@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from flask_restx import Namespace, fields
 
-from app.controllers.restock_log_controller import RestockLogListResource, RestockLogResource
+from app.controllers.restock_log_controller import (
+    RestockIntervalResource,
+    RestockLogBulkResource,
+    RestockLogExportResource,
+    RestockLogListResource,
+    RestockLogResource,
+)
 
 restock_ns = Namespace(
     "restocks",
@@ -27,10 +33,33 @@ create_restock_log_model = restock_ns.model(
     },
 )
 
+bulk_restock_model = restock_ns.model(
+    "BulkRestock",
+    {
+        "item_ids": fields.List(fields.Integer, description="Items to restock"),
+        "kitchen_id": fields.Integer(description="Restock this kitchen's items instead"),
+        "filter": fields.String(
+            description="With kitchen_id: 'needed' (default), 'below_threshold' or 'all'"
+        ),
+    },
+)
+
+bulk_restock_response = restock_ns.model(
+    "BulkRestockResponse",
+    {
+        "restocked_item_ids": fields.List(fields.Integer, description="Items restocked"),
+        "count": fields.Integer(description="Number of items restocked"),
+        "not_found_item_ids": fields.List(
+            fields.Integer, description="Requested item_ids that do not exist"
+        ),
+    },
+)
+
 restock_log_list_response = restock_ns.model(
     "RestockLogListResponse",
     {
         "logs": fields.List(fields.Nested(restock_log_model)),
+        "next_cursor": fields.String(description="Cursor for the next page (null on last page)"),
     },
 )
 
@@ -41,12 +70,38 @@ restock_log_response = restock_ns.model(
     },
 )
 
+restock_interval_model = restock_ns.model(
+    "RestockInterval",
+    {
+        "item_id": fields.Integer(description="Item ID"),
+        "name": fields.String(description="Item name"),
+        "restocks": fields.Integer(description="Number of restocks (intervals + 1)"),
+        "mean_days": fields.Float(description="Mean days between restocks"),
+        "stddev_days": fields.Float(description="Standard deviation of the intervals, in days"),
+        "p50_days": fields.Float(description="Median interval (nearest rank), in days"),
+        "p90_days": fields.Float(description="90th percentile interval (nearest rank), in days"),
+        "min_days": fields.Float(description="Shortest interval, in days"),
+        "max_days": fields.Float(description="Longest interval, in days"),
+    },
+)
+
+restock_interval_list_response = restock_ns.model(
+    "RestockIntervalListResponse",
+    {
+        "items": fields.List(
+            fields.Nested(restock_interval_model),
+            description="Items restocked at least twice, by item ID",
+        ),
+    },
+)
+
 error_model = restock_ns.model(
     "ErrorResponse",
     {
         "code": fields.String(description="Error code"),
         "message": fields.String(description="Error message"),
         "field": fields.String(description="Field that failed validation"),
+        "fields": fields.List(fields.String, description="Missing/invalid fields"),
     },
 )
 
@@ -65,8 +120,12 @@ class RestockLogListRoute(RestockLogListResource):
     @restock_ns.param("item_id", "Filter by item ID", type=int)
     @restock_ns.param("kitchen_id", "Filter by kitchen ID", type=int)
     @restock_ns.param("user_id", "Filter by user ID", type=int)
+    @restock_ns.param("from", "Only logs created at or after this ISO 8601 timestamp")
+    @restock_ns.param("to", "Only logs created before this ISO 8601 timestamp")
+    @restock_ns.param("limit", "Page size (default 100, max 500)", type=int)
+    @restock_ns.param("cursor", "Opaque cursor from a previous page's next_cursor")
     @restock_ns.response(200, "Success", restock_log_list_response)
-    @restock_ns.response(400, "Missing filter parameter", error_model)
+    @restock_ns.response(400, "Missing filter parameter, invalid range or cursor", error_model)
     @restock_ns.response(401, "Unauthorized", error_model)
     def get(self):
         """Get restock logs (requires one of: item_id, kitchen_id, or user_id)."""
@@ -82,6 +141,49 @@ class RestockLogListRoute(RestockLogListResource):
         return super().post()
 
 
+@restock_ns.route("/bulk")
+class RestockLogBulkRoute(RestockLogBulkResource):
+    @restock_ns.expect(auth_header, bulk_restock_model)
+    @restock_ns.response(200, "Items restocked", bulk_restock_response)
+    @restock_ns.response(400, "Validation error", error_model)
+    @restock_ns.response(401, "Unauthorized", error_model)
+    def post(self):
+        """Restock many items at once (one transaction, one INSERT, one UPDATE)."""
+        return super().post()
+
+
+@restock_ns.route("/export")
+class RestockLogExportRoute(RestockLogExportResource):
+    @restock_ns.expect(auth_header)
+    @restock_ns.param("kitchen_id", "Kitchen ID", type=int, required=True)
+    @restock_ns.param("format", "ndjson (default) or csv")
+    @restock_ns.param("from", "Only logs created at or after this ISO 8601 timestamp")
+    @restock_ns.param("to", "Only logs created before this ISO 8601 timestamp")
+    @restock_ns.produces(["application/x-ndjson", "text/csv"])
+    @restock_ns.response(200, "Streamed export")
+    @restock_ns.response(400, "Validation error", error_model)
+    @restock_ns.response(401, "Unauthorized", error_model)
+    def get(self):
+        """Stream a kitchen's restock logs in chronological order."""
+        return super().get()
+
+
+@restock_ns.route("/intervals")
+class RestockIntervalRoute(RestockIntervalResource):
+    @restock_ns.expect(auth_header)
+    @restock_ns.param("kitchen_id", "Kitchen ID", type=int, required=True)
+    @restock_ns.response(200, "Success", restock_interval_list_response)
+    @restock_ns.response(400, "Missing kitchen_id", error_model)
+    @restock_ns.response(401, "Unauthorized", error_model)
+    def get(self):
+        """Get mean, median and p90 time between restocks for each item in a kitchen.
+
+        Computed in SQL with window functions and cached until the kitchen's
+        next restock.
+        """
+        return super().get()
+
+
 @restock_ns.route("/<int:log_id>")
 class RestockLogRoute(RestockLogResource):
     @restock_ns.expect(auth_header)
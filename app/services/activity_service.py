@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Float, and_, literal, null, or_, select, union_all
+
+from app.extensions import db
+from app.models.consumption_log import ConsumptionLog
+from app.models.item import Item
+from app.models.restock_log import RestockLog
+from app.models.user_model import User
+from app.services.pagination import decode_cursor, encode_cursor
+
+# Ties on created_at are broken by type, then id, all descending.
+ACTIVITY_TYPES = {"consumption": ConsumptionLog, "restock": RestockLog}
+
+
+class ActivityService:
+    """A kitchen's restock and consumption logs as one timeline, newest first."""
+
+    @staticmethod
+    def _decode(cursor: str) -> tuple[datetime, str, int]:
+        values = decode_cursor(cursor)
+        try:
+            created_at = datetime.fromisoformat(values["t"])
+            kind, last_id = values["k"], values["id"]
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+        if kind not in ACTIVITY_TYPES or not isinstance(last_id, int):
+            raise ValueError("Invalid cursor")
+        return created_at, kind, last_id
+
+    @staticmethod
+    def _branch(kind, kitchen_id, start, end, after, limit):
+        """One log table's rows of the page: filtered, keyset-bounded and limited on its own."""
+        model = ACTIVITY_TYPES[kind]
+        stmt = (
+            select(
+                literal(kind).label("type"),
+                model.id.label("id"),
+                model.created_at.label("created_at"),
+                model.user_id.label("user_id"),
+                model.item_id.label("item_id"),
+                (model.percent_used if model is ConsumptionLog else null().cast(Float)).label(
+                    "percent_used"
+                ),
+            )
+            .join(Item, Item.id == model.item_id)
+            .where(Item.kitchen_id == kitchen_id)
+        )
+        if start is not None:
+            stmt = stmt.where(model.created_at >= start)
+        if end is not None:
+            stmt = stmt.where(model.created_at < end)
+        if after is not None:
+            # The type is constant within a branch, so the three-column
+            # keyset reduces to a created_at bound plus, for the cursor's
+            # own type, an id bound on its timestamp.
+            last_at, last_kind, last_id = after
+            if kind < last_kind:
+                stmt = stmt.where(model.created_at <= last_at)
+            elif kind > last_kind:
+                stmt = stmt.where(model.created_at < last_at)
+            else:
+                stmt = stmt.where(
+                    model.created_at <= last_at,
+                    or_(
+                        model.created_at < last_at,
+                        and_(model.created_at == last_at, model.id < last_id),
+                    ),
+                )
+        stmt = stmt.order_by(model.created_at.desc(), model.id.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        # SQLite does not allow ORDER BY / LIMIT directly on a UNION member.
+        return select(stmt.subquery())
+
+    @staticmethod
+    def get_activity(
+        kitchen_id: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Get a kitchen's logs in [start, end) with user and item names, optionally one page.
+
+        One UNION ALL statement: each log table contributes at most
+        ``limit`` rows after the cursor, the union is ordered by
+        (created_at, type, id) descending and cut to ``limit``, and only
+        those rows are joined to users and items. ``cursor`` comes from
+        ``cursor_for``; a malformed one raises ValueError.
+        """
+        after = ActivityService._decode(cursor) if cursor else None
+        activity = union_all(
+            *(
+                ActivityService._branch(kind, kitchen_id, start, end, after, limit)
+                for kind in ACTIVITY_TYPES
+            )
+        ).subquery("activity")
+
+        stmt = (
+            select(activity, User.display_name, Item.name.label("item_name"))
+            .join(Item, Item.id == activity.c.item_id)
+            .outerjoin(User, User.id == activity.c.user_id)
+            .order_by(activity.c.created_at.desc(), activity.c.type.desc(), activity.c.id.desc())
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return [
+            {
+                "type": row.type,
+                "id": row.id,
+                "created_at": row.created_at.isoformat(),
+                "user_id": row.user_id,
+                "user_display_name": row.display_name,
+                "item_id": row.item_id,
+                "item_name": row.item_name,
+                "percent_used": row.percent_used,
+            }
+            for row in db.session.execute(stmt)
+        ]
+
+    @staticmethod
+    def cursor_for(entry: dict) -> str:
+        """Build the cursor that resumes the timeline after ``entry``."""
+        return encode_cursor({"t": entry["created_at"], "k": entry["type"], "id": entry["id"]})
@@ -1,28 +1,47 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta
+
+from flask import current_app
 from flask_jwt_extended import create_access_token, create_refresh_token
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 
 from app.extensions import db
-from app.models.kitchen import Kitchen
+from app.models.revoked_token import RevokedToken
 from app.models.user_model import User
+from app.services.kitchen_service import KitchenService
+from app.services.lookup_cache import user_cache
+from app.services.password_hasher import PasswordHasherBusy, get_password_hasher
+from app.services.token_blocklist import get_token_blocklist, jti_key, user_key
 
 
 class AuthService:
+    @staticmethod
+    def set_password(user: User, password: str) -> None:
+        """Hash a password on the bounded pool and store it on the user (not committed)."""
+        user.password_hash = get_password_hasher().hash(password)
+
+    @staticmethod
+    def check_password(user: User, password: str) -> bool:
+        """Verify a password against the user's stored hash on the bounded pool."""
+        return get_password_hasher().verify(user.password_hash, password)
+
     @staticmethod
     def register_user(display_name: str, password: str, kitchen_code: str) -> User:
-        kitchen = Kitchen.query.filter_by(code=kitchen_code).first()
+        kitchen = KitchenService.get_cached_kitchen_by_code(kitchen_code)
         if not kitchen:
             raise ValueError("Kitchen not found")
 
         existing = User.query.filter_by(
             display_name=display_name,
-            kitchen_id=kitchen.id,
+            kitchen_id=kitchen["id"],
         ).first()
         if existing:
             raise ValueError("Display name already in use for this kitchen")
 
-        user = User(display_name=display_name, kitchen_id=kitchen.id)
-        user.set_password(password)
+        user = User(display_name=display_name, kitchen_id=kitchen["id"])
+        AuthService.set_password(user, password)
         db.session.add(user)
         db.session.commit()
         return user
@@ -33,30 +52,109 @@ class AuthService:
         password: str,
         kitchen_code: str,
     ) -> User | None:
-        kitchen = Kitchen.query.filter_by(code=kitchen_code).first()
+        kitchen = KitchenService.get_cached_kitchen_by_code(kitchen_code)
         if not kitchen:
             return None
         user = User.query.filter_by(
             display_name=display_name,
-            kitchen_id=kitchen.id,
+            kitchen_id=kitchen["id"],
         ).first()
         if not user:
             return None
-        if not user.check_password(password):
+        if not AuthService.check_password(user, password):
             return None
         if not user.is_active:
             return None
+        if get_password_hasher().needs_rehash(user.password_hash):
+            # The plaintext is only available here, so upgrade hashes made
+            # with older parameters as users log in. The login has already
+            # succeeded; if the pool is full, keep the old hash until next time.
+            try:
+                AuthService.set_password(user, password)
+            except PasswordHasherBusy:
+                return user
+            db.session.commit()
         return user
 
+    @staticmethod
+    def get_user_profile(user_id: int) -> dict | None:
+        """Get a user's public dict by id, served from the lookup cache when possible."""
+
+        def load():
+            user = db.session.scalars(
+                select(User).options(joinedload(User.kitchen)).where(User.id == user_id)
+            ).first()
+            return user.to_profile().to_dict() if user else None
+
+        return user_cache.get_or_load(user_id, load)
+
     @staticmethod
     def generate_tokens(user: User) -> dict:
-        access_token = create_access_token(identity=str(user.id))
-        refresh_token = create_refresh_token(identity=str(user.id))
+        # The kitchen claim lets per-kitchen rate limits apply without a lookup.
+        claims = {"kitchen_id": user.kitchen_id}
+        access_token = create_access_token(identity=str(user.id), additional_claims=claims)
+        refresh_token = create_refresh_token(identity=str(user.id), additional_claims=claims)
         return {
             "access_token": access_token,
             "refresh_token": refresh_token,
         }
 
     @staticmethod
-    def refresh_access_token(user_id: int) -> str:
-        return create_access_token(identity=str(user_id))
+    def refresh_access_token(user_id: int, kitchen_id: int | None = None) -> str:
+        claims = {"kitchen_id": kitchen_id} if kitchen_id is not None else None
+        return create_access_token(identity=str(user_id), additional_claims=claims)
+
+    @staticmethod
+    def revoke_token(jti: str, expires: int, user_id: int | None = None) -> None:
+        """Revoke one token by jti until its ``exp`` timestamp."""
+        if RevokedToken.query.filter_by(jti=jti).first() is None:
+            db.session.add(
+                RevokedToken(
+                    jti=jti, user_id=user_id, expires_at=datetime.utcfromtimestamp(expires)
+                )
+            )
+        AuthService.purge_revoked_tokens(commit=False)
+        db.session.commit()
+        get_token_blocklist().add(jti_key(jti))
+
+    @staticmethod
+    def revoke_user_tokens(user_id: int, commit: bool = True) -> None:
+        """Revoke every token issued to a user so far."""
+        lifetime = max(
+            current_app.config["JWT_ACCESS_TOKEN_EXPIRES"],
+            current_app.config["JWT_REFRESH_TOKEN_EXPIRES"],
+        )
+        now = datetime.utcnow()
+        # Token iat claims are whole seconds; round up so the revocation
+        # covers every token of the current second and compares exactly.
+        revoked_at = now.replace(microsecond=0)
+        if now.microsecond:
+            revoked_at += timedelta(seconds=1)
+        db.session.add(
+            RevokedToken(user_id=user_id, revoked_at=revoked_at, expires_at=now + lifetime)
+        )
+        if commit:
+            db.session.commit()
+            get_token_blocklist().add(user_key(user_id))
+
+    @staticmethod
+    def deactivate_user(user_id: int) -> bool:
+        """Deactivate a user and revoke the tokens they already hold."""
+        user = db.session.get(User, user_id)
+        if not user:
+            return False
+        user.is_active = False
+        AuthService.revoke_user_tokens(user_id, commit=False)
+        db.session.commit()
+        get_token_blocklist().add(user_key(user_id))
+        return True
+
+    @staticmethod
+    def purge_revoked_tokens(commit: bool = True) -> int:
+        """Delete blocklist rows whose tokens have expired anyway."""
+        deleted = RevokedToken.query.filter(RevokedToken.expires_at <= datetime.utcnow()).delete(
+            synchronize_session=False
+        )
+        if commit:
+            db.session.commit()
+        return deleted
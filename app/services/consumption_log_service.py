@@ -1,40 +1,177 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from datetime import datetime
+
+from sqlalchemy import case, insert, literal, select, update
+from sqlalchemy.engine import Row
+
 from app.extensions import db
 from app.models.consumption_log import ConsumptionLog
 from app.models.item import Item, ItemStatus
+from app.services.consumption_rollup_service import ConsumptionRollupService
+from app.services.kitchen_event_service import KitchenEventService
+from app.services.kitchen_version_service import KitchenVersionService
+from app.services.pagination import newest_first_page
 
 
 class ConsumptionLogService:
+    @staticmethod
+    def _decrement_values(amount) -> list[tuple]:
+        """SET clauses that subtract ``amount`` from an item, clamped at 0.
+
+        Status is assigned first: MySQL evaluates single-table SET clauses left
+        to right, so it must see the pre-update quantity like other dialects do.
+        """
+        remaining = Item.quantity_percent - amount
+        needed = literal(ItemStatus.NEEDED, type_=Item.__table__.c.status.type)
+        return [
+            (Item.status, case((remaining <= 0, needed), else_=Item.status)),
+            (Item.quantity_percent, case((remaining < 0, 0.0), else_=remaining)),
+        ]
+
+    @staticmethod
+    def _apply_consumption(item_id: int, percent_used: float) -> Row | None:
+        """Atomically decrement an item and return its new state, or None if missing."""
+        # An item never changes kitchen, so a plain read is enough to find
+        # which kitchen version to bump before the item row is locked.
+        kitchen_id = db.session.scalar(select(Item.kitchen_id).where(Item.id == item_id))
+        if kitchen_id is None:
+            return None
+        version = KitchenVersionService.bump(kitchen_id)
+
+        stmt = (
+            update(Item)
+            .where(Item.id == item_id)
+            .ordered_values(
+                *ConsumptionLogService._decrement_values(percent_used), (Item.version, version)
+            )
+        )
+        columns = (Item.id, Item.kitchen_id, Item.quantity_percent, Item.status, Item.version)
+        options = {"synchronize_session": False}
+
+        if db.engine.dialect.update_returning:
+            return db.session.execute(stmt.returning(*columns), execution_options=options).first()
+
+        result = db.session.execute(stmt, execution_options=options)
+        if result.rowcount == 0:
+            return None
+        # The row stays locked by our UPDATE until commit, so this read is consistent.
+        return db.session.execute(select(*columns).where(Item.id == item_id)).first()
+
     @staticmethod
     def create_consumption_log(
         user_id: int,
         item_id: int,
         percent_used: float,
     ) -> ConsumptionLog | None:
-        """Create a new consumption log and update item quantity."""
-        item = Item.query.get(item_id)
-        if not item:
+        """Create a new consumption log and atomically reduce the item's quantity."""
+        item = ConsumptionLogService._apply_consumption(item_id, percent_used)
+        if item is None:
+            db.session.rollback()
             return None
 
-        # Create the consumption log
         log = ConsumptionLog(
             user_id=user_id,
             item_id=item_id,
             percent_used=percent_used,
         )
         db.session.add(log)
+        db.session.flush()
+        ConsumptionRollupService.record([(item_id, log.created_at, percent_used)])
+        KitchenEventService.publish(
+            item.kitchen_id,
+            "consumption.created",
+            {
+                "log": log.to_dict(),
+                "item": {
+                    "id": item.id,
+                    "quantity_percent": item.quantity_percent,
+                    "status": ItemStatus(item.status).value,
+                    "version": item.version,
+                },
+            },
+            item.version,
+        )
+        db.session.commit()
+        return log
 
-        # Update item quantity
-        new_quantity = max(0.0, item.quantity_percent - percent_used)
-        item.quantity_percent = new_quantity
+    @staticmethod
+    def create_consumption_logs(user_id: int, entries: list[dict]) -> list[dict]:
+        """Create many consumption logs in one transaction.
 
-        # Auto-update status if depleted
-        if new_quantity <= 0:
-            item.status = ItemStatus.NEEDED
+        Each entry has ``item_id``, ``percent_used`` and an optional
+        ``occurred_at`` datetime. Logs are written with one multi-row INSERT,
+        the summed usage per item is applied with one UPDATE, and the
+        transaction is committed once. Returns one result per entry, in order.
+        """
+        item_ids = {entry["item_id"] for entry in entries}
+        existing = dict(
+            db.session.execute(select(Item.id, Item.kitchen_id).where(Item.id.in_(item_ids))).all()
+        )
+
+        rows = []
+        totals: dict[int, float] = {}
+        results: list[dict] = []
+        for entry in entries:
+            if entry["item_id"] not in existing:
+                results.append(
+                    {"status": "error", "code": "not_found", "message": "Item not found"}
+                )
+                continue
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "item_id": entry["item_id"],
+                    "percent_used": entry["percent_used"],
+                    "created_at": entry.get("occurred_at") or datetime.utcnow(),
+                }
+            )
+            totals[entry["item_id"]] = totals.get(entry["item_id"], 0.0) + entry["percent_used"]
+            results.append({"status": "created"})
+
+        if not rows:
+            return results
+
+        # Lock the kitchen rows before the log INSERT touches the items' rows
+        # through the foreign key.
+        versions = KitchenVersionService.bump_many(existing[item_id] for item_id in totals)
+        stmt = insert(ConsumptionLog)
+        if db.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+            ids = iter(
+                db.session.scalars(
+                    stmt.returning(ConsumptionLog.id, sort_by_parameter_order=True), rows
+                ).all()
+            )
+            for result in results:
+                if result["status"] == "created":
+                    result["id"] = next(ids)
+        else:
+            db.session.execute(stmt, rows)
+        ConsumptionRollupService.record(
+            (row["item_id"], row["created_at"], row["percent_used"]) for row in rows
+        )
 
+        amount = case(totals, value=Item.id, else_=0.0)
+        db.session.execute(
+            update(Item)
+            .where(Item.id.in_(totals))
+            .ordered_values(
+                *ConsumptionLogService._decrement_values(amount),
+                (Item.version, case(versions, value=Item.kitchen_id, else_=Item.version)),
+            ),
+            execution_options={"synchronize_session": False},
+        )
+        for kitchen_id, version in versions.items():
+            changed = sorted(item_id for item_id in totals if existing[item_id] == kitchen_id)
+            KitchenEventService.publish(
+                kitchen_id,
+                "items.changed",
+                {"reason": "consumption_batch", "item_ids": changed},
+                version,
+            )
         db.session.commit()
-        return log
+        return results
 
     @staticmethod
     def get_consumption_log_by_id(log_id: int) -> ConsumptionLog | None:
@@ -42,32 +179,104 @@ class ConsumptionLogService:
         return ConsumptionLog.query.get(log_id)
 
     @staticmethod
-    def get_consumption_logs_by_item(item_id: int) -> list[ConsumptionLog]:
-        """Get all consumption logs for an item."""
-        return (
-            ConsumptionLog.query.filter_by(item_id=item_id)
-            .order_by(ConsumptionLog.created_at.desc())
-            .all()
-        )
+    def get_consumption_logs_by_item(
+        item_id: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> list[ConsumptionLog]:
+        """Get an item's consumption logs in [start, end), newest first, optionally one page.
+
+        ``cursor`` comes from ``created_at_cursor`` on the last log of the
+        previous page; a malformed one raises ValueError.
+        """
+        return newest_first_page(
+            ConsumptionLog.query.filter(ConsumptionLog.item_id == item_id),
+            ConsumptionLog.created_at,
+            ConsumptionLog.id,
+            start,
+            end,
+            cursor,
+            limit,
+        ).all()
 
     @staticmethod
-    def get_consumption_logs_by_kitchen(kitchen_id: int) -> list[ConsumptionLog]:
-        """Get all consumption logs for a kitchen."""
-        return (
-            ConsumptionLog.query.join(Item)
-            .filter(Item.kitchen_id == kitchen_id)
-            .order_by(ConsumptionLog.created_at.desc())
-            .all()
-        )
+    def get_consumption_logs_by_kitchen(
+        kitchen_id: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> list[ConsumptionLog]:
+        """Get a kitchen's consumption logs; arguments as for get_consumption_logs_by_item."""
+        return newest_first_page(
+            ConsumptionLog.query.join(Item).filter(Item.kitchen_id == kitchen_id),
+            ConsumptionLog.created_at,
+            ConsumptionLog.id,
+            start,
+            end,
+            cursor,
+            limit,
+        ).all()
 
     @staticmethod
-    def get_consumption_logs_by_user(user_id: int) -> list[ConsumptionLog]:
-        """Get all consumption logs for a user."""
-        return (
-            ConsumptionLog.query.filter_by(user_id=user_id)
-            .order_by(ConsumptionLog.created_at.desc())
-            .all()
+    def iter_consumption_logs_by_kitchen(
+        kitchen_id: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[dict]:
+        """Stream a kitchen's consumption logs in [start, end) as plain dicts.
+
+        Rows are fetched ``batch_size`` at a time from a server-side cursor
+        where the driver supports one, so memory does not grow with history.
+        """
+        stmt = (
+            select(
+                ConsumptionLog.id,
+                ConsumptionLog.user_id,
+                ConsumptionLog.item_id,
+                ConsumptionLog.percent_used,
+                ConsumptionLog.created_at,
+            )
+            .join(Item, Item.id == ConsumptionLog.item_id)
+            .where(Item.kitchen_id == kitchen_id)
+            .order_by(ConsumptionLog.created_at, ConsumptionLog.id)
         )
+        if start is not None:
+            stmt = stmt.where(ConsumptionLog.created_at >= start)
+        if end is not None:
+            stmt = stmt.where(ConsumptionLog.created_at < end)
+
+        result = db.session.execute(stmt.execution_options(yield_per=batch_size))
+        for row in result:
+            yield {
+                "id": row.id,
+                "user_id": row.user_id,
+                "item_id": row.item_id,
+                "percent_used": row.percent_used,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+            }
+
+    @staticmethod
+    def get_consumption_logs_by_user(
+        user_id: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> list[ConsumptionLog]:
+        """Get a user's consumption logs; arguments as for get_consumption_logs_by_item."""
+        return newest_first_page(
+            ConsumptionLog.query.filter(ConsumptionLog.user_id == user_id),
+            ConsumptionLog.created_at,
+            ConsumptionLog.id,
+            start,
+            end,
+            cursor,
+            limit,
+        ).all()
 
     @staticmethod
     def delete_consumption_log(log_id: int) -> bool:
@@ -75,6 +284,11 @@ class ConsumptionLogService:
         log = ConsumptionLog.query.get(log_id)
         if not log:
             return False
+        kitchen_id = db.session.scalar(select(Item.kitchen_id).where(Item.id == log.item_id))
+        if kitchen_id is not None:
+            version = KitchenVersionService.bump(kitchen_id)
+            KitchenEventService.publish(kitchen_id, "consumption.deleted", {"id": log.id}, version)
+        ConsumptionRollupService.remove(log.item_id, log.created_at, log.percent_used)
         db.session.delete(log)
         db.session.commit()
         return True
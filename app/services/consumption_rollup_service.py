@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import Date, cast, delete, func, insert, select, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from app.extensions import db
+from app.models.consumption_daily import ConsumptionDaily
+from app.models.consumption_log import ConsumptionLog
+from app.models.item import Item
+from app.services.log_archive_service import LogArchiveService
+
+
+class ConsumptionRollupService:
+    """Daily (UTC) consumption totals per item, maintained alongside ``consumption_logs``.
+
+    Log writes add their usage to the matching ``consumption_daily`` row in
+    the same transaction, so reports read one row per item and day instead
+    of every log. ``rebuild`` recomputes rows from the log.
+    """
+
+    @staticmethod
+    def _upsert(rows: list[dict]) -> None:
+        """Add each row's percent_used and events to its (item_id, day) total, creating it if new."""
+        table = ConsumptionDaily.__table__
+        dialect = db.engine.dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            stmt = (sqlite if dialect == "sqlite" else postgresql).insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.item_id, table.c.day],
+                set_={
+                    "percent_used": table.c.percent_used + stmt.excluded.percent_used,
+                    "events": table.c.events + stmt.excluded.events,
+                },
+            )
+            db.session.execute(stmt, rows)
+        elif dialect in ("mysql", "mariadb"):
+            stmt = mysql.insert(table)
+            stmt = stmt.on_duplicate_key_update(
+                percent_used=table.c.percent_used + stmt.inserted.percent_used,
+                events=table.c.events + stmt.inserted.events,
+            )
+            db.session.execute(stmt, rows)
+        else:
+            for row in rows:
+                result = db.session.execute(
+                    update(table)
+                    .where(table.c.item_id == row["item_id"], table.c.day == row["day"])
+                    .values(
+                        percent_used=table.c.percent_used + row["percent_used"],
+                        events=table.c.events + row["events"],
+                    )
+                )
+                if result.rowcount == 0:
+                    db.session.execute(insert(table), row)
+
+    @staticmethod
+    def record(entries: Iterable[tuple[int, datetime, float]]) -> None:
+        """Add (item_id, created_at, percent_used) usage events to the rollup.
+
+        Events for the same item and day are summed first, so a batch costs
+        one statement however many logs it holds. Does not commit.
+        """
+        totals: dict[tuple[int, date], list] = {}
+        for item_id, created_at, percent_used in entries:
+            total = totals.setdefault((item_id, created_at.date()), [0.0, 0])
+            total[0] += percent_used
+            total[1] += 1
+        if totals:
+            ConsumptionRollupService._upsert(
+                [
+                    {"item_id": item_id, "day": day, "percent_used": used, "events": events}
+                    for (item_id, day), (used, events) in totals.items()
+                ]
+            )
+
+    @staticmethod
+    def remove(item_id: int, created_at: datetime, percent_used: float) -> None:
+        """Take one deleted log back out of the rollup. Does not commit."""
+        key = (ConsumptionDaily.item_id == item_id, ConsumptionDaily.day == created_at.date())
+        db.session.execute(
+            update(ConsumptionDaily)
+            .where(*key)
+            .values(
+                percent_used=ConsumptionDaily.percent_used - percent_used,
+                events=ConsumptionDaily.events - 1,
+            )
+        )
+        db.session.execute(delete(ConsumptionDaily).where(*key, ConsumptionDaily.events <= 0))
+
+    @staticmethod
+    def _day_expression():
+        """SQL for the UTC day of ConsumptionLog.created_at."""
+        # SQLite's CAST(... AS DATE) yields a number; date() yields the
+        # 'YYYY-MM-DD' text the Date type stores there.
+        if db.engine.dialect.name == "sqlite":
+            return func.date(ConsumptionLog.created_at)
+        return cast(ConsumptionLog.created_at, Date)
+
+    @staticmethod
+    def rebuild(start: date | None = None, end: date | None = None) -> int:
+        """Recompute rollup rows for days in [start, end) from the log and commit.
+
+        Existing rows in the range are replaced with one INSERT ... SELECT
+        grouped by item and day. Days whose logs have been archived are
+        skipped: their rows are the only record left in the database.
+        Returns the number of rows written.
+        """
+        archived = LogArchiveService.last_archived_day(ConsumptionLog.__tablename__)
+        if archived is not None:
+            start = max(start or date.min, archived + timedelta(days=1))
+            if end is not None and end <= start:
+                return 0
+
+        day = ConsumptionRollupService._day_expression().label("day")
+        source = select(
+            ConsumptionLog.item_id,
+            day,
+            func.sum(ConsumptionLog.percent_used),
+            func.count(),
+        ).group_by(ConsumptionLog.item_id, day)
+        stale = delete(ConsumptionDaily)
+        if start is not None:
+            source = source.where(ConsumptionLog.created_at >= datetime.combine(start, time.min))
+            stale = stale.where(ConsumptionDaily.day >= start)
+        if end is not None:
+            source = source.where(ConsumptionLog.created_at < datetime.combine(end, time.min))
+            stale = stale.where(ConsumptionDaily.day < end)
+
+        db.session.execute(stale)
+        result = db.session.execute(
+            insert(ConsumptionDaily).from_select(
+                ["item_id", "day", "percent_used", "events"], source
+            )
+        )
+        db.session.commit()
+        return result.rowcount
+
+    @staticmethod
+    def get_daily_usage(
+        start: date,
+        end: date,
+        item_id: int | None = None,
+        kitchen_id: int | None = None,
+    ) -> list[ConsumptionDaily]:
+        """Get rollup rows for one item or a kitchen's items for days in [start, end).
+
+        Days without usage have no row. Ordered by item, then day.
+        """
+        query = ConsumptionDaily.query.filter(
+            ConsumptionDaily.day >= start, ConsumptionDaily.day < end
+        )
+        if item_id is not None:
+            query = query.filter(ConsumptionDaily.item_id == item_id)
+        if kitchen_id is not None:
+            query = query.join(Item, Item.id == ConsumptionDaily.item_id).filter(
+                Item.kitchen_id == kitchen_id
+            )
+        return query.order_by(ConsumptionDaily.item_id, ConsumptionDaily.day).all()
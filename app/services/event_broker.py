@@ -0,0 +1,155 @@
+"""
+In-process fan-out of kitchen events to live subscribers.
+
+Services write events to the ``kitchen_events`` outbox inside their own
+transactions (see KitchenEventService.publish). Each worker process runs one
+EventBroker whose poller thread reads new outbox rows for the kitchens that
+have subscribers and copies them into the subscribers' queues. Because every
+worker reads the same table, an event committed by one gunicorn worker
+reaches clients connected to any other; a commit in this process wakes the
+poller immediately instead of waiting for the next interval.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+
+from flask import Flask, current_app, has_app_context
+from sqlalchemy import event as sa_event
+
+from app.extensions import db
+from app.models.kitchen_event import KitchenEvent
+from app.services.kitchen_event_service import PENDING_EVENTS_KEY, KitchenEventService
+
+
+def format_sse(event: KitchenEvent) -> str:
+    """Render an event as a Server-Sent Events message."""
+    data = json.dumps(event.to_dict(), separators=(",", ":"))
+    return f"id: {event.id}\nevent: {event.type}\ndata: {data}\n\n"
+
+
+class Subscription:
+    """A bounded queue of rendered SSE messages for one client."""
+
+    def __init__(self, kitchen_id: int, maxsize: int):
+        self.kitchen_id = kitchen_id
+        self.queue: queue.Queue[tuple[int, str]] = queue.Queue(maxsize)
+        # Set when the broker drops a client that is not keeping up; the
+        # client reconnects with Last-Event-ID and replays from the table.
+        self.closed = False
+
+
+class EventBroker:
+    def __init__(self, app: Flask | None = None):
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._subscribers: dict[int, set[Subscription]] = {}
+        self._cursors: dict[int, int] = {}
+        self._thread: threading.Thread | None = None
+        self.app = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.app = app
+        self.poll_interval = app.config["EVENT_POLL_INTERVAL"]
+        self.queue_size = app.config["EVENT_QUEUE_SIZE"]
+        self.batch_size = app.config["EVENT_POLL_BATCH_SIZE"]
+        self.poller_enabled = app.config["EVENT_POLLER_ENABLED"]
+        app.extensions["event_broker"] = self
+
+    def subscribe(self, kitchen_id: int) -> Subscription:
+        """Register a subscriber for events committed after this call."""
+        subscription = Subscription(kitchen_id, self.queue_size)
+        last_id = KitchenEventService.get_last_event_id(kitchen_id)
+        with self._lock:
+            if kitchen_id not in self._subscribers:
+                self._subscribers[kitchen_id] = set()
+                self._cursors[kitchen_id] = last_id
+            self._subscribers[kitchen_id].add(subscription)
+        self._ensure_started()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.kitchen_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.kitchen_id]
+                del self._cursors[subscription.kitchen_id]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def notify(self) -> None:
+        """Wake the poller now instead of at the next interval."""
+        self._wakeup.set()
+
+    def poll_once(self) -> int:
+        """Deliver new outbox events to subscribers; return how many were read."""
+        with self._poll_lock:
+            with self._lock:
+                cursors = dict(self._cursors)
+            if not cursors:
+                return 0
+
+            events = KitchenEventService.get_events_for_kitchens(cursors, limit=self.batch_size)
+            messages = [(event.kitchen_id, event.id, format_sse(event)) for event in events]
+            # Release the connection before fanning out; the pool is shared
+            # with request handlers.
+            db.session.remove()
+
+            with self._lock:
+                for kitchen_id, event_id, message in messages:
+                    if kitchen_id not in self._cursors:
+                        continue
+                    self._cursors[kitchen_id] = max(self._cursors[kitchen_id], event_id)
+                    for subscription in list(self._subscribers[kitchen_id]):
+                        try:
+                            subscription.queue.put_nowait((event_id, message))
+                        except queue.Full:
+                            subscription.closed = True
+                            self._subscribers[kitchen_id].discard(subscription)
+            return len(messages)
+
+    def _ensure_started(self) -> None:
+        if not self.poller_enabled:
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="kitchen-event-poller", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            try:
+                with self.app.app_context():
+                    # A full batch means more rows are waiting; keep reading.
+                    while self.poll_once() >= self.batch_size:
+                        pass
+            except Exception:  # pragma: no cover - keep the poller alive
+                self.app.logger.exception("Kitchen event poll failed")
+
+
+@sa_event.listens_for(db.session, "after_commit")
+def _notify_broker(session) -> None:
+    if session.info.pop(PENDING_EVENTS_KEY, False) and has_app_context():
+        broker = current_app.extensions.get("event_broker")
+        if broker is not None:
+            broker.notify()
+
+
+@sa_event.listens_for(db.session, "after_rollback")
+def _clear_pending(session) -> None:
+    session.info.pop(PENDING_EVENTS_KEY, None)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterator
+from typing import IO
+
+from sqlalchemy import insert
+
+from app.extensions import db
+from app.models.item import Item, ItemStatus
+from app.models.kitchen import Kitchen
+from app.services.kitchen_event_service import KitchenEventService
+from app.services.kitchen_version_service import KitchenVersionService
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+
+class ImportKitchenNotFound(ValueError):
+    """Raised when the target kitchen of an import does not exist."""
+
+
+class ImportFileError(ValueError):
+    """Raised when the file stops being readable part way through an import.
+
+    Rows before the unreadable part are imported; ``imported`` says how many.
+    """
+
+    def __init__(self, message: str, imported: int):
+        super().__init__(f"{message} ({imported} item(s) imported before the error)")
+        self.imported = imported
+
+
+class ItemImportService:
+    @staticmethod
+    def _iter_records(stream: IO[bytes], fmt: str) -> Iterator[tuple[int, dict | None]]:
+        """Yield (row number, record) pairs, with record None when a row cannot be parsed."""
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        try:
+            if fmt == "csv":
+                reader = csv.DictReader(text)
+                for record in reader:
+                    yield reader.line_num, record
+            else:
+                for line_no, line in enumerate(text, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        yield line_no, None
+                        continue
+                    yield line_no, record if isinstance(record, dict) else None
+        finally:
+            # Leave the caller's stream open.
+            text.detach()
+
+    @staticmethod
+    def _parse_percent(value, default: float) -> float:
+        if value is None or value == "":
+            return default
+        if isinstance(value, bool):
+            raise ValueError
+        number = float(value)
+        if not (0 <= number <= 100):
+            raise ValueError
+        return number
+
+    @staticmethod
+    def validate_record(record: dict) -> tuple[dict | None, dict]:
+        """Validate one record against the Item columns; return (values, errors)."""
+        errors = {}
+        columns = Item.__table__.c
+
+        name = record.get("name")
+        name = name.strip() if isinstance(name, str) else name
+        if not name:
+            errors["name"] = "name is required"
+        elif not isinstance(name, str) or len(name) > columns.name.type.length:
+            errors["name"] = f"name must be at most {columns.name.type.length} characters"
+
+        category = record.get("category") or None
+        if category is not None and (
+            not isinstance(category, str) or len(category) > columns.category.type.length
+        ):
+            errors["category"] = (
+                f"category must be at most {columns.category.type.length} characters"
+            )
+
+        values = {}
+        for field, default in (("quantity_percent", 100.0), ("low_stock_threshold", 20.0)):
+            try:
+                values[field] = ItemImportService._parse_percent(record.get(field), default)
+            except (TypeError, ValueError):
+                errors[field] = f"{field} must be a number between 0 and 100"
+
+        status = record.get("status") or ItemStatus.IN_STOCK.value
+        try:
+            values["status"] = ItemStatus(status)
+        except ValueError:
+            errors["status"] = "status must be 'needed' or 'in_stock'"
+
+        if errors:
+            return None, errors
+        values.update(name=name, category=category)
+        return values, errors
+
+    @staticmethod
+    def import_items(
+        kitchen_id: int,
+        stream: IO[bytes],
+        fmt: str,
+        batch_size: int = 500,
+        max_errors: int = 100,
+    ) -> dict:
+        """Stream-parse CSV or NDJSON rows and bulk-insert valid items in batches.
+
+        Each batch is inserted with one multi-row INSERT and committed, so
+        memory stays bounded by ``batch_size`` whatever the file size. Invalid
+        rows are skipped and reported; at most ``max_errors`` are listed.
+        Raises ImportKitchenNotFound for a missing kitchen and ImportFileError
+        if the file cannot be decoded or parsed as a whole.
+        """
+        if fmt not in IMPORT_FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}")
+        if db.session.get(Kitchen, kitchen_id) is None:
+            raise ImportKitchenNotFound("Kitchen not found")
+
+        report = {"imported": 0, "failed": 0, "errors": [], "errors_truncated": False}
+        batch: list[dict] = []
+
+        def flush():
+            if batch:
+                version = KitchenVersionService.bump(kitchen_id)
+                db.session.execute(insert(Item), [{**row, "version": version} for row in batch])
+                KitchenEventService.publish(
+                    kitchen_id, "items.changed", {"reason": "import", "count": len(batch)}, version
+                )
+                db.session.commit()
+                report["imported"] += len(batch)
+                batch.clear()
+
+        try:
+            for row, record in ItemImportService._iter_records(stream, fmt):
+                if record is None:
+                    values, errors = None, {"row": "row could not be parsed"}
+                else:
+                    values, errors = ItemImportService.validate_record(record)
+
+                if errors:
+                    report["failed"] += 1
+                    if len(report["errors"]) < max_errors:
+                        report["errors"].append({"row": row, "errors": errors})
+                    else:
+                        report["errors_truncated"] = True
+                    continue
+
+                batch.append({**values, "kitchen_id": kitchen_id})
+                if len(batch) >= batch_size:
+                    flush()
+        except UnicodeDecodeError as exc:
+            # Text is decoded in chunks, so the failing row is not known exactly.
+            flush()
+            raise ImportFileError("File is not valid UTF-8", report["imported"]) from exc
+        except csv.Error as exc:
+            flush()
+            raise ImportFileError(f"Malformed CSV: {exc}", report["imported"]) from exc
+
+        flush()
+        return report
@@ -1,10 +1,48 @@
 from __future__ import annotations
 
+from sqlalchemy import and_, func, or_, select
+
 from app.extensions import db
 from app.models.item import Item, ItemStatus
+from app.models.item_tombstone import ItemTombstone
+from app.services.kitchen_event_service import KitchenEventService
+from app.services.kitchen_version_service import KitchenVersionService
+from app.services.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    keyset_order,
+    prefix_pattern,
+    split_page,
+)
 
 
 class ItemService:
+    # Sort keys accepted by get_items_by_kitchen; a leading "-" sorts descending.
+    SORT_COLUMNS = {
+        "id": Item.id,
+        "name": Item.name,
+        "quantity": Item.quantity_percent,
+    }
+
+    @staticmethod
+    def _apply_filters(
+        query,
+        status: ItemStatus | None = None,
+        category: str | None = None,
+        name_prefix: str | None = None,
+        low_stock: bool = False,
+    ):
+        if status is not None:
+            query = query.filter(Item.status == status)
+        if category is not None:
+            query = query.filter(Item.category == category)
+        if name_prefix:
+            query = query.filter(Item.name.like(prefix_pattern(name_prefix), escape="\\"))
+        if low_stock:
+            query = query.filter(Item.quantity_percent <= Item.low_stock_threshold)
+        return query
+
     @staticmethod
     def create_item(
         name: str,
@@ -15,6 +53,7 @@ class ItemService:
         status: ItemStatus = ItemStatus.IN_STOCK,
     ) -> Item:
         """Create a new item."""
+        version = KitchenVersionService.bump(kitchen_id)
         item = Item(
             name=name,
             kitchen_id=kitchen_id,
@@ -22,8 +61,12 @@ class ItemService:
             quantity_percent=quantity_percent,
             low_stock_threshold=low_stock_threshold,
             status=status,
+            version=version or 0,
         )
         db.session.add(item)
+        if version is not None:
+            db.session.flush()
+            KitchenEventService.publish(kitchen_id, "item.created", item.to_dict(), version)
         db.session.commit()
         return item
 
@@ -33,9 +76,81 @@ class ItemService:
         return Item.query.get(item_id)
 
     @staticmethod
-    def get_items_by_kitchen(kitchen_id: int) -> list[Item]:
-        """Get all items for a kitchen."""
-        return Item.query.filter_by(kitchen_id=kitchen_id).all()
+    def get_items_by_kitchen(
+        kitchen_id: int,
+        limit: int | None = None,
+        cursor: str | None = None,
+        sort: str = "id",
+        status: ItemStatus | None = None,
+        category: str | None = None,
+        name_prefix: str | None = None,
+        low_stock: bool = False,
+    ) -> list[Item]:
+        """Get a kitchen's items, filtered and sorted in SQL, optionally one keyset page at a time.
+
+        ``sort`` is a key of SORT_COLUMNS, optionally prefixed with "-"; ties
+        are broken by id. ``cursor`` is an opaque value produced by
+        ``cursor_for`` with the same sort; it raises ValueError if it is
+        malformed, belongs to another kitchen or was issued for another sort.
+        """
+        descending = sort.startswith("-")
+        column = ItemService.SORT_COLUMNS.get(sort.lstrip("-"))
+        if column is None:
+            raise ValueError(f"Unknown sort: {sort}")
+
+        query = ItemService._apply_filters(
+            Item.query.filter_by(kitchen_id=kitchen_id),
+            status=status,
+            category=category,
+            name_prefix=name_prefix,
+            low_stock=low_stock,
+        )
+
+        # Sorting by id needs no secondary key.
+        keyset_column = None if column is Item.id else column
+        if cursor:
+            values = decode_cursor(cursor)
+            if (
+                values.get("k") != kitchen_id
+                or values.get("s", "id") != sort
+                or not isinstance(values.get("id"), int)
+            ):
+                raise ValueError("Invalid cursor")
+            query = query.filter(
+                keyset_after(keyset_column, Item.id, values.get("v"), values["id"], descending)
+            )
+
+        query = query.order_by(*keyset_order(keyset_column, Item.id, descending))
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    @staticmethod
+    def cursor_for(item: Item, sort: str = "id") -> str:
+        """Build the cursor that resumes a listing (in the given sort) after the given item."""
+        values = {"k": item.kitchen_id, "id": item.id}
+        if sort != "id":
+            values["s"] = sort
+            values["v"] = getattr(item, ItemService.SORT_COLUMNS[sort.lstrip("-")].key)
+        return encode_cursor(values)
+
+    @staticmethod
+    def count_items_by_kitchen(
+        kitchen_id: int,
+        status: ItemStatus | None = None,
+        category: str | None = None,
+        name_prefix: str | None = None,
+        low_stock: bool = False,
+    ) -> int:
+        """Count a kitchen's items matching the filters without loading them."""
+        query = ItemService._apply_filters(
+            select(func.count()).select_from(Item).where(Item.kitchen_id == kitchen_id),
+            status=status,
+            category=category,
+            name_prefix=name_prefix,
+            low_stock=low_stock,
+        )
+        return db.session.scalar(query)
 
     @staticmethod
     def update_item(
@@ -51,6 +166,8 @@ class ItemService:
         if not item:
             return None
 
+        # Lock the kitchen row before any item change is flushed.
+        version = KitchenVersionService.bump(item.kitchen_id)
         if name is not None:
             item.name = name
         if category is not None:
@@ -61,7 +178,10 @@ class ItemService:
             item.low_stock_threshold = low_stock_threshold
         if status is not None:
             item.status = status
+        item.version = version
 
+        db.session.flush()
+        KitchenEventService.publish(item.kitchen_id, "item.updated", item.to_dict(), item.version)
         db.session.commit()
         return item
 
@@ -71,6 +191,9 @@ class ItemService:
         item = Item.query.get(item_id)
         if not item:
             return False
+        version = KitchenVersionService.bump(item.kitchen_id)
+        db.session.add(ItemTombstone(item_id=item.id, kitchen_id=item.kitchen_id, version=version))
+        KitchenEventService.publish(item.kitchen_id, "item.deleted", {"id": item.id}, version)
         db.session.delete(item)
         db.session.commit()
         return True
@@ -82,6 +205,8 @@ class ItemService:
         if not item:
             return None
 
+        # Lock the kitchen row before any item change is flushed.
+        version = KitchenVersionService.bump(item.kitchen_id)
         item.quantity_percent = max(0.0, min(100.0, quantity_percent))
 
         # Auto-update status based on quantity
@@ -89,6 +214,74 @@ class ItemService:
             item.status = ItemStatus.NEEDED
         elif item.quantity_percent >= 100:
             item.status = ItemStatus.IN_STOCK
+        item.version = version
 
+        db.session.flush()
+        KitchenEventService.publish(item.kitchen_id, "item.updated", item.to_dict(), item.version)
         db.session.commit()
         return item
+
+    @staticmethod
+    def get_item_changes(kitchen_id: int, cursor: str | None = None, limit: int = 100) -> dict:
+        """Return a kitchen's item changes since ``cursor``, oldest first.
+
+        Changes are ordered by (version, id): items whose version is past the
+        cursor and tombstones of items deleted since. The result holds the
+        changed ``items``, the ``deleted`` tombstones, ``has_more`` and the
+        ``next_cursor`` to pass on the next call; without a cursor every live
+        item is returned. Raises ValueError for a malformed cursor.
+        """
+        last_version, last_id = 0, 0
+        if cursor:
+            values = decode_cursor(cursor)
+            if (
+                values.get("k") != kitchen_id
+                or not isinstance(values.get("v"), int)
+                or not isinstance(values.get("id"), int)
+            ):
+                raise ValueError("Invalid cursor")
+            last_version, last_id = values["v"], values["id"]
+
+        items = (
+            Item.query.filter(
+                Item.kitchen_id == kitchen_id,
+                or_(
+                    Item.version > last_version,
+                    and_(Item.version == last_version, Item.id > last_id),
+                ),
+            )
+            .order_by(Item.version, Item.id)
+            .limit(limit + 1)
+            .all()
+        )
+        # A delete bumps the version on its own, so tombstones never share a
+        # version with item changes and need no id tie-break.
+        tombstones = []
+        if cursor:
+            tombstones = (
+                ItemTombstone.query.filter(
+                    ItemTombstone.kitchen_id == kitchen_id,
+                    ItemTombstone.version > last_version,
+                )
+                .order_by(ItemTombstone.version)
+                .limit(limit + 1)
+                .all()
+            )
+
+        changes = sorted(
+            [(item.version, item.id, item) for item in items]
+            + [(tombstone.version, 0, tombstone) for tombstone in tombstones],
+            key=lambda change: change[:2],
+        )
+        page, has_more = split_page(changes, limit)
+        if page:
+            last_version, last_id = page[-1][:2]
+        elif not cursor:
+            last_version = KitchenVersionService.get_version(kitchen_id) or 0
+
+        return {
+            "items": [change for _, _, change in page if isinstance(change, Item)],
+            "deleted": [change for _, _, change in page if isinstance(change, ItemTombstone)],
+            "has_more": has_more,
+            "next_cursor": encode_cursor({"k": kitchen_id, "v": last_version, "id": last_id}),
+        }
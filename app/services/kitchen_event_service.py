@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from sqlalchemy import and_, delete, func, or_, select
+
+from app.extensions import db
+from app.models.kitchen_event import KitchenEvent
+
+# Session.info flag telling the after-commit hook that events were written.
+PENDING_EVENTS_KEY = "kitchen_events_pending"
+
+# Salt separating stream tickets from anything else signed with the JWT secret.
+STREAM_TICKET_SALT = "kitchen-event-stream"
+
+
+class KitchenEventService:
+    @staticmethod
+    def publish(kitchen_id: int, event_type: str, payload: dict, version: int) -> KitchenEvent:
+        """Add an event to the current transaction (transactional outbox).
+
+        Call it after KitchenVersionService.bump in the same transaction: the
+        kitchen row lock then orders a kitchen's event ids by commit order,
+        which is what lets the broker follow each kitchen with a plain
+        ``id > last`` cursor.
+        """
+        event = KitchenEvent(
+            kitchen_id=kitchen_id, type=event_type, payload=payload, version=version
+        )
+        db.session.add(event)
+        db.session.info[PENDING_EVENTS_KEY] = True
+        return event
+
+    @staticmethod
+    def _ticket_serializer() -> URLSafeTimedSerializer:
+        return URLSafeTimedSerializer(current_app.config["JWT_SECRET_KEY"], salt=STREAM_TICKET_SALT)
+
+    @staticmethod
+    def create_stream_ticket(user_id: int, kitchen_id: int) -> str:
+        """Sign a ticket that opens one kitchen's event stream for EVENT_TICKET_SECONDS.
+
+        EventSource cannot send an Authorization header, and an access token
+        in the URL would end up in access and proxy logs. A ticket is only
+        good for this kitchen's stream and expires quickly.
+        """
+        return KitchenEventService._ticket_serializer().dumps({"u": user_id, "k": kitchen_id})
+
+    @staticmethod
+    def verify_stream_ticket(ticket: str, kitchen_id: int) -> int | None:
+        """Return the ticket's user id if it is valid for this kitchen and unexpired."""
+        try:
+            values = KitchenEventService._ticket_serializer().loads(
+                ticket, max_age=current_app.config["EVENT_TICKET_SECONDS"]
+            )
+        except BadSignature:
+            return None
+        if not isinstance(values, dict) or values.get("k") != kitchen_id:
+            return None
+        return values.get("u")
+
+    @staticmethod
+    def get_events_since(kitchen_id: int, after_id: int, limit: int = 1000) -> list[KitchenEvent]:
+        """Get a kitchen's events with id greater than after_id, oldest first."""
+        return (
+            KitchenEvent.query.filter(
+                KitchenEvent.kitchen_id == kitchen_id, KitchenEvent.id > after_id
+            )
+            .order_by(KitchenEvent.id)
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def get_events_for_kitchens(cursors: dict[int, int], limit: int = 1000) -> list[KitchenEvent]:
+        """Get events past each kitchen's cursor, oldest first, in one query.
+
+        Each kitchen is its own ``(kitchen_id, id)`` index range; a single
+        global ``id > n`` bound is not safe because ids from different
+        kitchens can commit out of order.
+        """
+        if not cursors:
+            return []
+        return (
+            KitchenEvent.query.filter(
+                or_(
+                    *(
+                        and_(KitchenEvent.kitchen_id == kitchen_id, KitchenEvent.id > after_id)
+                        for kitchen_id, after_id in cursors.items()
+                    )
+                )
+            )
+            .order_by(KitchenEvent.id)
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def get_last_event_id(kitchen_id: int) -> int:
+        """Get the id of a kitchen's latest event, or 0 if it has none."""
+        return (
+            db.session.scalar(
+                select(func.max(KitchenEvent.id)).where(KitchenEvent.kitchen_id == kitchen_id)
+            )
+            or 0
+        )
+
+    @staticmethod
+    def prune_events(before: datetime, batch_size: int = 1000) -> int:
+        """Delete events created before ``before`` in bounded batches; return the count."""
+        deleted = 0
+        while True:
+            ids = list(
+                db.session.scalars(
+                    select(KitchenEvent.id)
+                    .where(KitchenEvent.created_at < before)
+                    .order_by(KitchenEvent.id)
+                    .limit(batch_size)
+                )
+            )
+            if not ids:
+                return deleted
+            db.session.execute(delete(KitchenEvent).where(KitchenEvent.id.in_(ids)))
+            db.session.commit()
+            deleted += len(ids)
@@ -1,28 +1,83 @@
 from __future__ import annotations
 
 import secrets
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from app.extensions import db
+from app.models.item_tombstone import ItemTombstone
 from app.models.kitchen import Kitchen
+from app.models.kitchen_event import KitchenEvent
+from app.services.kitchen_event_service import KitchenEventService
+from app.services.kitchen_version_service import KitchenVersionService
+from app.services.lookup_cache import kitchen_cache
+from app.services.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    keyset_order,
+    prefix_pattern,
+)
+
+CODE_SPACE = 1_000_000
+# Codes read per window probe: one short range scan of the unique index.
+CODE_WINDOW = 1024
+# Random codes tried before probing windows; usually enough while the
+# code space is mostly empty, and cheaper than a window read.
+CODE_BLIND_ATTEMPTS = 1
+CODE_MAX_ATTEMPTS = 10
+
+
+class KitchenCodeUnavailable(Exception):
+    """Raised when no free kitchen code was found within CODE_MAX_ATTEMPTS."""
 
 
 class KitchenService:
     @staticmethod
-    def generate_unique_code() -> str:
-        """Generate a unique 6-digit kitchen code."""
-        while True:
-            code = f"{secrets.randbelow(1000000):06d}"
-            if not Kitchen.query.filter_by(code=code).first():
-                return code
+    def generate_unique_code() -> str | None:
+        """Pick a code that is free now from a random window of the code space.
+
+        Returns None if the sampled window is full. The code can still be
+        taken by a concurrent insert; create_kitchen relies on the unique
+        index for that.
+        """
+        start = secrets.randbelow(-(-CODE_SPACE // CODE_WINDOW)) * CODE_WINDOW
+        end = min(start + CODE_WINDOW, CODE_SPACE) - 1
+        taken = set(
+            db.session.scalars(
+                select(Kitchen.code).where(Kitchen.code.between(f"{start:06d}", f"{end:06d}"))
+            )
+        )
+        free = [code for code in range(start, end + 1) if f"{code:06d}" not in taken]
+        return f"{secrets.choice(free):06d}" if free else None
 
     @staticmethod
     def create_kitchen(name: str) -> Kitchen:
-        """Create a new kitchen with a unique code."""
-        code = KitchenService.generate_unique_code()
-        kitchen = Kitchen(code=code, name=name)
-        db.session.add(kitchen)
-        db.session.commit()
-        return kitchen
+        """Create a new kitchen with a unique code.
+
+        Inserts a random code and lets the unique index reject duplicates,
+        falling back to codes known to be free in a sampled window. Each
+        attempt costs at most one range read and one insert, and there are at
+        most CODE_MAX_ATTEMPTS of them however full the code space is.
+        """
+        for attempt in range(CODE_MAX_ATTEMPTS):
+            if attempt < CODE_BLIND_ATTEMPTS:
+                code = f"{secrets.randbelow(CODE_SPACE):06d}"
+            else:
+                code = KitchenService.generate_unique_code()
+                if code is None:
+                    continue
+            kitchen = Kitchen(code=code, name=name)
+            try:
+                with db.session.begin_nested():
+                    db.session.add(kitchen)
+            except IntegrityError:
+                continue
+            db.session.commit()
+            return kitchen
+        raise KitchenCodeUnavailable("No free kitchen code found")
 
     @staticmethod
     def get_kitchen_by_id(kitchen_id: int) -> Kitchen | None:
@@ -35,9 +90,75 @@ class KitchenService:
         return Kitchen.query.filter_by(code=code).first()
 
     @staticmethod
-    def get_all_kitchens() -> list[Kitchen]:
-        """Get all kitchens."""
-        return Kitchen.query.all()
+    def get_cached_kitchen_by_code(code: str) -> dict | None:
+        """Get a kitchen's dict by code, served from the lookup cache when possible."""
+
+        def load():
+            kitchen = KitchenService.get_kitchen_by_code(code)
+            return kitchen.to_dict() if kitchen else None
+
+        return kitchen_cache.get_or_load(code, load)
+
+    SORT_COLUMNS = {"id": Kitchen.id, "name": Kitchen.name, "created_at": Kitchen.created_at}
+
+    @staticmethod
+    def get_all_kitchens(
+        limit: int | None = None,
+        cursor: str | None = None,
+        sort: str = "id",
+        name_prefix: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> list[Kitchen]:
+        """Get kitchens, filtered in SQL, optionally one keyset page at a time.
+
+        ``created_from`` is inclusive and ``created_to`` exclusive. ``sort``
+        is a key of SORT_COLUMNS, optionally prefixed with "-"; ``cursor``
+        comes from ``cursor_for`` with the same sort and raises ValueError if
+        it is malformed or was issued for another sort.
+        """
+        descending = sort.startswith("-")
+        column = KitchenService.SORT_COLUMNS.get(sort.lstrip("-"))
+        if column is None:
+            raise ValueError(f"Unknown sort: {sort}")
+
+        query = Kitchen.query
+        if name_prefix:
+            query = query.filter(Kitchen.name.like(prefix_pattern(name_prefix), escape="\\"))
+        if created_from is not None:
+            query = query.filter(Kitchen.created_at >= created_from)
+        if created_to is not None:
+            query = query.filter(Kitchen.created_at < created_to)
+
+        keyset_column = None if column is Kitchen.id else column
+        if cursor:
+            values = decode_cursor(cursor)
+            if values.get("s", "id") != sort or not isinstance(values.get("id"), int):
+                raise ValueError("Invalid cursor")
+            last_value = values.get("v")
+            if column is Kitchen.created_at:
+                try:
+                    last_value = datetime.fromisoformat(last_value)
+                except (TypeError, ValueError) as exc:
+                    raise ValueError("Invalid cursor") from exc
+            query = query.filter(
+                keyset_after(keyset_column, Kitchen.id, last_value, values["id"], descending)
+            )
+
+        query = query.order_by(*keyset_order(keyset_column, Kitchen.id, descending))
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    @staticmethod
+    def cursor_for(kitchen: Kitchen, sort: str = "id") -> str:
+        """Build the cursor that resumes a listing (in the given sort) after the given kitchen."""
+        values = {"id": kitchen.id}
+        if sort != "id":
+            value = getattr(kitchen, KitchenService.SORT_COLUMNS[sort.lstrip("-")].key)
+            values["s"] = sort
+            values["v"] = value.isoformat() if isinstance(value, datetime) else value
+        return encode_cursor(values)
 
     @staticmethod
     def update_kitchen(kitchen_id: int, name: str) -> Kitchen | None:
@@ -46,7 +167,10 @@ class KitchenService:
         if not kitchen:
             return None
         kitchen.name = name
+        version = KitchenVersionService.bump(kitchen_id)
+        KitchenEventService.publish(kitchen_id, "kitchen.updated", kitchen.to_dict(), version)
         db.session.commit()
+        kitchen_cache.invalidate(kitchen.code)
         return kitchen
 
     @staticmethod
@@ -55,6 +179,10 @@ class KitchenService:
         kitchen = Kitchen.query.get(kitchen_id)
         if not kitchen:
             return False
+        KitchenEvent.query.filter_by(kitchen_id=kitchen_id).delete()
+        ItemTombstone.query.filter_by(kitchen_id=kitchen_id).delete()
+        code = kitchen.code
         db.session.delete(kitchen)
         db.session.commit()
+        kitchen_cache.invalidate(code)
         return True
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import case, func, select
+
+from app.extensions import db
+from app.models.consumption_log import ConsumptionLog
+from app.models.item import Item, ItemStatus
+from app.models.restock_log import RestockLog
+from app.models.user_model import User
+from app.services.lookup_cache import summary_cache
+
+
+class KitchenSummaryService:
+    TOP_CONSUMERS = 5
+
+    @staticmethod
+    def get_summary(kitchen_id: int) -> dict:
+        """Get a kitchen's dashboard summary, served stale-while-revalidate from the cache."""
+        days = current_app.config["SUMMARY_CONSUMPTION_DAYS"]
+        return summary_cache.get_or_load(
+            kitchen_id, lambda: KitchenSummaryService.compute_summary(kitchen_id, days)
+        )
+
+    @staticmethod
+    def compute_summary(kitchen_id: int, days: int = 7) -> dict:
+        """Compute item counts, restock and consumption figures with aggregate queries."""
+        now = datetime.utcnow()
+        since = now - timedelta(days=days)
+
+        status_rows = db.session.execute(
+            select(
+                Item.status,
+                func.count(),
+                func.sum(case((Item.quantity_percent <= Item.low_stock_threshold, 1), else_=0)),
+            )
+            .where(Item.kitchen_id == kitchen_id)
+            .group_by(Item.status)
+        ).all()
+        items = {"total": 0, "low_stock": 0, **{status.value: 0 for status in ItemStatus}}
+        for status, count, low_stock in status_rows:
+            items[status.value] = count
+            items["total"] += count
+            items["low_stock"] += low_stock or 0
+
+        last_restock_at = db.session.scalar(
+            select(func.max(RestockLog.created_at))
+            .join(Item, Item.id == RestockLog.item_id)
+            .where(Item.kitchen_id == kitchen_id)
+        )
+
+        recent = (
+            select(ConsumptionLog.user_id, ConsumptionLog.percent_used)
+            .join(Item, Item.id == ConsumptionLog.item_id)
+            .where(Item.kitchen_id == kitchen_id, ConsumptionLog.created_at >= since)
+            .subquery()
+        )
+        per_user = db.session.execute(
+            select(
+                recent.c.user_id,
+                User.display_name,
+                func.count().label("count"),
+                func.sum(recent.c.percent_used).label("percent_used"),
+            )
+            .join(User, User.id == recent.c.user_id)
+            .group_by(recent.c.user_id, User.display_name)
+            .order_by(func.sum(recent.c.percent_used).desc(), recent.c.user_id)
+        ).all()
+
+        members = db.session.scalar(
+            select(func.count()).select_from(User).where(User.kitchen_id == kitchen_id)
+        )
+
+        return {
+            "kitchen_id": kitchen_id,
+            "items": items,
+            "last_restock_at": last_restock_at.isoformat() if last_restock_at else None,
+            "consumption": {
+                "days": days,
+                "count": sum(row.count for row in per_user),
+                "percent_used": round(sum(row.percent_used for row in per_user), 2),
+            },
+            "top_consumers": [
+                {
+                    "user_id": row.user_id,
+                    "display_name": row.display_name,
+                    "count": row.count,
+                    "percent_used": round(row.percent_used, 2),
+                }
+                for row in per_user[: KitchenSummaryService.TOP_CONSUMERS]
+            ],
+            "members": members,
+            "generated_at": now.isoformat(),
+        }
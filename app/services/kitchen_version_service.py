@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from sqlalchemy import select, update
+
+from app.extensions import db
+from app.models.kitchen import Kitchen
+
+
+class KitchenVersionService:
+    """Per-kitchen change counter.
+
+    Every write to a kitchen's items bumps ``kitchens.change_version`` inside
+    the same transaction and stamps the new value on the rows it touches.
+    The UPDATE holds the kitchen row lock until commit, so versions become
+    visible in commit order and a client that has seen version N has seen
+    every change up to N. Callers bump the kitchen before writing items so
+    locks are always taken kitchen-first.
+    """
+
+    @staticmethod
+    def bump(kitchen_id: int) -> int | None:
+        """Increment a kitchen's version; return the new value, or None if it does not exist."""
+        stmt = (
+            update(Kitchen)
+            .where(Kitchen.id == kitchen_id)
+            .values(change_version=Kitchen.change_version + 1)
+        )
+        options = {"synchronize_session": False}
+        if db.engine.dialect.update_returning:
+            return db.session.scalar(
+                stmt.returning(Kitchen.change_version), execution_options=options
+            )
+
+        result = db.session.execute(stmt, execution_options=options)
+        if result.rowcount == 0:
+            return None
+        return KitchenVersionService.get_version(kitchen_id)
+
+    @staticmethod
+    def bump_many(kitchen_ids: Iterable[int]) -> dict[int, int]:
+        """Bump several kitchens in id order (a stable lock order) and map id to new version."""
+        versions = {}
+        for kitchen_id in sorted(set(kitchen_ids)):
+            version = KitchenVersionService.bump(kitchen_id)
+            if version is not None:
+                versions[kitchen_id] = version
+        return versions
+
+    @staticmethod
+    def get_version(kitchen_id: int) -> int | None:
+        """Read a kitchen's current version with a primary-key lookup."""
+        return db.session.scalar(select(Kitchen.change_version).where(Kitchen.id == kitchen_id))
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import delete, func, select
+
+from app.extensions import db
+from app.models.consumption_log import ConsumptionLog
+from app.models.item import Item
+from app.models.log_archive import LogArchive
+from app.models.restock_log import RestockLog
+from app.services.kitchen_version_service import KitchenVersionService
+
+ARCHIVED_TABLES = {
+    ConsumptionLog.__tablename__: ConsumptionLog,
+    RestockLog.__tablename__: RestockLog,
+}
+
+
+class LogArchiveService:
+    """Move old consumption and restock logs out of the hot tables.
+
+    Each UTC day of a table is written to
+    ``<directory>/<table>/<YYYY>/<MM>/<table>-<YYYY-MM-DD>-<first id>.ndjson.gz``,
+    recorded in ``log_archives`` and only then deleted, in chunks of
+    ``chunk_size`` rows with a commit after each. A run that stops part way
+    leaves a manifest without ``deleted_at``; the next run finishes deleting
+    its rows before archiving anything new, so the job can be interrupted
+    and rerun at any point. ``consumption_daily`` rows are kept, and the
+    manifests hold the archived totals of every day.
+    """
+
+    @staticmethod
+    def cutoff(older_than_days: int, now: datetime | None = None) -> datetime:
+        """Start of the first UTC day that is kept: whole days before it are archived."""
+        now = now or datetime.utcnow()
+        return datetime.combine((now - timedelta(days=older_than_days)).date(), time.min)
+
+    @staticmethod
+    def _relative_path(table_name: str, day: date, first_id: int) -> str:
+        return os.path.join(
+            table_name,
+            f"{day:%Y}",
+            f"{day:%m}",
+            f"{table_name}-{day.isoformat()}-{first_id}.ndjson.gz",
+        )
+
+    @staticmethod
+    def _serialize(row) -> str:
+        record = {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in row._mapping.items()
+        }
+        return json.dumps(record, separators=(",", ":"))
+
+    @staticmethod
+    def _write_day(model, day_start: datetime, day_end: datetime, directory: str, chunk_size: int):
+        """Write one day of rows to a gzip NDJSON file; return its manifest, or None if empty."""
+        table = model.__table__
+        rows = db.session.execute(
+            select(table)
+            .where(table.c.created_at >= day_start, table.c.created_at < day_end)
+            .order_by(table.c.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        manifest = None
+        part_path = None
+        with_usage = "percent_used" in table.c
+        try:
+            for row in rows:
+                if manifest is None:
+                    manifest = LogArchive(
+                        table_name=table.name,
+                        day=day_start.date(),
+                        path=LogArchiveService._relative_path(table.name, day_start.date(), row.id),
+                        first_id=row.id,
+                        row_count=0,
+                        percent_used=0.0 if with_usage else None,
+                    )
+                    part_path = os.path.join(directory, manifest.path) + ".part"
+                    os.makedirs(os.path.dirname(part_path), exist_ok=True)
+                    out = gzip.open(part_path, "wt", encoding="utf-8")
+                out.write(LogArchiveService._serialize(row) + "\n")
+                manifest.last_id = row.id
+                manifest.row_count += 1
+                if with_usage:
+                    manifest.percent_used += row.percent_used
+        finally:
+            if manifest is not None:
+                out.close()
+        if manifest is None:
+            return None
+
+        # The rename makes a file appear complete or not at all.
+        os.replace(part_path, os.path.join(directory, manifest.path))
+        return manifest
+
+    @staticmethod
+    def _delete_archived(manifest: LogArchive, chunk_size: int) -> int:
+        """Delete a manifest's rows from the hot table, committing after every chunk."""
+        model = ARCHIVED_TABLES[manifest.table_name]
+        day_start = datetime.combine(manifest.day, time.min)
+        archived = (
+            model.id.between(manifest.first_id, manifest.last_id),
+            model.created_at >= day_start,
+            model.created_at < day_start + timedelta(days=1),
+        )
+        deleted = 0
+        while True:
+            ids = db.session.scalars(
+                select(model.id).where(*archived).order_by(model.id).limit(chunk_size)
+            ).all()
+            if not ids:
+                break
+            kitchen_ids = db.session.scalars(
+                select(Item.kitchen_id)
+                .distinct()
+                .join(model, model.item_id == Item.id)
+                .where(model.id.in_(ids))
+            ).all()
+            KitchenVersionService.bump_many(kitchen_ids)
+            db.session.execute(
+                delete(model).where(model.id.in_(ids)),
+                execution_options={"synchronize_session": False},
+            )
+            db.session.commit()
+            deleted += len(ids)
+
+        manifest.deleted_at = datetime.utcnow()
+        db.session.commit()
+        return deleted
+
+    @staticmethod
+    def archive(
+        older_than_days: int,
+        directory: str,
+        tables: list[str] | None = None,
+        chunk_size: int = 1000,
+        now: datetime | None = None,
+    ) -> dict:
+        """Archive and delete every whole day of logs older than ``older_than_days``.
+
+        Returns, per table, the days and rows archived and the rows deleted
+        (including rows left over by an interrupted run).
+        """
+        if older_than_days < 1:
+            raise ValueError("older_than_days must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        tables = list(tables or ARCHIVED_TABLES)
+        unknown = [name for name in tables if name not in ARCHIVED_TABLES]
+        if unknown:
+            raise ValueError(f"Cannot archive table(s): {', '.join(unknown)}")
+
+        cutoff = LogArchiveService.cutoff(older_than_days, now)
+        report = {}
+        for table_name in tables:
+            model = ARCHIVED_TABLES[table_name]
+            counts = {"days": 0, "archived": 0, "deleted": 0, "resumed": 0}
+
+            pending = (
+                LogArchive.query.filter(
+                    LogArchive.table_name == table_name, LogArchive.deleted_at.is_(None)
+                )
+                .order_by(LogArchive.day, LogArchive.first_id)
+                .all()
+            )
+            for manifest in pending:
+                counts["deleted"] += LogArchiveService._delete_archived(manifest, chunk_size)
+                counts["resumed"] += 1
+
+            while True:
+                oldest = db.session.scalar(
+                    select(func.min(model.created_at)).where(model.created_at < cutoff)
+                )
+                if oldest is None:
+                    break
+                day_start = datetime.combine(oldest.date(), time.min)
+                manifest = LogArchiveService._write_day(
+                    model,
+                    day_start,
+                    min(day_start + timedelta(days=1), cutoff),
+                    directory,
+                    chunk_size,
+                )
+                db.session.add(manifest)
+                db.session.commit()
+                counts["days"] += 1
+                counts["archived"] += manifest.row_count
+                counts["deleted"] += LogArchiveService._delete_archived(manifest, chunk_size)
+
+            report[table_name] = counts
+        return {"cutoff": cutoff.isoformat(), "tables": report}
+
+    @staticmethod
+    def last_archived_day(table_name: str) -> date | None:
+        """The latest day of ``table_name`` that has been archived, if any."""
+        return db.session.scalar(
+            select(func.max(LogArchive.day)).where(LogArchive.table_name == table_name)
+        )
+
+    @staticmethod
+    def get_archives(table_name: str | None = None) -> list[LogArchive]:
+        """List archive manifests, oldest day first."""
+        query = LogArchive.query
+        if table_name is not None:
+            query = query.filter(LogArchive.table_name == table_name)
+        return query.order_by(LogArchive.table_name, LogArchive.day, LogArchive.first_id).all()
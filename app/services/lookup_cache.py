@@ -0,0 +1,291 @@
+"""
+Bounded in-process caches for hot, rarely-changing lookups.
+
+Entries are plain dict snapshots, never ORM instances, so they are safe to
+share across sessions and threads. Each worker process has its own caches:
+a write invalidates the entry in the worker that made it, and other workers
+pick the change up when their entry expires after LOOKUP_CACHE_TTL seconds.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Flask, current_app
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
+
+from app.extensions import db
+from app.models.user_model import User
+
+_MISSING = object()
+
+# Session.info key collecting user ids to invalidate once the commit lands.
+_PENDING_USERS_KEY = "lookup_cache_users"
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after ``ttl`` seconds."""
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, object]] = OrderedDict()
+        # Bumped by every invalidation so a load that raced with a write does
+        # not store the value it read before the write.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, maxsize: int, ttl: float) -> None:
+        """Resize the cache, change its TTL and reset it; a TTL of 0 disables it."""
+        with self._lock:
+            self.maxsize = maxsize
+            self.ttl = ttl
+            self.hits = self.misses = self.evictions = 0
+        self.clear()
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value, generation: int | None = None) -> None:
+        with self._lock:
+            if self.ttl <= 0 or (generation is not None and generation != self._generation):
+                return
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], object]):
+        """Return the cached value for key, calling loader on a miss.
+
+        None results are not cached, so a row created after a miss is seen
+        by the next lookup.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            generation = self._generation
+        value = loader()
+        if value is not None:
+            self.set(key, value, generation)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+class StaleWhileRevalidateCache:
+    """LRU cache that keeps serving an expired entry while it is recomputed.
+
+    An entry is fresh for ``fresh`` seconds and served as-is. For ``stale``
+    seconds after that it is still served, and the first such read schedules
+    one background reload; only a missing or fully expired entry makes the
+    caller wait for its loader. Loaders run in an app context and must
+    return plain data, not ORM instances.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        fresh: float = 15.0,
+        stale: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, object]] = OrderedDict()
+        self._refreshing: set[Hashable] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self.configure(maxsize, fresh, stale)
+
+    def configure(self, maxsize: int, fresh: float, stale: float, background: bool = True) -> None:
+        """Resize the cache, change its windows and reset it.
+
+        With ``background=False`` stale entries are reloaded on the calling
+        thread after the stale value has been read; tests use this.
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            self.fresh = fresh
+            self.stale = stale
+            self.background = background
+            self._entries.clear()
+            self.hits = self.stale_hits = self.misses = self.refreshes = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], object]):
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.fresh:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None and now - entry[0] < self.fresh + self.stale:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                refresh = key not in self._refreshing
+                if refresh:
+                    self._refreshing.add(key)
+            else:
+                entry, refresh = None, False
+                self.misses += 1
+
+        if entry is None:
+            value = loader()
+            self._store(key, value)
+            return value
+        if refresh:
+            self._schedule_refresh(key, loader)
+        return entry[1]
+
+    def _store(self, key: Hashable, value) -> None:
+        if self.fresh <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _schedule_refresh(self, key: Hashable, loader: Callable[[], object]) -> None:
+        if not self.background:
+            self._refresh(None, key, loader)
+            return
+        app = current_app._get_current_object()
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"{self.name}-refresh"
+                )
+        self._executor.submit(self._refresh, app, key, loader)
+
+    def _refresh(self, app: Flask | None, key: Hashable, loader: Callable[[], object]) -> None:
+        try:
+            if app is None:
+                self._store(key, loader())
+            else:
+                with app.app_context():
+                    try:
+                        self._store(key, loader())
+                    finally:
+                        db.session.remove()
+            with self._lock:
+                self.refreshes += 1
+        except Exception:  # pragma: no cover - the stale value keeps being served
+            if app is not None:
+                app.logger.exception("Refreshing %s cache entry %r failed", self.name, key)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "fresh": self.fresh,
+                "stale": self.stale,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+            }
+
+
+kitchen_cache = TTLCache("kitchens_by_code")
+user_cache = TTLCache("users_by_id")
+summary_cache = StaleWhileRevalidateCache("kitchen_summaries")
+restock_interval_cache = TTLCache("restock_intervals")
+
+CACHES = (kitchen_cache, user_cache, summary_cache, restock_interval_cache)
+
+
+def init_lookup_caches(app: Flask) -> None:
+    """Size the caches from config and start them empty."""
+    for cache in (kitchen_cache, user_cache):
+        cache.configure(app.config["LOOKUP_CACHE_SIZE"], app.config["LOOKUP_CACHE_TTL"])
+    summary_cache.configure(
+        app.config["LOOKUP_CACHE_SIZE"],
+        app.config["SUMMARY_CACHE_FRESH_SECONDS"],
+        app.config["SUMMARY_CACHE_STALE_SECONDS"],
+        background=app.config["SUMMARY_CACHE_BACKGROUND_REFRESH"],
+    )
+    restock_interval_cache.configure(
+        app.config["LOOKUP_CACHE_SIZE"], app.config["RESTOCK_INTERVAL_CACHE_TTL"]
+    )
+
+
+def cache_stats() -> dict:
+    return {cache.name: cache.stats() for cache in CACHES}
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _queue_user_invalidation(mapper, connection, target) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_USERS_KEY, set()).add(target.id)
+
+
+@event.listens_for(db.session, "after_commit")
+def _invalidate_committed_users(session) -> None:
+    for user_id in session.info.pop(_PENDING_USERS_KEY, ()):
+        user_cache.invalidate(user_id)
+
+
+@event.listens_for(db.session, "after_rollback")
+def _discard_pending_users(session) -> None:
+    session.info.pop(_PENDING_USERS_KEY, None)
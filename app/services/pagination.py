@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(values: dict) -> str:
+    """Encode keyset values into an opaque, URL-safe cursor."""
+    raw = json.dumps(values, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, binascii.Error) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(values, dict):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def clamp_limit(
+    limit: int | None,
+    default: int = DEFAULT_PAGE_SIZE,
+    maximum: int = MAX_PAGE_SIZE,
+) -> int:
+    """Clamp a requested page size to the allowed range."""
+    if limit is None:
+        return default
+    return max(1, min(limit, maximum))
+
+
+def split_page(rows: list, limit: int) -> tuple[list, bool]:
+    """Trim a ``limit + 1`` result set to one page and report whether more rows exist."""
+    return rows[:limit], len(rows) > limit
+
+
+def keyset_after(column, id_column, last_value, last_id: int, descending: bool = False):
+    """Filter for rows after (last_value, last_id) in ``ORDER BY column, id``.
+
+    Pass ``column=None`` when the listing is ordered by id alone.
+    """
+    if column is None:
+        return id_column < last_id if descending else id_column > last_id
+    if descending:
+        return or_(column < last_value, and_(column == last_value, id_column < last_id))
+    return or_(column > last_value, and_(column == last_value, id_column > last_id))
+
+
+def keyset_order(column, id_column, descending: bool = False) -> list:
+    """ORDER BY clauses matching keyset_after."""
+    if column is None:
+        return [id_column.desc() if descending else id_column]
+    if descending:
+        return [column.desc(), id_column.desc()]
+    return [column, id_column]
+
+
+def newest_first_page(
+    query,
+    created_at,
+    id_column,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+):
+    """Restrict a log query to created_at in [start, end) and one page, newest first.
+
+    Rows are ordered by (created_at, id) descending and the cursor (from
+    ``created_at_cursor``) resumes after the last row of the previous page.
+    Besides the keyset condition the cursor adds ``created_at <= last``, a
+    plain bound the database can seek an index to, so a deep page reads
+    no more index entries than the first. Raises ValueError for a
+    malformed cursor.
+    """
+    if start is not None:
+        query = query.filter(created_at >= start)
+    if end is not None:
+        query = query.filter(created_at < end)
+    if cursor:
+        values = decode_cursor(cursor)
+        try:
+            last_value = datetime.fromisoformat(values["t"])
+            last_id = values["id"]
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+        if not isinstance(last_id, int):
+            raise ValueError("Invalid cursor")
+        query = query.filter(
+            created_at <= last_value,
+            keyset_after(created_at, id_column, last_value, last_id, descending=True),
+        )
+    query = query.order_by(*keyset_order(created_at, id_column, descending=True))
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def created_at_cursor(row) -> str:
+    """Cursor resuming a newest_first_page listing after ``row``."""
+    return encode_cursor({"t": row.created_at.isoformat(), "id": row.id})
+
+
+def prefix_pattern(prefix: str) -> str:
+    """LIKE pattern (with ``escape="\\"``) matching values that start with prefix."""
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
@@ -0,0 +1,100 @@
+"""
+Bounded worker pool for password hashing.
+
+Password hashes are deliberately expensive. The calling request still waits
+for its result, but all hashing goes through a small per-process pool: at
+most PASSWORD_HASH_WORKERS hashes run at once, at most
+PASSWORD_HASH_QUEUE_LIMIT more wait, and anything beyond that is refused
+immediately with PasswordHasherBusy so the caller can answer 503. A burst of
+logins therefore holds at most workers + queue limit request threads; keep
+that below the server's threads per process so cheap requests such as health
+checks still get one.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Flask, current_app
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+
+# Parameters werkzeug fills in when a method string omits them.
+_METHOD_DEFAULTS = {
+    "scrypt": ["32768", "8", "1"],
+    "pbkdf2": ["sha256", str(DEFAULT_PBKDF2_ITERATIONS)],
+}
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing pool and its queue are full."""
+
+
+def normalize_method(method: str) -> str:
+    """Expand a werkzeug method string to the explicit prefix stored in hashes."""
+    name, *params = method.split(":")
+    defaults = _METHOD_DEFAULTS.get(name, [])
+    return ":".join([name, *params, *defaults[len(params) :]])
+
+
+def _new_executor(workers: int):
+    """A pool of real OS threads, also when gevent has monkey-patched threading.
+
+    Under gunicorn's gevent worker a patched ThreadPoolExecutor would run
+    hashes on greenlets and stall every other request of the worker;
+    gevent's own pool uses native threads and waits cooperatively.
+    """
+    try:
+        from gevent import monkey
+    except ImportError:
+        monkey = None
+    if monkey is not None and monkey.is_module_patched("threading"):
+        from gevent.threadpool import ThreadPoolExecutor as NativeThreadPoolExecutor
+
+        return NativeThreadPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+
+
+class PasswordHasher:
+    def __init__(self, app: Flask | None = None):
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.method = normalize_method(app.config["PASSWORD_HASH_METHOD"])
+        self.workers = app.config["PASSWORD_HASH_WORKERS"]
+        self.queue_limit = app.config["PASSWORD_HASH_QUEUE_LIMIT"]
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_limit)
+        app.extensions["password_hasher"] = self
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy("Too many password operations in progress")
+        try:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = _new_executor(self.workers)
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+    def hash(self, password: str) -> str:
+        """Hash a password with the configured method."""
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash: str, password: str) -> bool:
+        """Check a password against a hash made with any supported method."""
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Whether a hash was made with parameters other than the configured ones."""
+        return password_hash.split("$", 1)[0] != self.method
+
+
+def get_password_hasher() -> PasswordHasher:
+    return current_app.extensions["password_hasher"]
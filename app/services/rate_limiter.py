@@ -0,0 +1,194 @@
+"""
+Token-bucket rate limiting for write requests.
+
+Limits are configured per namespace (the first path segment, e.g. ``auth``
+or ``consumptions``) in ``RATE_LIMITS``, each with optional ``ip``, ``user``
+and ``kitchen`` buckets written as ``"<count>/<second|minute|hour>"``. A
+bucket holds up to ``count`` tokens and refills continuously at
+``count / period``; every write request takes one token from each bucket
+that applies and is answered 429 with ``Retry-After`` when any is empty.
+
+Buckets live in process memory by default, so each gunicorn worker enforces
+its own share. Set ``RATE_LIMIT_STORAGE_URL`` to a ``redis://`` URL (and
+install ``redis``) to share them across workers and hosts.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from flask import Flask, jsonify, request
+from flask_jwt_extended import decode_token
+
+from app.services.lookup_cache import TTLCache
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+SCOPES = ("ip", "user", "kitchen")
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600}
+
+
+def parse_limit(limit: str) -> tuple[float, float]:
+    """Parse ``"10/minute"`` into (tokens per second, bucket capacity)."""
+    try:
+        count, period = limit.split("/")
+        count = float(count)
+        seconds = _PERIODS[period.strip().lower()]
+    except (KeyError, ValueError) as exc:
+        raise ValueError(f"Invalid rate limit: {limit!r}") from exc
+    if count <= 0:
+        raise ValueError(f"Invalid rate limit: {limit!r}")
+    return count / seconds, count
+
+
+class MemoryBucketStore:
+    """Token buckets in a dict, bounded to ``max_keys`` least recently used keys."""
+
+    def __init__(self, max_keys: int = 100_000, clock=time.monotonic):
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_keys = max_keys
+        self._clock = clock
+
+    def take(self, key: str, rate: float, capacity: float) -> float:
+        """Take one token; return 0 if allowed, else seconds until one is available."""
+        now = self._clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [capacity, now]
+                if len(self._buckets) > self._max_keys:
+                    # An evicted bucket comes back full, which only errs on
+                    # the side of letting requests through.
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return 0.0
+            return (1 - bucket[0]) / rate
+
+
+class RedisBucketStore:
+    """Token buckets in Redis, updated atomically by a Lua script."""
+
+    SCRIPT = """
+    local now = redis.call("TIME")
+    now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+    local rate = tonumber(ARGV[1])
+    local capacity = tonumber(ARGV[2])
+    local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated")
+    local tokens = tonumber(bucket[1]) or capacity
+    local updated = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+    local wait = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+    else
+        wait = (1 - tokens) / rate
+    end
+    redis.call("HSET", KEYS[1], "tokens", tokens, "updated", now)
+    redis.call("PEXPIRE", KEYS[1], math.ceil(capacity / rate * 1000))
+    return tostring(wait)
+    """
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("RATE_LIMIT_STORAGE_URL requires the 'redis' package") from exc
+        self._script = redis.Redis.from_url(url).register_script(self.SCRIPT)
+
+    def take(self, key: str, rate: float, capacity: float) -> float:
+        return float(self._script(keys=[f"ratelimit:{key}"], args=[rate, capacity]))
+
+
+class RateLimiter:
+    def __init__(self, app: Flask | None = None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.enabled = app.config["RATE_LIMIT_ENABLED"]
+        self.rules = {
+            namespace: {scope: parse_limit(limit) for scope, limit in limits.items() if limit}
+            for namespace, limits in app.config["RATE_LIMITS"].items()
+        }
+        for namespace, limits in self.rules.items():
+            unknown = set(limits) - set(SCOPES)
+            if unknown:
+                raise ValueError(f"Unknown rate limit scope(s) for {namespace}: {unknown}")
+
+        # Verifying a JWT signature costs far more than a bucket check, so
+        # the identity of each recently seen token is remembered.
+        self._tokens = TTLCache("rate_limit_tokens", maxsize=10_000, ttl=300)
+        url = app.config.get("RATE_LIMIT_STORAGE_URL")
+        self.store = RedisBucketStore(url) if url else MemoryBucketStore()
+        app.extensions["rate_limiter"] = self
+        app.before_request(self._before_request)
+
+    def _identity(self) -> tuple[str | None, int | None]:
+        """User id and kitchen id from a valid bearer token, if there is one."""
+        header = request.headers.get("Authorization", "")
+        if not header.startswith("Bearer "):
+            return None, None
+        token = header[7:]
+        identity = self._tokens.get(token)
+        if identity is None:
+            try:
+                claims = decode_token(token)
+            except Exception:
+                # Invalid tokens are rejected by jwt_required; only the IP bucket applies.
+                return None, None
+            identity = (claims.get("sub"), claims.get("kitchen_id"), claims.get("exp"))
+            self._tokens.set(token, identity)
+        user_id, kitchen_id, expires = identity
+        if expires is not None and expires <= time.time():
+            return None, None
+        return user_id, kitchen_id
+
+    def check(self, namespace: str, ip: str | None, user_id=None, kitchen_id=None):
+        """Take a token from each applicable bucket; return (scope, retry_after) if limited."""
+        rules = self.rules.get(namespace) or self.rules.get("default")
+        if not rules:
+            return None
+        for scope, subject in (("ip", ip), ("user", user_id), ("kitchen", kitchen_id)):
+            rule = rules.get(scope)
+            if rule is None or subject is None:
+                continue
+            wait = self.store.take(f"{namespace}:{scope}:{subject}", *rule)
+            if wait > 0:
+                return scope, wait
+        return None
+
+    def _before_request(self):
+        if not self.enabled or request.method not in WRITE_METHODS:
+            return None
+        namespace = request.path.strip("/").split("/", 1)[0]
+        rules = self.rules.get(namespace) or self.rules.get("default")
+        if not rules:
+            return None
+
+        user_id = kitchen_id = None
+        if "user" in rules or "kitchen" in rules:
+            user_id, kitchen_id = self._identity()
+        limited = self.check(namespace, request.remote_addr, user_id, kitchen_id)
+        if limited is None:
+            return None
+
+        scope, wait = limited
+        response = jsonify(
+            {
+                "code": "rate_limited",
+                "message": "Too many requests, retry later",
+                "scope": scope,
+            }
+        )
+        response.status_code = 429
+        response.headers["Retry-After"] = str(max(1, math.ceil(wait)))
+        return response
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+
+from sqlalchemy import and_, case, func, literal_column, or_, select
+from sqlalchemy.orm import aliased
+
+from app.extensions import db
+from app.models.item import Item
+from app.models.restock_log import RestockLog
+from app.services.kitchen_version_service import KitchenVersionService
+from app.services.lookup_cache import restock_interval_cache
+
+SECONDS_PER_DAY = 86400.0
+PERCENTILES = (50, 90)
+
+
+class RestockIntervalService:
+    """Time between consecutive restocks of each item in a kitchen.
+
+    Percentiles use the nearest-rank definition: the p-th percentile of n
+    sorted intervals is the one at rank ceil(p * n / 100).
+    """
+
+    @staticmethod
+    def supports_window_functions() -> bool:
+        """Whether the database can run LAG() / ROW_NUMBER() (SQLite 3.25+, MySQL 8+)."""
+        dialect = db.engine.dialect
+        if dialect.name == "sqlite":
+            return dialect.dbapi.sqlite_version_info >= (3, 25, 0)
+        if dialect.name == "mysql":
+            version = dialect.server_version_info or (0,)
+            return version >= ((10, 2) if getattr(dialect, "is_mariadb", False) else (8, 0))
+        return True
+
+    @staticmethod
+    def _seconds_between(start, end):
+        """SQL for the number of seconds from ``start`` to ``end``."""
+        dialect = db.engine.dialect.name
+        if dialect == "sqlite":
+            return (func.julianday(end) - func.julianday(start)) * SECONDS_PER_DAY
+        if dialect == "mysql":
+            return func.timestampdiff(literal_column("MICROSECOND"), start, end) / 1_000_000.0
+        return func.extract("epoch", end - start)
+
+    @staticmethod
+    def _to_dict(item_id, name, count, mean, variance, percentiles, minimum, maximum) -> dict:
+        def days(seconds: float) -> float:
+            return round(seconds / SECONDS_PER_DAY, 3)
+
+        return {
+            "item_id": item_id,
+            "name": name,
+            "restocks": count + 1,
+            "mean_days": days(mean),
+            "stddev_days": days(math.sqrt(max(variance, 0.0))),
+            **{
+                f"p{p}_days": days(value) for p, value in zip(PERCENTILES, percentiles, strict=True)
+            },
+            "min_days": days(minimum),
+            "max_days": days(maximum),
+        }
+
+    @staticmethod
+    def _compute_with_window_functions(kitchen_id: int) -> list[dict]:
+        """Aggregate every item's intervals in one statement."""
+        previous_at = func.lag(RestockLog.created_at).over(
+            partition_by=RestockLog.item_id, order_by=(RestockLog.created_at, RestockLog.id)
+        )
+        restocks = (
+            select(RestockLog.item_id, RestockLog.created_at, previous_at.label("previous_at"))
+            .join(Item, Item.id == RestockLog.item_id)
+            .where(Item.kitchen_id == kitchen_id)
+            .subquery()
+        )
+        intervals = (
+            select(
+                restocks.c.item_id,
+                RestockIntervalService._seconds_between(
+                    restocks.c.previous_at, restocks.c.created_at
+                ).label("seconds"),
+            )
+            .where(restocks.c.previous_at.is_not(None))
+            .subquery()
+        )
+        ranked = select(
+            intervals.c.item_id,
+            intervals.c.seconds,
+            func.row_number()
+            .over(partition_by=intervals.c.item_id, order_by=intervals.c.seconds)
+            .label("rank"),
+            func.count().over(partition_by=intervals.c.item_id).label("n"),
+        ).subquery()
+
+        seconds = ranked.c.seconds
+        rows = db.session.execute(
+            select(
+                ranked.c.item_id,
+                Item.name,
+                func.count(),
+                func.avg(seconds),
+                func.avg(seconds * seconds),
+                *(
+                    # The smallest interval at or past the nearest rank is the one at it.
+                    func.min(case((ranked.c.rank * 100 >= p * ranked.c.n, seconds)))
+                    for p in PERCENTILES
+                ),
+                func.min(seconds),
+                func.max(seconds),
+            )
+            .join(Item, Item.id == ranked.c.item_id)
+            .group_by(ranked.c.item_id, Item.name)
+            .order_by(ranked.c.item_id)
+        ).all()
+
+        results = []
+        for item_id, name, count, *aggregates in rows:
+            mean, mean_square, *percentiles, minimum, maximum = map(float, aggregates)
+            results.append(
+                RestockIntervalService._to_dict(
+                    item_id,
+                    name,
+                    count,
+                    mean,
+                    mean_square - mean * mean,
+                    percentiles,
+                    minimum,
+                    maximum,
+                )
+            )
+        return results
+
+    @staticmethod
+    def _compute_without_window_functions(kitchen_id: int) -> list[dict]:
+        """Find each restock's predecessor with a correlated subquery and aggregate in Python."""
+        earlier = aliased(RestockLog)
+        previous_at = (
+            select(func.max(earlier.created_at))
+            .where(
+                earlier.item_id == RestockLog.item_id,
+                # Order by (created_at, id) like LAG() so equal timestamps give one 0 interval.
+                or_(
+                    earlier.created_at < RestockLog.created_at,
+                    and_(earlier.created_at == RestockLog.created_at, earlier.id < RestockLog.id),
+                ),
+            )
+            .correlate(RestockLog)
+            .scalar_subquery()
+        )
+        restocks = (
+            select(
+                RestockLog.item_id,
+                Item.name,
+                RestockLog.created_at,
+                previous_at.label("previous_at"),
+            )
+            .join(Item, Item.id == RestockLog.item_id)
+            .where(Item.kitchen_id == kitchen_id)
+            .subquery()
+        )
+        rows = db.session.execute(
+            select(
+                restocks.c.item_id,
+                restocks.c.name,
+                RestockIntervalService._seconds_between(
+                    restocks.c.previous_at, restocks.c.created_at
+                ),
+            )
+            .where(restocks.c.previous_at.is_not(None))
+            .order_by(restocks.c.item_id)
+        ).all()
+
+        names: dict[int, str] = {}
+        intervals: dict[int, list[float]] = defaultdict(list)
+        for item_id, name, seconds in rows:
+            names[item_id] = name
+            intervals[item_id].append(float(seconds))
+
+        results = []
+        for item_id, values in intervals.items():
+            values.sort()
+            count = len(values)
+            mean = sum(values) / count
+            results.append(
+                RestockIntervalService._to_dict(
+                    item_id,
+                    names[item_id],
+                    count,
+                    mean,
+                    sum((value - mean) ** 2 for value in values) / count,
+                    [values[max(math.ceil(p * count / 100), 1) - 1] for p in PERCENTILES],
+                    values[0],
+                    values[-1],
+                )
+            )
+        return results
+
+    @staticmethod
+    def compute_intervals(kitchen_id: int) -> list[dict]:
+        """Interval statistics, in days, for each of a kitchen's items restocked at least twice."""
+        if RestockIntervalService.supports_window_functions():
+            return RestockIntervalService._compute_with_window_functions(kitchen_id)
+        return RestockIntervalService._compute_without_window_functions(kitchen_id)
+
+    @staticmethod
+    def get_intervals(kitchen_id: int) -> list[dict]:
+        """Get a kitchen's restock interval statistics, cached per kitchen version.
+
+        The key includes ``kitchens.change_version``, which every restock and
+        restock deletion bumps, so a write in any worker makes the next read
+        recompute; only the version lookup runs on a hit.
+        """
+        key = (kitchen_id, KitchenVersionService.get_version(kitchen_id))
+        return restock_interval_cache.get_or_load(
+            key, lambda: RestockIntervalService.compute_intervals(kitchen_id)
+        )
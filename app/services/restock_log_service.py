@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from datetime import datetime
+
+from sqlalchemy import case, insert, select, update
+
 from app.extensions import db
 from app.models.item import Item, ItemStatus
 from app.models.restock_log import RestockLog
+from app.services.kitchen_event_service import KitchenEventService
+from app.services.kitchen_version_service import KitchenVersionService
+from app.services.pagination import newest_first_page
 
 
 class RestockLogService:
+    BULK_FILTERS = ("needed", "below_threshold", "all")
+
     @staticmethod
     def create_restock_log(user_id: int, item_id: int) -> RestockLog | None:
         """Create a new restock log and update item to full stock."""
@@ -13,6 +23,9 @@ class RestockLogService:
         if not item:
             return None
 
+        # Lock the kitchen row before the log and item changes are flushed.
+        version = KitchenVersionService.bump(item.kitchen_id)
+
         # Create the restock log
         log = RestockLog(user_id=user_id, item_id=item_id)
         db.session.add(log)
@@ -20,38 +33,192 @@ class RestockLogService:
         # Update item to full stock
         item.quantity_percent = 100.0
         item.status = ItemStatus.IN_STOCK
+        item.version = version
 
+        db.session.flush()
+        KitchenEventService.publish(
+            item.kitchen_id,
+            "restock.created",
+            {"log": log.to_dict(), "item": item.to_dict()},
+            item.version,
+        )
         db.session.commit()
         return log
 
+    @staticmethod
+    def bulk_restock(
+        user_id: int,
+        item_ids: list[int] | None = None,
+        kitchen_id: int | None = None,
+        item_filter: str = "needed",
+    ) -> list[int]:
+        """Restock many items in one transaction and return their ids.
+
+        Targets either the given ``item_ids`` or the items of ``kitchen_id``
+        matching ``item_filter`` (one of BULK_FILTERS). All restock logs are
+        written with one multi-row INSERT and all items are reset to full
+        stock with one UPDATE.
+        """
+        query = select(Item.id).order_by(Item.id).with_for_update()
+        if item_ids is not None:
+            query = query.where(Item.id.in_(item_ids))
+            # Kitchen rows are locked before item rows on every write path.
+            kitchen_of = dict(
+                db.session.execute(
+                    select(Item.id, Item.kitchen_id).where(Item.id.in_(item_ids))
+                ).all()
+            )
+            versions = KitchenVersionService.bump_many(kitchen_of.values())
+        elif kitchen_id is not None:
+            query = query.where(Item.kitchen_id == kitchen_id)
+            if item_filter == "needed":
+                query = query.where(Item.status == ItemStatus.NEEDED)
+            elif item_filter == "below_threshold":
+                query = query.where(Item.quantity_percent <= Item.low_stock_threshold)
+            elif item_filter != "all":
+                raise ValueError(f"Unknown filter: {item_filter}")
+            versions = KitchenVersionService.bump_many([kitchen_id])
+            kitchen_of = None
+        else:
+            raise ValueError("Either item_ids or kitchen_id is required")
+
+        restocked = list(db.session.scalars(query))
+        if not restocked:
+            db.session.rollback()
+            return []
+
+        now = datetime.utcnow()
+        db.session.execute(
+            insert(RestockLog),
+            [{"user_id": user_id, "item_id": item_id, "created_at": now} for item_id in restocked],
+        )
+        db.session.execute(
+            update(Item)
+            .where(Item.id.in_(restocked))
+            .values(
+                quantity_percent=100.0,
+                status=ItemStatus.IN_STOCK,
+                version=case(versions, value=Item.kitchen_id, else_=Item.version),
+            ),
+            execution_options={"synchronize_session": False},
+        )
+        for restocked_kitchen, version in versions.items():
+            changed = [
+                item_id
+                for item_id in restocked
+                if kitchen_of is None or kitchen_of[item_id] == restocked_kitchen
+            ]
+            KitchenEventService.publish(
+                restocked_kitchen,
+                "items.changed",
+                {"reason": "restock_bulk", "item_ids": changed},
+                version,
+            )
+        db.session.commit()
+        return restocked
+
     @staticmethod
     def get_restock_log_by_id(log_id: int) -> RestockLog | None:
         """Get a restock log by ID."""
         return RestockLog.query.get(log_id)
 
     @staticmethod
-    def get_restock_logs_by_item(item_id: int) -> list[RestockLog]:
-        """Get all restock logs for an item."""
-        return (
-            RestockLog.query.filter_by(item_id=item_id).order_by(RestockLog.created_at.desc()).all()
-        )
+    def get_restock_logs_by_item(
+        item_id: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> list[RestockLog]:
+        """Get an item's restock logs in [start, end), newest first, optionally one page.
+
+        ``cursor`` comes from ``created_at_cursor`` on the last log of the
+        previous page; a malformed one raises ValueError.
+        """
+        return newest_first_page(
+            RestockLog.query.filter(RestockLog.item_id == item_id),
+            RestockLog.created_at,
+            RestockLog.id,
+            start,
+            end,
+            cursor,
+            limit,
+        ).all()
 
     @staticmethod
-    def get_restock_logs_by_kitchen(kitchen_id: int) -> list[RestockLog]:
-        """Get all restock logs for a kitchen."""
-        return (
-            RestockLog.query.join(Item)
-            .filter(Item.kitchen_id == kitchen_id)
-            .order_by(RestockLog.created_at.desc())
-            .all()
-        )
+    def get_restock_logs_by_kitchen(
+        kitchen_id: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> list[RestockLog]:
+        """Get a kitchen's restock logs; arguments as for get_restock_logs_by_item."""
+        return newest_first_page(
+            RestockLog.query.join(Item).filter(Item.kitchen_id == kitchen_id),
+            RestockLog.created_at,
+            RestockLog.id,
+            start,
+            end,
+            cursor,
+            limit,
+        ).all()
 
     @staticmethod
-    def get_restock_logs_by_user(user_id: int) -> list[RestockLog]:
-        """Get all restock logs for a user."""
-        return (
-            RestockLog.query.filter_by(user_id=user_id).order_by(RestockLog.created_at.desc()).all()
+    def iter_restock_logs_by_kitchen(
+        kitchen_id: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[dict]:
+        """Stream a kitchen's restock logs in [start, end) as plain dicts.
+
+        Rows are fetched ``batch_size`` at a time from a server-side cursor
+        where the driver supports one, so memory does not grow with history.
+        """
+        stmt = (
+            select(
+                RestockLog.id,
+                RestockLog.user_id,
+                RestockLog.item_id,
+                RestockLog.created_at,
+            )
+            .join(Item, Item.id == RestockLog.item_id)
+            .where(Item.kitchen_id == kitchen_id)
+            .order_by(RestockLog.created_at, RestockLog.id)
         )
+        if start is not None:
+            stmt = stmt.where(RestockLog.created_at >= start)
+        if end is not None:
+            stmt = stmt.where(RestockLog.created_at < end)
+
+        result = db.session.execute(stmt.execution_options(yield_per=batch_size))
+        for row in result:
+            yield {
+                "id": row.id,
+                "user_id": row.user_id,
+                "item_id": row.item_id,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+            }
+
+    @staticmethod
+    def get_restock_logs_by_user(
+        user_id: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> list[RestockLog]:
+        """Get a user's restock logs; arguments as for get_restock_logs_by_item."""
+        return newest_first_page(
+            RestockLog.query.filter(RestockLog.user_id == user_id),
+            RestockLog.created_at,
+            RestockLog.id,
+            start,
+            end,
+            cursor,
+            limit,
+        ).all()
 
     @staticmethod
     def delete_restock_log(log_id: int) -> bool:
@@ -59,6 +226,10 @@ class RestockLogService:
         log = RestockLog.query.get(log_id)
         if not log:
             return False
+        kitchen_id = db.session.scalar(select(Item.kitchen_id).where(Item.id == log.item_id))
+        if kitchen_id is not None:
+            version = KitchenVersionService.bump(kitchen_id)
+            KitchenEventService.publish(kitchen_id, "restock.deleted", {"id": log.id}, version)
         db.session.delete(log)
         db.session.commit()
         return True
@@ -0,0 +1,144 @@
+"""
+JWT revocation checks with a Bloom filter in front of the blocklist table.
+
+Every ``@jwt_required()`` request asks whether its token was revoked. Almost
+none are, so each worker keeps a Bloom filter of the revoked ``jti`` values
+and user ids in ``revoked_tokens``: a token whose keys are not in the filter
+is accepted without touching the database, and only filter hits (real
+revocations plus about JWT_BLOCKLIST_BLOOM_ERROR_RATE false positives) are
+confirmed with a query.
+
+Revocations made in this process enter the filter when they commit; rows
+written by other workers are picked up by an incremental refresh at most
+every JWT_BLOCKLIST_REFRESH_SECONDS, run by whichever request comes next.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask, current_app
+from sqlalchemy import and_, or_, select
+
+from app.extensions import db
+from app.models.revoked_token import RevokedToken
+
+# Rows committed out of order, or stamped by a worker whose clock lags, can
+# carry a revoked_at slightly older than the newest one already seen.
+REFRESH_OVERLAP = timedelta(seconds=60)
+
+
+def jti_key(jti: str) -> str:
+    return f"jti:{jti}"
+
+
+def user_key(user_id) -> str:
+    return f"user:{user_id}"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings, sized for ``capacity`` keys."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key: str) -> None:
+        """Add a key; ``count`` only grows for keys that were not already present."""
+        if key in self:
+            return
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+
+class TokenBlocklist:
+    def __init__(self, app: Flask | None = None):
+        self._refresh_lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.capacity = app.config["JWT_BLOCKLIST_BLOOM_CAPACITY"]
+        self.error_rate = app.config["JWT_BLOCKLIST_BLOOM_ERROR_RATE"]
+        self.refresh_seconds = app.config["JWT_BLOCKLIST_REFRESH_SECONDS"]
+        self._filter = BloomFilter(self.capacity, self.error_rate)
+        self._watermark: datetime | None = None
+        self._next_refresh = 0.0
+        self.db_checks = 0
+        app.extensions["flask-jwt-extended"].token_in_blocklist_loader(self._is_revoked)
+        app.extensions["token_blocklist"] = self
+
+    def add(self, *keys: str) -> None:
+        """Add keys of revocations committed by this process."""
+        for key in keys:
+            self._filter.add(key)
+
+    def refresh(self, force: bool = False) -> None:
+        """Add rows revoked since the last refresh, rebuilding the filter when it is full."""
+        now = time.monotonic()
+        if not force and now < self._next_refresh:
+            return
+        if not self._refresh_lock.acquire(blocking=False):
+            return  # Another thread is refreshing; use the current filter.
+        try:
+            self._next_refresh = now + self.refresh_seconds
+            rebuild = self._filter.count >= self.capacity
+            query = select(RevokedToken.jti, RevokedToken.user_id, RevokedToken.revoked_at).where(
+                RevokedToken.expires_at > datetime.utcnow()
+            )
+            if self._watermark is not None and not rebuild:
+                query = query.where(RevokedToken.revoked_at >= self._watermark - REFRESH_OVERLAP)
+            rows = db.session.execute(query).all()
+
+            # Expired rows are skipped, so a rebuilt filter shrinks back.
+            target = BloomFilter(self.capacity, self.error_rate) if rebuild else self._filter
+            for jti, user_id, revoked_at in rows:
+                target.add(jti_key(jti) if jti is not None else user_key(user_id))
+                if self._watermark is None or revoked_at > self._watermark:
+                    self._watermark = revoked_at
+            self._filter = target
+        finally:
+            self._refresh_lock.release()
+
+    def is_revoked(self, payload: dict) -> bool:
+        self.refresh()
+        jti, user_id = payload.get("jti"), payload.get("sub")
+        if jti_key(jti) not in self._filter and user_key(user_id) not in self._filter:
+            return False
+
+        self.db_checks += 1
+        conditions = [RevokedToken.jti == jti]
+        if user_id is not None and "iat" in payload:
+            conditions.append(
+                and_(
+                    RevokedToken.user_id == int(user_id),
+                    RevokedToken.revoked_at > datetime.utcfromtimestamp(payload["iat"]),
+                )
+            )
+        return (
+            db.session.scalar(select(RevokedToken.id).where(or_(*conditions)).limit(1)) is not None
+        )
+
+    def _is_revoked(self, jwt_header: dict, jwt_payload: dict) -> bool:
+        return self.is_revoked(jwt_payload)
+
+
+def get_token_blocklist() -> TokenBlocklist:
+    return current_app.extensions["token_blocklist"]
@@ -0,0 +1,184 @@
+"""
+Depletion forecast cost for a large kitchen.
+
+Seeds an in-memory database with one kitchen of ``--items`` items, each with
+``--logs-per-day`` consumption logs a day for ``--days`` days and a last
+restock somewhere in the past month, then times
+ForecastService.forecast_kitchen split into the database read and the
+NumPy fit, and the same fit done with a per-item Python loop for
+comparison. Usage::
+
+    python benchmarks/forecast_benchmark.py
+    python benchmarks/forecast_benchmark.py --items 1000 --days 90 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+import warnings
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy import insert
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app import create_app  # noqa: E402
+from app.extensions import db  # noqa: E402
+from app.models.consumption_log import ConsumptionLog  # noqa: E402
+from app.models.item import Item  # noqa: E402
+from app.models.kitchen import Kitchen  # noqa: E402
+from app.models.restock_log import RestockLog  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+from app.services.forecast_service import ForecastService  # noqa: E402
+
+HALF_LIFE_DAYS = 7.0
+HISTORY_DAYS = 60
+
+
+def seed(items: int, days: int, logs_per_day: float, now: datetime) -> int:
+    """Insert the synthetic kitchen and return its id."""
+    kitchen = Kitchen(code="424242", name="Forecast benchmark")
+    db.session.add(kitchen)
+    db.session.flush()
+    user = User(display_name="bench", kitchen_id=kitchen.id, password_hash="x")
+    db.session.add(user)
+    db.session.execute(
+        insert(Item),
+        [
+            {"name": f"item {i}", "kitchen_id": kitchen.id, "quantity_percent": 100.0}
+            for i in range(items)
+        ],
+    )
+    item_ids = [row.id for row in db.session.execute(db.select(Item.id))]
+
+    db.session.execute(
+        insert(RestockLog),
+        [
+            {
+                "user_id": user.id,
+                "item_id": item_id,
+                "created_at": now - timedelta(days=random.uniform(0, 30)),
+            }
+            for item_id in item_ids
+        ],
+    )
+
+    per_item = int(days * logs_per_day)
+    rows = []
+    for item_id in item_ids:
+        for _ in range(per_item):
+            rows.append(
+                {
+                    "user_id": user.id,
+                    "item_id": item_id,
+                    "percent_used": random.uniform(1, 10),
+                    "created_at": now - timedelta(days=random.uniform(0, days)),
+                }
+            )
+            if len(rows) == 50_000:
+                db.session.execute(insert(ConsumptionLog), rows)
+                rows.clear()
+    if rows:
+        db.session.execute(insert(ConsumptionLog), rows)
+    db.session.commit()
+    return kitchen.id
+
+
+def python_loop_fit(items: list, logs: list, now: datetime, since: datetime) -> list[float]:
+    """The same weighted burn rate, computed item by item in pure Python."""
+    decay = math.log(2) / HALF_LIFE_DAYS
+    by_item: dict[int, list] = {}
+    for item_id, created_at, percent_used in logs:
+        by_item.setdefault(item_id, []).append((created_at, percent_used))
+    rates = []
+    for row in items:
+        start = max(row.restocked_at or since, since)
+        span = max((now - start).total_seconds() / 86400, 1.0)
+        weighted = sum(
+            used * math.exp(-decay * (now - created).total_seconds() / 86400)
+            for created, used in by_item.get(row.id, ())
+        )
+        rates.append(weighted * decay / -math.expm1(-decay * span))
+    return rates
+
+
+def timed(fn, repeat: int) -> tuple[float, object]:
+    """Best wall time over ``repeat`` runs in milliseconds, and the last result."""
+    best, result = math.inf, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, (time.perf_counter() - started) * 1000)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=5000, help="Items in the kitchen")
+    parser.add_argument("--days", type=int, default=365, help="Days of consumption history")
+    parser.add_argument("--logs-per-day", type=float, default=1.0, help="Logs per item per day")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best kept)")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    random.seed(7)
+    now = datetime.utcnow()
+    since = now - timedelta(days=HISTORY_DAYS)
+    app = create_app("testing")
+    with app.app_context():
+        db.create_all()
+        started = time.perf_counter()
+        kitchen_id = seed(args.items, args.days, args.logs_per_day, now)
+        total_logs = int(args.items * args.days * args.logs_per_day)
+        print(
+            f"seeded {args.items} items, {total_logs} logs in {time.perf_counter() - started:.1f}s"
+        )
+
+        load_ms, (items, logs) = timed(
+            lambda: ForecastService.load_history(kitchen_id, since), args.repeat
+        )
+        print(f"history read        {load_ms:>9.1f} ms  ({len(logs)} logs since last restock)")
+
+        item_ids = np.array([row.id for row in items])
+        spans = np.array(
+            [(now - max(row.restocked_at or since, since)).total_seconds() for row in items]
+        )
+        log_item_ids, log_times, log_amounts = zip(*logs, strict=True)
+        ages = np.array([(now - created).total_seconds() for created in log_times])
+
+        def numpy_fit():
+            return ForecastService.burn_rates(
+                item_ids,
+                spans / 86400,
+                np.array(log_item_ids, dtype=np.int64),
+                ages / 86400,
+                np.array(log_amounts, dtype=float),
+                HALF_LIFE_DAYS,
+                1.0,
+            )[0]
+
+        numpy_ms, rates = timed(numpy_fit, args.repeat)
+        loop_ms, loop_rates = timed(lambda: python_loop_fit(items, logs, now, since), args.repeat)
+        assert np.allclose(rates, loop_rates)
+        print(
+            f"fit (NumPy)         {numpy_ms:>9.1f} ms  (from log ages, excluding their extraction)"
+        )
+        print(f"fit (Python loop)   {loop_ms:>9.1f} ms")
+
+        total_ms, _ = timed(
+            lambda: ForecastService.forecast_kitchen(
+                kitchen_id, history_days=HISTORY_DAYS, half_life_days=HALF_LIFE_DAYS, now=now
+            ),
+            args.repeat,
+        )
+        print(f"forecast_kitchen    {total_ms:>9.1f} ms  (read + fit + projection)")
+
+
+if __name__ == "__main__":
+    main()
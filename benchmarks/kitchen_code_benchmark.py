@@ -0,0 +1,112 @@
+"""
+Kitchen code allocation cost as the 6-digit code space fills up.
+
+For each utilization level, fills an in-memory database with that fraction
+of the million possible codes, then allocates kitchens with
+KitchenService.create_kitchen and with the previous query-per-guess loop,
+reporting queries (SELECT/INSERT; savepoint bookkeeping is not counted) and
+milliseconds per allocation as mean, p99 and max.
+Usage::
+
+    python benchmarks/kitchen_code_benchmark.py
+    python benchmarks/kitchen_code_benchmark.py --allocations 1000 --utilization 0.99
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import secrets
+import sys
+import time
+import warnings
+
+from sqlalchemy import delete, event, insert
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app import create_app  # noqa: E402
+from app.extensions import db  # noqa: E402
+from app.models.kitchen import Kitchen  # noqa: E402
+from app.services.kitchen_service import CODE_SPACE, KitchenService  # noqa: E402
+
+DEFAULT_UTILIZATION = [0.1, 0.5, 0.9]
+
+
+def fill(fraction: float) -> None:
+    """Replace all kitchens with ``fraction`` of the code space, chosen at random."""
+    db.session.execute(delete(Kitchen))
+    codes = random.sample(range(CODE_SPACE), int(CODE_SPACE * fraction))
+    for start in range(0, len(codes), 50_000):
+        rows = [{"code": f"{code:06d}", "name": "filler"} for code in codes[start : start + 50_000]]
+        db.session.execute(insert(Kitchen), rows)
+    db.session.commit()
+
+
+def legacy_create_kitchen(name: str) -> Kitchen:
+    """The allocator this replaces: one SELECT per random guess, unbounded."""
+    while True:
+        code = f"{secrets.randbelow(CODE_SPACE):06d}"
+        if not Kitchen.query.filter_by(code=code).first():
+            break
+    kitchen = Kitchen(code=code, name=name)
+    db.session.add(kitchen)
+    db.session.commit()
+    return kitchen
+
+
+def measure(allocate, allocations: int) -> tuple[list[int], list[float]]:
+    """Queries and milliseconds for each of ``allocations`` allocations."""
+    counts, timings = [], []
+    current = [0]
+
+    def _count(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith(("SELECT", "INSERT")):
+            current[0] += 1
+
+    event.listen(db.engine, "before_cursor_execute", _count)
+    try:
+        for i in range(allocations):
+            current[0] = 0
+            started = time.perf_counter()
+            allocate(f"bench {i}")
+            timings.append((time.perf_counter() - started) * 1000)
+            counts.append(current[0])
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _count)
+    return counts, timings
+
+
+def summarize(values: list[float]) -> str:
+    ordered = sorted(values)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"{sum(ordered) / len(ordered):>7.2f} {p99:>7.2f} {ordered[-1]:>7.2f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--utilization", type=float, action="append", help="Fraction of codes in use (repeatable)"
+    )
+    parser.add_argument("--allocations", type=int, default=300, help="Kitchens per measurement")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    app = create_app("testing")
+    with app.app_context():
+        db.create_all()
+        header = "queries (mean p99 max)         ms (mean p99 max)"
+        print(f"{'used':>5} {'allocator':<10} {header}")
+        for fraction in args.utilization or DEFAULT_UTILIZATION:
+            fill(fraction)
+            for label, allocate in (
+                ("indexed", KitchenService.create_kitchen),
+                ("legacy", legacy_create_kitchen),
+            ):
+                counts, timings = measure(allocate, args.allocations)
+                print(f"{fraction:>5.0%} {label:<10} {summarize(counts)}   {summarize(timings)}")
+
+
+if __name__ == "__main__":
+    main()
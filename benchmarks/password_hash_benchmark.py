@@ -0,0 +1,91 @@
+"""
+Password hashing throughput per PASSWORD_HASH_METHOD setting.
+
+For each method, measures how many password checks (the CPU cost of one
+login) a single core completes per second, then the throughput of the
+bounded PasswordHasher pool with the given worker count. Usage::
+
+    python benchmarks/password_hash_benchmark.py
+    python benchmarks/password_hash_benchmark.py --seconds 5 --workers 4 \\
+        --method scrypt:16384:8:1 --method pbkdf2:sha256:600000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Flask
+from werkzeug.security import check_password_hash, generate_password_hash
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.password_hasher import PasswordHasher, normalize_method  # noqa: E402
+
+DEFAULT_METHODS = [
+    "scrypt:32768:8:1",
+    "scrypt:16384:8:1",
+    "pbkdf2:sha256:1000000",
+    "pbkdf2:sha256:600000",
+]
+PASSWORD = "Correct#Horse9"
+
+
+def per_core_rate(password_hash: str, seconds: float) -> float:
+    """Password checks per second on the calling thread."""
+    count = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        check_password_hash(password_hash, PASSWORD)
+        count += 1
+    return count / (time.perf_counter() - started)
+
+
+def pool_rate(method: str, password_hash: str, workers: int, seconds: float) -> float:
+    """Password checks per second through a PasswordHasher with ``workers`` threads."""
+    app = Flask(__name__)
+    app.config.update(
+        PASSWORD_HASH_METHOD=method,
+        PASSWORD_HASH_WORKERS=workers,
+        PASSWORD_HASH_QUEUE_LIMIT=workers,
+    )
+    hasher = PasswordHasher(app)
+    deadline = time.perf_counter() + seconds
+
+    def client() -> int:
+        done = 0
+        while time.perf_counter() < deadline:
+            hasher.verify(password_hash, PASSWORD)
+            done += 1
+        return done
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as clients:
+        total = sum(clients.map(lambda _: client(), range(workers)))
+    return total / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--method", action="append", help="Method to test (repeatable)")
+    parser.add_argument("--seconds", type=float, default=2.0, help="Duration per measurement")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="PasswordHasher pool size"
+    )
+    args = parser.parse_args()
+
+    print(f"{'method':<24} {'ms/login':>9} {'logins/s/core':>14} {'pool logins/s':>14}")
+    for method in args.method or DEFAULT_METHODS:
+        method = normalize_method(method)
+        password_hash = generate_password_hash(PASSWORD, method)
+        rate = per_core_rate(password_hash, args.seconds)
+        pooled = pool_rate(method, password_hash, args.workers, args.seconds)
+        print(f"{method:<24} {1000 / rate:>9.1f} {rate:>14.1f} {pooled:>14.1f}")
+    print(f"pool size: {args.workers} worker(s), cpu count: {os.cpu_count()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Per-request overhead of the rate limiter.
+
+Measures the cost of RateLimiter.check with the in-memory store for an
+IP-only namespace and for one with IP, user and kitchen buckets, spread over
+a configurable number of distinct clients, plus the full before-request hook
+for a request carrying a bearer token (whose claims are cached after the
+first verification). Usage::
+
+    python benchmarks/rate_limit_benchmark.py
+    python benchmarks/rate_limit_benchmark.py --iterations 500000 --clients 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.rate_limiter import RateLimiter  # noqa: E402
+
+
+def build_app() -> Flask:
+    app = Flask(__name__)
+    app.config.update(
+        JWT_SECRET_KEY="benchmark-secret-key-of-at-least-32-bytes",
+        RATE_LIMIT_ENABLED=True,
+        RATE_LIMIT_STORAGE_URL="",
+        RATE_LIMITS={
+            "auth": {"ip": "1000000/second"},
+            "items": {
+                "ip": "1000000/second",
+                "user": "1000000/second",
+                "kitchen": "1000000/second",
+            },
+        },
+    )
+    JWTManager(app)
+    RateLimiter(app)
+    return app
+
+
+def measure(limiter: RateLimiter, namespace: str, iterations: int, clients: int) -> float:
+    """Microseconds per check, cycling through ``clients`` distinct subjects."""
+    subjects = [(f"10.0.{i // 256 % 256}.{i % 256}", str(i), i % 97) for i in range(clients)]
+    started = time.perf_counter()
+    for i in range(iterations):
+        ip, user_id, kitchen_id = subjects[i % clients]
+        limiter.check(namespace, ip, user_id, kitchen_id)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def measure_request_hook(app: Flask, iterations: int) -> float:
+    """Microseconds per before-request hook call for an authenticated write."""
+    limiter = app.extensions["rate_limiter"]
+    with app.app_context():
+        token = create_access_token(identity="1", additional_claims={"kitchen_id": 1})
+    headers = {"Authorization": f"Bearer {token}"}
+    with app.test_request_context("/items", method="POST", headers=headers):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            limiter._before_request()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=200_000, help="Checks per scenario")
+    parser.add_argument("--clients", type=int, default=10_000, help="Distinct client keys")
+    args = parser.parse_args()
+
+    app = build_app()
+    limiter = app.extensions["rate_limiter"]
+    for label, namespace in (("ip only", "auth"), ("ip + user + kitchen", "items")):
+        micros = measure(limiter, namespace, args.iterations, args.clients)
+        print(f"{label:<22} {micros:>7.2f} us/check")
+    micros = measure_request_hook(app, args.iterations)
+    print(f"{'hook with bearer token':<22} {micros:>7.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
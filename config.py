@@ -44,11 +44,88 @@ class Config:
         seconds=int(os.getenv("JWT_REFRESH_TOKEN_EXPIRES", "604800"))
     )
 
+    # Token revocation: Bloom filter sizing and how often other workers'
+    # revocations are picked up
+    JWT_BLOCKLIST_BLOOM_CAPACITY = int(os.getenv("JWT_BLOCKLIST_BLOOM_CAPACITY", "100000"))
+    JWT_BLOCKLIST_BLOOM_ERROR_RATE = float(os.getenv("JWT_BLOCKLIST_BLOOM_ERROR_RATE", "0.001"))
+    JWT_BLOCKLIST_REFRESH_SECONDS = float(os.getenv("JWT_BLOCKLIST_REFRESH_SECONDS", "5"))
+
     # API Documentation Configuration
     API_TITLE = os.getenv("API_TITLE", "KitchenSync API")
     API_VERSION = os.getenv("API_VERSION", "1.0")
     API_DESCRIPTION = os.getenv("API_DESCRIPTION", "Kitchen inventory management API")
 
+    # Pagination
+    DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "100"))
+    MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "500"))
+
+    # Batch operations
+    CONSUMPTION_BATCH_MAX_SIZE = int(os.getenv("CONSUMPTION_BATCH_MAX_SIZE", "500"))
+    RESTOCK_BULK_MAX_ITEMS = int(os.getenv("RESTOCK_BULK_MAX_ITEMS", "1000"))
+    ITEM_IMPORT_BATCH_SIZE = int(os.getenv("ITEM_IMPORT_BATCH_SIZE", "500"))
+
+    # Daily consumption rollups (GET /consumptions/daily)
+    CONSUMPTION_DAILY_DEFAULT_DAYS = int(os.getenv("CONSUMPTION_DAILY_DEFAULT_DAYS", "90"))
+    CONSUMPTION_DAILY_MAX_DAYS = int(os.getenv("CONSUMPTION_DAILY_MAX_DAYS", "366"))
+
+    # Password hashing (werkzeug method string, e.g. "scrypt:32768:8:1" or "pbkdf2:sha256:600000")
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "16"))
+
+    # Lookup caches (kitchen by code, user profile); a TTL of 0 disables them
+    LOOKUP_CACHE_TTL = float(os.getenv("LOOKUP_CACHE_TTL", "60"))
+    LOOKUP_CACHE_SIZE = int(os.getenv("LOOKUP_CACHE_SIZE", "1024"))
+
+    # Kitchen summaries (GET /kitchens/<id>/summary): served as-is while
+    # fresh, then served stale while one background reload runs
+    SUMMARY_CACHE_FRESH_SECONDS = float(os.getenv("SUMMARY_CACHE_FRESH_SECONDS", "15"))
+    SUMMARY_CACHE_STALE_SECONDS = float(os.getenv("SUMMARY_CACHE_STALE_SECONDS", "300"))
+    SUMMARY_CACHE_BACKGROUND_REFRESH = True
+    SUMMARY_CONSUMPTION_DAYS = int(os.getenv("SUMMARY_CONSUMPTION_DAYS", "7"))
+
+    # Restock interval statistics (GET /restocks/intervals) are cached per
+    # kitchen version; entries of superseded versions expire after this many seconds.
+    RESTOCK_INTERVAL_CACHE_TTL = float(os.getenv("RESTOCK_INTERVAL_CACHE_TTL", "3600"))
+
+    # Depletion forecasts (GET /kitchens/<id>/forecast)
+    FORECAST_HISTORY_DAYS = int(os.getenv("FORECAST_HISTORY_DAYS", "60"))
+    FORECAST_HALF_LIFE_DAYS = float(os.getenv("FORECAST_HALF_LIFE_DAYS", "7"))
+    FORECAST_MIN_SPAN_DAYS = float(os.getenv("FORECAST_MIN_SPAN_DAYS", "1"))
+
+    # Log retention (flask logs archive): whole days older than this are
+    # written to gzip NDJSON files under LOG_ARCHIVE_DIR and deleted.
+    LOG_RETENTION_DAYS = int(os.getenv("LOG_RETENTION_DAYS", "365"))
+    LOG_ARCHIVE_DIR = os.getenv("LOG_ARCHIVE_DIR", "archive")
+    LOG_ARCHIVE_CHUNK_SIZE = int(os.getenv("LOG_ARCHIVE_CHUNK_SIZE", "1000"))
+
+    # Live kitchen events (Server-Sent Events)
+    EVENT_POLLER_ENABLED = os.getenv("EVENT_POLLER_ENABLED", "true").lower() == "true"
+    EVENT_POLL_INTERVAL = float(os.getenv("EVENT_POLL_INTERVAL", "1.0"))
+    EVENT_POLL_BATCH_SIZE = int(os.getenv("EVENT_POLL_BATCH_SIZE", "500"))
+    EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "1000"))
+    EVENT_HEARTBEAT_SECONDS = int(os.getenv("EVENT_HEARTBEAT_SECONDS", "15"))
+    EVENT_REPLAY_LIMIT = int(os.getenv("EVENT_REPLAY_LIMIT", "1000"))
+    EVENT_RETENTION_DAYS = int(os.getenv("EVENT_RETENTION_DAYS", "7"))
+    EVENT_TICKET_SECONDS = int(os.getenv("EVENT_TICKET_SECONDS", "60"))
+
+    # Rate limiting: token buckets per namespace (first path segment) for
+    # write requests, as "<count>/<second|minute|hour>"; an empty value
+    # disables that bucket. Namespaces without an entry use "default".
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_STORAGE_URL = os.getenv("RATE_LIMIT_STORAGE_URL", "")
+    RATE_LIMITS = {
+        "auth": {
+            "ip": os.getenv("RATE_LIMIT_AUTH_PER_IP", "10/minute"),
+            "user": os.getenv("RATE_LIMIT_AUTH_PER_USER", "30/minute"),
+        },
+        "default": {
+            "ip": os.getenv("RATE_LIMIT_WRITE_PER_IP", "300/minute"),
+            "user": os.getenv("RATE_LIMIT_WRITE_PER_USER", "120/minute"),
+            "kitchen": os.getenv("RATE_LIMIT_WRITE_PER_KITCHEN", "600/minute"),
+        },
+    }
+
     # CORS Configuration
     CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*").split(",")
 
@@ -134,6 +211,14 @@ class TestingConfig(Config):
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
     JWT_SECRET_KEY = "test-secret-key"  # nosec
     WTF_CSRF_ENABLED = False
+    # Tests drive EventBroker.poll_once directly instead of a background thread.
+    EVENT_POLLER_ENABLED = False
+    # Cheap hashes keep the suite fast; production cost is set via env.
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
+    # Background threads would share the in-memory database connection.
+    SUMMARY_CACHE_BACKGROUND_REFRESH = False
+    # Tests that exercise limits enable the limiter explicitly.
+    RATE_LIMIT_ENABLED = False
 
 
 # Configuration dictionary
@@ -31,10 +31,15 @@ if config.config_file_name is not None:
 app = create_app()
 config.set_main_option("sqlalchemy.url", app.config["SQLALCHEMY_DATABASE_URI"])
 
+from app.models.consumption_daily import ConsumptionDaily
 from app.models.consumption_log import ConsumptionLog
 from app.models.item import Item
+from app.models.item_tombstone import ItemTombstone
 from app.models.kitchen import Kitchen
+from app.models.kitchen_event import KitchenEvent
+from app.models.log_archive import LogArchive
 from app.models.restock_log import RestockLog
+from app.models.revoked_token import RevokedToken
 
 # add your model's MetaData object here
 # for 'autogenerate' support
@@ -0,0 +1,38 @@
+"""Add item indexes for filtered and sorted listings
+
+Revision ID: 5e8a1c3b7d42
+Revises: c41d7e2f9a10
+Create Date: 2026-10-17 11:03:12.540871
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e8a1c3b7d42"
+down_revision: Union[str, Sequence[str], None] = "c41d7e2f9a10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_items_kitchen_id_category", "items", ["kitchen_id", "category"], unique=False
+    )
+    op.create_index("ix_items_kitchen_id_name", "items", ["kitchen_id", "name"], unique=False)
+    op.create_index(
+        "ix_items_kitchen_id_quantity_percent",
+        "items",
+        ["kitchen_id", "quantity_percent"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_items_kitchen_id_quantity_percent", table_name="items")
+    op.drop_index("ix_items_kitchen_id_name", table_name="items")
+    op.drop_index("ix_items_kitchen_id_category", table_name="items")
@@ -0,0 +1,69 @@
+"""Add item change tracking for delta sync
+
+Revision ID: 8d2f4b6a1c93
+Revises: 5e8a1c3b7d42
+Create Date: 2026-10-17 14:05:12.402117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2f4b6a1c93"
+down_revision: Union[str, Sequence[str], None] = "5e8a1c3b7d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("kitchens", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("change_version", sa.BigInteger(), server_default="0", nullable=False)
+        )
+
+    with op.batch_alter_table("items", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("version", sa.BigInteger(), server_default="0", nullable=False)
+        )
+        batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+        batch_op.create_index(
+            "ix_items_kitchen_id_version", ["kitchen_id", "version"], unique=False
+        )
+
+    op.create_table(
+        "item_tombstones",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("kitchen_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["kitchen_id"],
+            ["kitchens.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_item_tombstones_kitchen_id_version",
+        "item_tombstones",
+        ["kitchen_id", "version"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_item_tombstones_kitchen_id_version", table_name="item_tombstones")
+    op.drop_table("item_tombstones")
+
+    with op.batch_alter_table("items", schema=None) as batch_op:
+        batch_op.drop_index("ix_items_kitchen_id_version")
+        batch_op.drop_column("updated_at")
+        batch_op.drop_column("version")
+
+    with op.batch_alter_table("kitchens", schema=None) as batch_op:
+        batch_op.drop_column("change_version")
@@ -0,0 +1,50 @@
+"""Add log_archives manifest and consumption_logs created_at index
+
+Revision ID: b9e3d7a52c16
+Revises: f2c8a6d41e93
+Create Date: 2026-10-17 21:36:12.884105
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b9e3d7a52c16"
+down_revision: Union[str, Sequence[str], None] = "f2c8a6d41e93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "log_archives",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("table_name", sa.String(length=64), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("path", sa.String(length=512), nullable=False),
+        sa.Column("first_id", sa.Integer(), nullable=False),
+        sa.Column("last_id", sa.Integer(), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        sa.Column("percent_used", sa.Float(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("table_name", "day", "first_id"),
+    )
+    op.create_index(
+        "ix_log_archives_table_name_day", "log_archives", ["table_name", "day"], unique=False
+    )
+    op.create_index(
+        "ix_consumption_logs_created_at", "consumption_logs", ["created_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_consumption_logs_created_at", table_name="consumption_logs")
+    op.drop_index("ix_log_archives_table_name_day", table_name="log_archives")
+    op.drop_table("log_archives")
@@ -0,0 +1,64 @@
+"""Add composite indexes for service query shapes
+
+Revision ID: c41d7e2f9a10
+Revises: b537bdaa9aaf
+Create Date: 2026-10-17 09:12:40.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d7e2f9a10"
+down_revision: Union[str, Sequence[str], None] = "b537bdaa9aaf"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_consumption_logs_item_id_created_at",
+        "consumption_logs",
+        ["item_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_consumption_logs_user_id_created_at",
+        "consumption_logs",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_restock_logs_item_id_created_at",
+        "restock_logs",
+        ["item_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_restock_logs_user_id_created_at",
+        "restock_logs",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+    op.create_index("ix_items_kitchen_id_id", "items", ["kitchen_id", "id"], unique=False)
+    op.create_index("ix_items_kitchen_id_status", "items", ["kitchen_id", "status"], unique=False)
+    op.create_index(
+        "ix_users_kitchen_id_display_name",
+        "users",
+        ["kitchen_id", "display_name"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_kitchen_id_display_name", table_name="users")
+    op.drop_index("ix_items_kitchen_id_status", table_name="items")
+    op.drop_index("ix_items_kitchen_id_id", table_name="items")
+    op.drop_index("ix_restock_logs_user_id_created_at", table_name="restock_logs")
+    op.drop_index("ix_restock_logs_item_id_created_at", table_name="restock_logs")
+    op.drop_index("ix_consumption_logs_user_id_created_at", table_name="consumption_logs")
+    op.drop_index("ix_consumption_logs_item_id_created_at", table_name="consumption_logs")
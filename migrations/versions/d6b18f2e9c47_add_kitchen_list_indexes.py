@@ -0,0 +1,29 @@
+"""Add kitchen name and created_at indexes
+
+Revision ID: d6b18f2e9c47
+Revises: a3c9e5f71b28
+Create Date: 2026-10-17 19:02:41.118306
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d6b18f2e9c47"
+down_revision: Union[str, Sequence[str], None] = "a3c9e5f71b28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f("ix_kitchens_name"), "kitchens", ["name"], unique=False)
+    op.create_index(op.f("ix_kitchens_created_at"), "kitchens", ["created_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_kitchens_created_at"), table_name="kitchens")
+    op.drop_index(op.f("ix_kitchens_name"), table_name="kitchens")
@@ -0,0 +1,49 @@
+"""Add kitchen_events outbox
+
+Revision ID: e7a94c0b2d15
+Revises: 8d2f4b6a1c93
+Create Date: 2026-10-17 15:31:47.226810
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a94c0b2d15"
+down_revision: Union[str, Sequence[str], None] = "8d2f4b6a1c93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "kitchen_events",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("kitchen_id", sa.Integer(), nullable=False),
+        sa.Column("type", sa.String(length=32), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["kitchen_id"],
+            ["kitchens.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_kitchen_events_kitchen_id_id", "kitchen_events", ["kitchen_id", "id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_kitchen_events_created_at"), "kitchen_events", ["created_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_kitchen_events_created_at"), table_name="kitchen_events")
+    op.drop_index("ix_kitchen_events_kitchen_id_id", table_name="kitchen_events")
+    op.drop_table("kitchen_events")
@@ -0,0 +1,37 @@
+"""Add consumption_daily rollup
+
+Revision ID: f2c8a6d41e93
+Revises: d6b18f2e9c47
+Create Date: 2026-10-17 20:14:37.502981
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c8a6d41e93"
+down_revision: Union[str, Sequence[str], None] = "d6b18f2e9c47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "consumption_daily",
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("percent_used", sa.Float(), nullable=False),
+        sa.Column("events", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["item_id"], ["items.id"]),
+        sa.PrimaryKeyConstraint("item_id", "day"),
+    )
+    # Populate with `flask consumptions backfill` after upgrading.
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("consumption_daily")
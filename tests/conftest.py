@@ -3,6 +3,7 @@ Test configuration and fixtures for pytest.
 """
 
 import pytest
+from sqlalchemy import event
 
 from app import create_app
 from app.extensions import db
@@ -11,6 +12,15 @@ from app.models.item import Item, ItemStatus
 from app.models.kitchen import Kitchen
 from app.models.restock_log import RestockLog
 from app.models.user_model import User
+from app.services.auth_service import AuthService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
 
 
 @pytest.fixture(scope="function")
@@ -38,6 +48,25 @@ def db_session(app):
         yield db.session
 
 
+@pytest.fixture
+def clock():
+    """A monotonic clock stand-in for caches and rate limiters; set ``clock.now`` to move it."""
+    return FakeClock()
+
+
+@pytest.fixture
+def statements(app):
+    """Record the SQL statements sent to the database; clear() before the code under test."""
+    recorded = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    yield recorded
+    event.remove(db.engine, "before_cursor_execute", _record)
+
+
 @pytest.fixture
 def sample_kitchen(db_session):
     """Create a sample kitchen for testing."""
@@ -51,7 +80,7 @@ def sample_kitchen(db_session):
 def sample_user(db_session, sample_kitchen):
     """Create a sample user for testing."""
     user = User(display_name="TestUser", kitchen_id=sample_kitchen.id)
-    user.set_password("Test#123")
+    AuthService.set_password(user, "Test#123")
     db_session.add(user)
     db_session.commit()
     return user
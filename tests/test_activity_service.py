@@ -0,0 +1,110 @@
+"""
+Unit tests for ActivityService.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.models.consumption_log import ConsumptionLog
+from app.models.item import Item
+from app.models.kitchen import Kitchen
+from app.models.restock_log import RestockLog
+from app.services.activity_service import ActivityService
+
+
+@pytest.fixture
+def timeline(db_session, sample_kitchen, sample_user, sample_item):
+    """Interleaved logs, with a restock and a consumption sharing a timestamp."""
+    other_kitchen = Kitchen(code="777777", name="Elsewhere")
+    db_session.add(other_kitchen)
+    db_session.flush()
+    elsewhere = Item(name="Elsewhere item", kitchen_id=other_kitchen.id)
+    db_session.add(elsewhere)
+    db_session.flush()
+
+    tie = datetime(2026, 4, 3, 12)
+    db_session.add_all(
+        [
+            ConsumptionLog(
+                user_id=sample_user.id,
+                item_id=sample_item.id,
+                percent_used=5.0,
+                created_at=datetime(2026, 4, 1),
+            ),
+            RestockLog(
+                user_id=sample_user.id, item_id=sample_item.id, created_at=datetime(2026, 4, 2)
+            ),
+            ConsumptionLog(
+                user_id=sample_user.id, item_id=sample_item.id, percent_used=7.0, created_at=tie
+            ),
+            RestockLog(user_id=sample_user.id, item_id=sample_item.id, created_at=tie),
+            ConsumptionLog(
+                user_id=sample_user.id, item_id=sample_item.id, percent_used=9.0, created_at=tie
+            ),
+            ConsumptionLog(
+                user_id=sample_user.id,
+                item_id=elsewhere.id,
+                percent_used=1.0,
+                created_at=datetime(2026, 4, 2),
+            ),
+        ]
+    )
+    db_session.commit()
+
+
+def _keys(entries) -> list[tuple]:
+    return [(entry["created_at"][:10], entry["type"]) for entry in entries]
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestActivityService:
+    """Test the merged restock/consumption timeline."""
+
+    def test_get_activity_merges_both_logs(
+        self, app, timeline, sample_kitchen, sample_user, sample_item, statements
+    ):
+        """Test ordering, tie-breaking, names and that one statement is issued."""
+        statements.clear()
+        activity = ActivityService.get_activity(sample_kitchen.id)
+        assert len([s for s in statements if "UNION ALL" in s]) == 1
+        assert _keys(activity) == [
+            ("2026-04-03", "restock"),
+            ("2026-04-03", "consumption"),
+            ("2026-04-03", "consumption"),
+            ("2026-04-02", "restock"),
+            ("2026-04-01", "consumption"),
+        ]
+        assert activity[1]["id"] > activity[2]["id"]
+        assert activity[1]["percent_used"] == 9.0
+        assert activity[0]["percent_used"] is None
+        assert activity[0]["user_display_name"] == sample_user.display_name
+        assert activity[0]["item_name"] == sample_item.name
+
+        in_range = ActivityService.get_activity(
+            sample_kitchen.id, start=datetime(2026, 4, 2), end=datetime(2026, 4, 3)
+        )
+        assert _keys(in_range) == [("2026-04-02", "restock")]
+
+    @pytest.mark.parametrize("limit", [1, 2, 3])
+    def test_get_activity_pages(self, app, timeline, sample_kitchen, limit):
+        """Test that walking cursor pages yields the full timeline once, in order."""
+        expected = ActivityService.get_activity(sample_kitchen.id)
+        seen, cursor = [], None
+        while True:
+            page = ActivityService.get_activity(sample_kitchen.id, cursor=cursor, limit=limit)
+            seen.extend(page)
+            if len(page) < limit:
+                break
+            cursor = ActivityService.cursor_for(page[-1])
+        assert seen == expected
+
+    def test_get_activity_rejects_bad_cursor(self, app, sample_kitchen):
+        """Test malformed cursors."""
+        for cursor in (
+            "garbage",
+            ActivityService.cursor_for({"created_at": "x", "type": "restock", "id": 1}),
+        ):
+            with pytest.raises(ValueError):
+                ActivityService.get_activity(sample_kitchen.id, cursor=cursor)
@@ -2,6 +2,8 @@
 Integration tests for API endpoints.
 """
 
+from datetime import datetime
+
 import pytest
 
 
@@ -85,11 +87,74 @@ class TestAuthEndpoints:
         data = response.get_json()
         assert "user" in data
 
+    def test_auth_endpoint_statement_counts(
+        self, app, client, sample_user, sample_kitchen, statements
+    ):
+        """Test that auth endpoints serialize the user without a lazy kitchen load."""
+        code = sample_kitchen.code
+        credentials = {"kitchen_code": code, "password": "Test#123"}
+
+        statements.clear()
+        response = client.post("/auth/login", json={"display_name": "TestUser", **credentials})
+        assert response.get_json()["user"]["kitchen_code"] == code
+        # Kitchen by code (cold cache), then the user.
+        assert len(statements) == 2
+
+        statements.clear()
+        client.post("/auth/login", json={"display_name": "TestUser", **credentials})
+        assert len(statements) == 1
+
+        statements.clear()
+        response = client.post("/auth/register", json={"display_name": "NewUser", **credentials})
+        assert response.get_json()["user"]["kitchen_code"] == code
+        # Duplicate check, insert, and the post-commit refresh of the new row.
+        assert len(statements) == 3
+
+        headers = {"Authorization": f"Bearer {response.get_json()['access_token']}"}
+        # The blocklist filter loads on the first authenticated request, then
+        # only every JWT_BLOCKLIST_REFRESH_SECONDS.
+        app.extensions["token_blocklist"].refresh(force=True)
+        statements.clear()
+        response = client.get("/auth/me", headers=headers)
+        assert response.get_json()["user"]["kitchen_code"] == code
+        assert len(statements) == 1
+        assert "JOIN kitchens" in statements[0]
+
     def test_me_endpoint_unauthorized(self, client):
         """Test getting current user without auth."""
         response = client.get("/auth/me")
         assert response.status_code == 401
 
+    def test_login_when_hash_pool_is_full(self, client, sample_user, sample_kitchen, monkeypatch):
+        """Test that login sheds load with 503 when the hashing pool is saturated."""
+        from app.services.password_hasher import PasswordHasher, PasswordHasherBusy
+
+        def busy(self, *args):
+            raise PasswordHasherBusy()
+
+        monkeypatch.setattr(PasswordHasher, "_run", busy)
+        response = client.post(
+            "/auth/login",
+            json={
+                "display_name": sample_user.display_name,
+                "kitchen_code": sample_kitchen.code,
+                "password": "Test#123",
+            },
+        )
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert response.get_json()["code"] == "server_busy"
+
+    def test_me_endpoint_cached(self, client, auth_headers, sample_user):
+        """Test that repeated /auth/me calls are served from the lookup cache."""
+        for _ in range(3):
+            response = client.get("/auth/me", headers=auth_headers)
+            assert response.get_json()["user"]["id"] == sample_user.id
+
+        caches = client.get("/health/").get_json()["caches"]
+        assert caches["users_by_id"]["hits"] == 2
+        assert caches["users_by_id"]["misses"] == 1
+
 
 @pytest.mark.integration
 class TestKitchenEndpoints:
@@ -112,6 +177,83 @@ class TestKitchenEndpoints:
         assert "kitchens" in data
         assert len(data["kitchens"]) >= 1
 
+    def test_get_kitchen_summary(
+        self, client, auth_headers, sample_kitchen, sample_item, statements
+    ):
+        """Test the dashboard summary and that a repeat read is served from cache."""
+        response = client.get(f"/kitchens/{sample_kitchen.id}/summary", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.get_json()["summary"]["items"]["in_stock"] == 1
+
+        statements.clear()
+        client.get(f"/kitchens/{sample_kitchen.id}/summary", headers=auth_headers)
+        assert not [s for s in statements if "GROUP BY" in s]
+
+        assert client.get("/kitchens/99999/summary", headers=auth_headers).status_code == 404
+        assert client.get(f"/kitchens/{sample_kitchen.id}/summary").status_code == 401
+
+    def test_get_kitchen_activity(self, client, auth_headers, sample_kitchen, sample_item):
+        """Test the merged activity timeline, its paging and ETag."""
+        client.post("/restocks", json={"item_id": sample_item.id}, headers=auth_headers)
+        client.post(
+            "/consumptions",
+            json={"item_id": sample_item.id, "percent_used": 10},
+            headers=auth_headers,
+        )
+        url = f"/kitchens/{sample_kitchen.id}/activity"
+        response = client.get(f"{url}?limit=1", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.get_json()
+        (entry,) = data["activity"]
+        assert entry["type"] == "consumption"
+        assert entry["item_name"] == sample_item.name
+        assert entry["user_display_name"]
+
+        data = client.get(f"{url}?limit=1&cursor={data['next_cursor']}", headers=auth_headers)
+        data = data.get_json()
+        assert [e["type"] for e in data["activity"]] == ["restock"]
+        assert data["next_cursor"] is None
+
+        etag = response.headers["ETag"]
+        cached = client.get(f"{url}?limit=1", headers={**auth_headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+
+        assert client.get(f"{url}?cursor=bad", headers=auth_headers).status_code == 400
+        assert client.get("/kitchens/99999/activity", headers=auth_headers).status_code == 404
+        assert client.get(url).status_code == 401
+
+    def test_get_kitchen_forecast(self, client, auth_headers, sample_kitchen, sample_item):
+        """Test the depletion forecast endpoint."""
+        client.post(
+            "/consumptions",
+            json={"item_id": sample_item.id, "percent_used": 10},
+            headers=auth_headers,
+        )
+        response = client.get(f"/kitchens/{sample_kitchen.id}/forecast", headers=auth_headers)
+        assert response.status_code == 200
+        (item,) = response.get_json()["forecast"]["items"]
+        assert item["item_id"] == sample_item.id
+        assert item["samples"] == 1
+        assert item["days_until_low_stock"] > 0
+
+        assert client.get("/kitchens/99999/forecast", headers=auth_headers).status_code == 404
+
+    def test_get_kitchens_paginated(self, client, sample_kitchen):
+        """Test limit/cursor paging and filter validation on the kitchen list."""
+        client.post("/kitchens", json={"name": "Second Kitchen"})
+
+        first = client.get("/kitchens?limit=1").get_json()
+        assert [k["id"] for k in first["kitchens"]] == [sample_kitchen.id]
+        second = client.get(f"/kitchens?limit=1&cursor={first['next_cursor']}").get_json()
+        assert second["kitchens"][0]["name"] == "Second Kitchen"
+        assert second["next_cursor"] is None
+
+        response = client.get("/kitchens?name_prefix=Sec&created_from=2000-01-01T00:00:00Z")
+        assert [k["name"] for k in response.get_json()["kitchens"]] == ["Second Kitchen"]
+
+        for query in ("created_to=yesterday", "sort=code", "limit=0", "cursor=bad"):
+            assert client.get(f"/kitchens?{query}").status_code == 400
+
     def test_get_kitchen_by_id(self, client, sample_kitchen):
         """Test getting kitchen by ID."""
         response = client.get(f"/kitchens/{sample_kitchen.id}")
@@ -126,6 +268,60 @@ class TestKitchenEndpoints:
         data = response.get_json()
         assert data["kitchen"]["code"] == sample_kitchen.code
 
+    def test_kitchen_events_stream(self, app, client, auth_headers, sample_kitchen):
+        """Test replaying and then streaming a kitchen's events over SSE."""
+        client.post(
+            "/items", headers=auth_headers, json={"name": "Milk", "kitchen_id": sample_kitchen.id}
+        )
+        ticket = client.post(
+            f"/kitchens/{sample_kitchen.id}/events/ticket", headers=auth_headers
+        ).get_json()["ticket"]
+        response = client.get(
+            f"/kitchens/{sample_kitchen.id}/events?ticket={ticket}",
+            headers={"Last-Event-ID": "0"},
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+
+        chunks = iter(response.response)
+        assert next(chunks).startswith(b"retry:")
+        assert b"event: item.created" in next(chunks)
+
+        client.post(
+            "/items", headers=auth_headers, json={"name": "Eggs", "kitchen_id": sample_kitchen.id}
+        )
+        with app.app_context():
+            app.extensions["event_broker"].poll_once()
+        message = next(chunks)
+        assert b"event: item.created" in message
+        assert b'"name":"Eggs"' in message
+
+        response.close()
+        assert app.extensions["event_broker"].subscriber_count() == 0
+
+    def test_kitchen_events_validation(self, client, auth_headers, sample_kitchen):
+        """Test SSE authentication and parameter validation."""
+        url = f"/kitchens/{sample_kitchen.id}/events"
+        assert client.get(url).status_code == 401
+        token = auth_headers["Authorization"].split()[1]
+        assert client.get(f"{url}?jwt={token}").status_code == 401
+
+        other = client.post("/kitchens", json={"name": "Other kitchen"}).get_json()["kitchen"]
+        ticket = client.post(f"/kitchens/{other['id']}/events/ticket", headers=auth_headers)
+        assert ticket.status_code == 201
+        response = client.get(f"{url}?ticket={ticket.get_json()['ticket']}")
+        assert response.status_code == 401
+        assert response.get_json()["code"] == "invalid_ticket"
+        assert client.get(f"{url}?ticket=forged").status_code == 401
+        assert client.post("/kitchens/99999/events/ticket", headers=auth_headers).status_code == 404
+        response = client.get("/kitchens/99999/events", headers=auth_headers)
+        assert response.status_code == 404
+        response = client.get(
+            f"/kitchens/{sample_kitchen.id}/events",
+            headers={**auth_headers, "Last-Event-ID": "abc"},
+        )
+        assert response.status_code == 400
+
 
 @pytest.mark.integration
 class TestItemEndpoints:
@@ -164,6 +360,170 @@ class TestItemEndpoints:
         data = response.get_json()
         assert "items" in data
 
+    def test_get_items_paginated(self, client, auth_headers, sample_kitchen):
+        """Test walking item pages with next_cursor."""
+        for i in range(3):
+            client.post(
+                "/items",
+                headers=auth_headers,
+                json={"name": f"Item {i}", "kitchen_id": sample_kitchen.id},
+            )
+
+        response = client.get(
+            f"/items?kitchen_id={sample_kitchen.id}&limit=2&include_total=true",
+            headers=auth_headers,
+        )
+        data = response.get_json()
+        assert len(data["items"]) == 2
+        assert data["total"] == 3
+        assert data["next_cursor"]
+
+        response = client.get(
+            f"/items?kitchen_id={sample_kitchen.id}&limit=2&cursor={data['next_cursor']}",
+            headers=auth_headers,
+        )
+        data = response.get_json()
+        assert len(data["items"]) == 1
+        assert data["next_cursor"] is None
+        assert "total" not in data
+
+    def test_get_items_filtered_and_sorted(self, client, auth_headers, sample_kitchen):
+        """Test the low-stock shopping list view."""
+        for name, quantity in (("Milk", 10.0), ("Eggs", 5.0), ("Rice", 90.0)):
+            client.post(
+                "/items",
+                headers=auth_headers,
+                json={"name": name, "kitchen_id": sample_kitchen.id, "quantity_percent": quantity},
+            )
+        response = client.get(
+            f"/items?kitchen_id={sample_kitchen.id}&low_stock=true&sort=quantity&include_total=true",
+            headers=auth_headers,
+        )
+        data = response.get_json()
+        assert [item["name"] for item in data["items"]] == ["Eggs", "Milk"]
+        assert data["total"] == 2
+
+        for query in ("status=gone", "sort=price"):
+            response = client.get(
+                f"/items?kitchen_id={sample_kitchen.id}&{query}", headers=auth_headers
+            )
+            assert response.status_code == 400
+
+    def test_get_items_etag(self, client, auth_headers, sample_item, sample_kitchen):
+        """Test conditional GET on the item list."""
+        url = f"/items?kitchen_id={sample_kitchen.id}"
+        response = client.get(url, headers=auth_headers)
+        etag = response.headers["ETag"]
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.data == b""
+
+        response = client.get(f"{url}&sort=name", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+
+        # A value containing "&" must not collide with the query it spells out.
+        split = client.get(f"{url}&name_prefix=a&sort=name", headers=auth_headers)
+        joined = client.get(f"{url}&name_prefix=a%26sort%3Dname", headers=auth_headers)
+        assert split.headers["ETag"] != joined.headers["ETag"]
+
+        client.patch(
+            f"/items/{sample_item.id}/quantity",
+            headers=auth_headers,
+            json={"quantity_percent": 50.0},
+        )
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_get_items_invalid_cursor(self, client, auth_headers, sample_kitchen):
+        """Test that a malformed cursor is rejected."""
+        response = client.get(
+            f"/items?kitchen_id={sample_kitchen.id}&cursor=garbage",
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+        assert response.get_json()["field"] == "cursor"
+
+    def test_import_items(self, client, auth_headers, sample_kitchen):
+        """Test importing items from a multipart CSV upload."""
+        import io
+
+        response = client.post(
+            f"/items/import?kitchen_id={sample_kitchen.id}",
+            headers=auth_headers,
+            data={"file": (io.BytesIO(b"name,category\nMilk,Dairy\n,Dairy\n"), "items.csv")},
+            content_type="multipart/form-data",
+        )
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["imported"] == 1
+        assert data["failed"] == 1
+
+    def test_import_items_raw_body(self, client, auth_headers, sample_kitchen):
+        """Test importing NDJSON sent as the raw request body."""
+        response = client.post(
+            f"/items/import?kitchen_id={sample_kitchen.id}&format=jsonl",
+            headers=auth_headers,
+            data=b'{"name": "Milk"}\n',
+            content_type="application/x-ndjson",
+        )
+        assert response.status_code == 200
+        assert response.get_json()["imported"] == 1
+
+    def test_import_items_validation(self, client, auth_headers, sample_kitchen):
+        """Test import parameter validation."""
+        response = client.post("/items/import", headers=auth_headers, data=b"")
+        assert response.status_code == 400
+
+        response = client.post(
+            f"/items/import?kitchen_id={sample_kitchen.id}", headers=auth_headers, data=b""
+        )
+        assert response.status_code == 400
+        assert response.get_json()["field"] == "format"
+
+        response = client.post(
+            "/items/import?kitchen_id=99999",
+            headers=auth_headers,
+            data=b"name\nMilk\n",
+            content_type="text/csv",
+        )
+        assert response.status_code == 404
+
+        response = client.post(
+            f"/items/import?kitchen_id={sample_kitchen.id}",
+            headers=auth_headers,
+            data=b"name\nCaf\xe9\n",
+            content_type="text/csv",
+        )
+        assert response.status_code == 400
+        assert response.get_json()["code"] == "invalid_file"
+        assert response.get_json()["imported"] == 0
+
+    def test_get_item_changes(self, client, auth_headers, sample_item, sample_kitchen):
+        """Test polling item changes with a sync cursor."""
+        response = client.get(
+            f"/items/changes?kitchen_id={sample_kitchen.id}", headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [item["id"] for item in data["items"]] == [sample_item.id]
+
+        client.delete(f"/items/{sample_item.id}", headers=auth_headers)
+        response = client.get(
+            f"/items/changes?kitchen_id={sample_kitchen.id}&since={data['next_cursor']}",
+            headers=auth_headers,
+        )
+        data = response.get_json()
+        assert data["items"] == []
+        assert [item["id"] for item in data["deleted"]] == [sample_item.id]
+
+        response = client.get(
+            f"/items/changes?kitchen_id={sample_kitchen.id}&since=garbage", headers=auth_headers
+        )
+        assert response.status_code == 400
+        assert response.get_json()["field"] == "since"
+
     def test_update_item_quantity(self, client, auth_headers, sample_item):
         """Test updating item quantity."""
         response = client.patch(
@@ -180,6 +540,20 @@ class TestItemEndpoints:
 class TestRestockLogEndpoints:
     """Test restock log API endpoints."""
 
+    def test_get_restock_intervals(self, client, auth_headers, sample_kitchen, sample_item):
+        """Test restock interval statistics for a kitchen."""
+        for _ in range(3):
+            client.post("/restocks", json={"item_id": sample_item.id}, headers=auth_headers)
+        response = client.get(
+            f"/restocks/intervals?kitchen_id={sample_kitchen.id}", headers=auth_headers
+        )
+        assert response.status_code == 200
+        (stats,) = response.get_json()["items"]
+        assert stats["item_id"] == sample_item.id
+        assert stats["restocks"] == 3
+
+        assert client.get("/restocks/intervals", headers=auth_headers).status_code == 400
+
     def test_create_restock_log(self, client, auth_headers, sample_item):
         """Test creating a restock log."""
         response = client.post(
@@ -191,6 +565,72 @@ class TestRestockLogEndpoints:
         data = response.get_json()
         assert data["log"]["item_id"] == sample_item.id
 
+    def test_bulk_restock(self, client, auth_headers, sample_item, sample_kitchen):
+        """Test bulk restock by item ids and by kitchen filter."""
+        response = client.post(
+            "/restocks/bulk",
+            headers=auth_headers,
+            json={"item_ids": [sample_item.id, 99999]},
+        )
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["restocked_item_ids"] == [sample_item.id]
+        assert data["not_found_item_ids"] == [99999]
+
+        response = client.post(
+            "/restocks/bulk",
+            headers=auth_headers,
+            json={"kitchen_id": sample_kitchen.id, "filter": "all"},
+        )
+        assert response.status_code == 200
+        assert response.get_json()["count"] == 1
+
+    def test_bulk_restock_validation(self, client, auth_headers, sample_kitchen):
+        """Test bulk restock request validation."""
+        response = client.post("/restocks/bulk", headers=auth_headers, json={})
+        assert response.status_code == 400
+
+        response = client.post("/restocks/bulk", headers=auth_headers, json={"item_ids": []})
+        assert response.status_code == 400
+
+        response = client.post(
+            "/restocks/bulk", headers=auth_headers, json={"item_ids": list(range(1, 1002))}
+        )
+        assert response.status_code == 400
+
+        response = client.post(
+            "/restocks/bulk",
+            headers=auth_headers,
+            json={"kitchen_id": sample_kitchen.id, "filter": "bogus"},
+        )
+        assert response.status_code == 400
+        assert response.get_json()["field"] == "filter"
+
+    def test_export_restock_logs_csv(self, client, auth_headers, sample_item, sample_kitchen):
+        """Test streaming restock logs as CSV."""
+        client.post("/restocks", headers=auth_headers, json={"item_id": sample_item.id})
+        response = client.get(
+            f"/restocks/export?kitchen_id={sample_kitchen.id}&format=csv",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "text/csv"
+        lines = response.get_data(as_text=True).splitlines()
+        assert lines[0] == "id,user_id,item_id,created_at"
+        assert len(lines) == 2
+
+    def test_export_restock_logs_validation(self, client, auth_headers, sample_kitchen):
+        """Test export parameter validation."""
+        assert client.get("/restocks/export", headers=auth_headers).status_code == 400
+        response = client.get(
+            f"/restocks/export?kitchen_id={sample_kitchen.id}&format=xml", headers=auth_headers
+        )
+        assert response.status_code == 400
+        response = client.get(
+            f"/restocks/export?kitchen_id={sample_kitchen.id}&to=tomorrow", headers=auth_headers
+        )
+        assert response.get_json()["field"] == "to"
+
     def test_get_restock_logs_by_item(self, client, auth_headers, sample_item):
         """Test getting restock logs by item."""
         response = client.get(
@@ -226,6 +666,165 @@ class TestConsumptionLogEndpoints:
         )
         assert response.status_code == 400
 
+    def test_create_consumption_log_batch(self, client, auth_headers, sample_item):
+        """Test batch ingestion with per-entry results."""
+        response = client.post(
+            "/consumptions/batch",
+            headers=auth_headers,
+            json={
+                "entries": [
+                    {
+                        "item_id": sample_item.id,
+                        "percent_used": 10.0,
+                        "occurred_at": "2026-01-02T03:04:05Z",
+                    },
+                    {"item_id": sample_item.id, "percent_used": 150.0},
+                    {"item_id": sample_item.id},
+                    {"item_id": sample_item.id, "percent_used": 5, "occurred_at": "yesterday"},
+                    {"item_id": 99999, "percent_used": 5.0},
+                    {"item_id": True, "percent_used": 5.0},
+                    {"item_id": sample_item.id, "percent_used": True},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["created"] == 1
+        assert data["failed"] == 6
+        assert [r["index"] for r in data["results"]] == [0, 1, 2, 3, 4, 5, 6]
+        assert data["results"][0]["status"] == "created"
+        assert data["results"][1]["field"] == "percent_used"
+        assert data["results"][2]["code"] == "missing_fields"
+        assert data["results"][3]["field"] == "occurred_at"
+        assert data["results"][4]["code"] == "not_found"
+        assert data["results"][5]["field"] == "item_id"
+        assert data["results"][6]["field"] == "percent_used"
+
+    def test_create_consumption_log_batch_requires_entries(self, client, auth_headers):
+        """Test that an empty or oversized batch is rejected."""
+        response = client.post("/consumptions/batch", headers=auth_headers, json={})
+        assert response.status_code == 400
+
+        response = client.post(
+            "/consumptions/batch",
+            headers=auth_headers,
+            json={"entries": [{"item_id": 1, "percent_used": 1}] * 501},
+        )
+        assert response.status_code == 400
+
+    def test_export_consumption_logs_ndjson(
+        self, client, auth_headers, sample_item, sample_kitchen
+    ):
+        """Test streaming consumption logs as NDJSON with a date range."""
+        import json
+
+        client.post(
+            "/consumptions/batch",
+            headers=auth_headers,
+            json={
+                "entries": [
+                    {
+                        "item_id": sample_item.id,
+                        "percent_used": 5,
+                        "occurred_at": "2026-01-01T00:00:00Z",
+                    },
+                    {
+                        "item_id": sample_item.id,
+                        "percent_used": 5,
+                        "occurred_at": "2026-02-01T00:00:00Z",
+                    },
+                ]
+            },
+        )
+        response = client.get(
+            f"/consumptions/export?kitchen_id={sample_kitchen.id}&from=2026-01-15T00:00:00Z",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [row["created_at"] for row in rows] == ["2026-02-01T00:00:00"]
+
+        response = client.get(
+            f"/consumptions/export?kitchen_id={sample_kitchen.id}&from=nope", headers=auth_headers
+        )
+        assert response.status_code == 400
+
+    def test_get_consumption_daily(self, client, auth_headers, sample_item, sample_kitchen):
+        """Test daily totals from the rollup and range validation."""
+        client.post(
+            "/consumptions",
+            json={"item_id": sample_item.id, "percent_used": 12.5},
+            headers=auth_headers,
+        )
+        response = client.get(
+            f"/consumptions/daily?kitchen_id={sample_kitchen.id}", headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [(row["item_id"], row["percent_used"], row["events"]) for row in data["days"]] == [
+            (sample_item.id, 12.5, 1)
+        ]
+        assert data["days"][0]["day"] == datetime.utcnow().date().isoformat()
+
+        for query in ("", "?item_id=1&from=2026-13-01", "?item_id=1&from=2026-02-01&to=2026-01-01"):
+            response = client.get(f"/consumptions/daily{query}", headers=auth_headers)
+            assert response.status_code == 400
+
+    def test_get_consumption_logs_etag(self, client, auth_headers, sample_item, sample_kitchen):
+        """Test that a new consumption log invalidates the kitchen log ETag."""
+        url = f"/consumptions?kitchen_id={sample_kitchen.id}"
+        etag = client.get(url, headers=auth_headers).headers["ETag"]
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
+        client.post(
+            "/consumptions",
+            headers=auth_headers,
+            json={"item_id": sample_item.id, "percent_used": 10.0},
+        )
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.get_json()["logs"]) == 1
+
+    def test_get_consumption_logs_paginated(
+        self, client, auth_headers, sample_item, sample_kitchen
+    ):
+        """Test limit/cursor paging, time bounds and validation on the log listing."""
+        client.post(
+            "/consumptions/batch",
+            headers=auth_headers,
+            json={
+                "entries": [
+                    {
+                        "item_id": sample_item.id,
+                        "percent_used": 1.0,
+                        "occurred_at": f"2026-03-0{day}T12:00:00Z",
+                    }
+                    for day in (1, 2, 3)
+                ]
+            },
+        )
+        url = f"/consumptions?kitchen_id={sample_kitchen.id}"
+        first = client.get(f"{url}&limit=2", headers=auth_headers).get_json()
+        assert [log["created_at"][:10] for log in first["logs"]] == ["2026-03-03", "2026-03-02"]
+        second = client.get(
+            f"{url}&limit=2&cursor={first['next_cursor']}", headers=auth_headers
+        ).get_json()
+        assert [log["created_at"][:10] for log in second["logs"]] == ["2026-03-01"]
+        assert second["next_cursor"] is None
+
+        ranged = client.get(
+            f"/consumptions?item_id={sample_item.id}&from=2026-03-02T00:00:00Z&to=2026-03-03",
+            headers=auth_headers,
+        ).get_json()
+        assert [log["created_at"][:10] for log in ranged["logs"]] == ["2026-03-02"]
+
+        for query, field in (("limit=0", "limit"), ("from=soon", "from"), ("cursor=bad", "cursor")):
+            response = client.get(f"{url}&{query}", headers=auth_headers)
+            assert response.status_code == 400
+            assert response.get_json()["field"] == field
+
     def test_get_consumption_logs_by_kitchen(self, client, auth_headers, sample_kitchen):
         """Test getting consumption logs by kitchen."""
         response = client.get(
@@ -101,6 +101,50 @@ class TestAuthService:
             )
             assert user is None
 
+    def test_authenticate_rehashes_outdated_hash(
+        self, app, sample_user, sample_kitchen, db_session
+    ):
+        """Test that a successful login upgrades a hash made with old parameters."""
+        from werkzeug.security import generate_password_hash
+
+        with app.app_context():
+            sample_user.password_hash = generate_password_hash("Test#123", "pbkdf2:sha256:500")
+            db_session.commit()
+
+            user = AuthService.authenticate_user(
+                display_name=sample_user.display_name,
+                password="Test#123",
+                kitchen_code=sample_kitchen.code,
+            )
+            assert user is not None
+            assert user.password_hash.startswith(app.config["PASSWORD_HASH_METHOD"] + "$")
+            assert AuthService.check_password(user, "Test#123")
+
+    def test_authenticate_skips_rehash_when_pool_busy(
+        self, app, sample_user, sample_kitchen, db_session, monkeypatch
+    ):
+        """Test that a full hashing pool keeps the old hash instead of failing the login."""
+        from werkzeug.security import generate_password_hash
+
+        from app.services.password_hasher import PasswordHasher, PasswordHasherBusy
+
+        with app.app_context():
+            old_hash = generate_password_hash("Test#123", "pbkdf2:sha256:500")
+            sample_user.password_hash = old_hash
+            db_session.commit()
+
+            def busy(self, password):
+                raise PasswordHasherBusy()
+
+            monkeypatch.setattr(PasswordHasher, "hash", busy)
+            user = AuthService.authenticate_user(
+                display_name=sample_user.display_name,
+                password="Test#123",
+                kitchen_code=sample_kitchen.code,
+            )
+            assert user is not None
+            assert user.password_hash == old_hash
+
     def test_generate_tokens(self, app, sample_user):
         """Test JWT token generation."""
         with app.app_context():
@@ -2,10 +2,18 @@
 Unit tests for ConsumptionLogService.
 """
 
+import os
+import threading
+
 import pytest
 
-from app.models.item import ItemStatus
+from app import create_app
+from app.extensions import db
+from app.models.item import Item, ItemStatus
+from app.models.kitchen import Kitchen
+from app.models.user_model import User
 from app.services.consumption_log_service import ConsumptionLogService
+from config import TestingConfig
 
 
 @pytest.mark.unit
@@ -69,6 +77,54 @@ class TestConsumptionLogService:
             )
             assert log is None
 
+    def test_create_consumption_logs_batch(self, app, sample_user, sample_item):
+        """Test batch creation sums usage per item and reports each entry."""
+        with app.app_context():
+            from datetime import datetime
+
+            item_id = sample_item.id
+            occurred_at = datetime(2026, 1, 2, 3, 4, 5)
+            results = ConsumptionLogService.create_consumption_logs(
+                sample_user.id,
+                [
+                    {"item_id": item_id, "percent_used": 30.0, "occurred_at": occurred_at},
+                    {"item_id": 99999, "percent_used": 10.0},
+                    {"item_id": item_id, "percent_used": 20.0},
+                ],
+            )
+            assert [r["status"] for r in results] == ["created", "error", "created"]
+            assert results[1]["code"] == "not_found"
+
+            updated_item = db.session.get(Item, item_id)
+            assert updated_item.quantity_percent == 50.0
+
+            first = ConsumptionLogService.get_consumption_log_by_id(results[0]["id"])
+            assert first.created_at == occurred_at
+
+    def test_create_consumption_logs_batch_depletes_item(self, app, sample_user, sample_item):
+        """Test that a batch clamps the summed usage at zero and flips status."""
+        with app.app_context():
+            item_id = sample_item.id
+            ConsumptionLogService.create_consumption_logs(
+                sample_user.id,
+                [{"item_id": item_id, "percent_used": 70.0}] * 2,
+            )
+            updated_item = db.session.get(Item, item_id)
+            assert updated_item.quantity_percent == 0.0
+            assert updated_item.status == ItemStatus.NEEDED
+
+    def test_create_consumption_logs_batch_locks_kitchen_first(
+        self, app, sample_user, sample_item, statements
+    ):
+        """Test that a batch writes the kitchen row before the logs and items."""
+        statements.clear()
+        ConsumptionLogService.create_consumption_logs(
+            sample_user.id, [{"item_id": sample_item.id, "percent_used": 5.0}]
+        )
+        writes = [s.split()[:3] for s in statements if s.startswith(("UPDATE", "INSERT"))]
+        assert writes[0] == ["UPDATE", "kitchens", "SET"]
+        assert ["INSERT", "INTO", "consumption_logs"] in writes[1:]
+
     def test_get_consumption_log_by_id(self, app, sample_user, sample_item):
         """Test getting consumption log by ID."""
         with app.app_context():
@@ -120,6 +176,84 @@ class TestConsumptionLogService:
             assert len(logs) >= 1
             assert any(log_entry.id == log.id for log_entry in logs)
 
+    def test_get_consumption_logs_pages_and_range(
+        self, app, sample_user, sample_item, sample_kitchen
+    ):
+        """Test from/to bounds and walking (created_at, id) cursor pages, ties included."""
+        from datetime import datetime
+
+        from app.services.pagination import created_at_cursor
+
+        with app.app_context():
+            ConsumptionLogService.create_consumption_logs(
+                sample_user.id,
+                [
+                    {"item_id": sample_item.id, "percent_used": 1.0, "occurred_at": at}
+                    for at in (
+                        datetime(2026, 1, 1),
+                        datetime(2026, 1, 2),
+                        datetime(2026, 1, 2),
+                        datetime(2026, 1, 2),
+                        datetime(2026, 1, 3),
+                    )
+                ],
+            )
+            expected = [
+                (log.created_at, log.id)
+                for log in ConsumptionLogService.get_consumption_logs_by_item(sample_item.id)
+            ]
+            assert expected == sorted(expected, reverse=True)
+
+            for getter, owner_id in (
+                (ConsumptionLogService.get_consumption_logs_by_item, sample_item.id),
+                (ConsumptionLogService.get_consumption_logs_by_kitchen, sample_kitchen.id),
+                (ConsumptionLogService.get_consumption_logs_by_user, sample_user.id),
+            ):
+                seen, cursor = [], None
+                while True:
+                    page = getter(owner_id, cursor=cursor, limit=2)
+                    seen.extend((log.created_at, log.id) for log in page)
+                    if len(page) < 2:
+                        break
+                    cursor = created_at_cursor(page[-1])
+                assert seen == expected
+
+            in_range = ConsumptionLogService.get_consumption_logs_by_kitchen(
+                sample_kitchen.id, start=datetime(2026, 1, 2), end=datetime(2026, 1, 3)
+            )
+            assert [log.created_at for log in in_range] == [datetime(2026, 1, 2)] * 3
+
+            with pytest.raises(ValueError):
+                ConsumptionLogService.get_consumption_logs_by_item(sample_item.id, cursor="bad")
+
+    def test_iter_consumption_logs_by_kitchen(self, app, sample_user, sample_item, sample_kitchen):
+        """Test streaming a kitchen's logs within a date range."""
+        with app.app_context():
+            from datetime import datetime
+
+            ConsumptionLogService.create_consumption_logs(
+                sample_user.id,
+                [
+                    {
+                        "item_id": sample_item.id,
+                        "percent_used": 1.0,
+                        "occurred_at": datetime(2026, 1, d),
+                    }
+                    for d in (1, 2, 3)
+                ],
+            )
+            rows = list(
+                ConsumptionLogService.iter_consumption_logs_by_kitchen(
+                    sample_kitchen.id,
+                    start=datetime(2026, 1, 2),
+                    end=datetime(2026, 1, 3),
+                    batch_size=1,
+                )
+            )
+            assert len(rows) == 1
+            assert rows[0]["created_at"] == "2026-01-02T00:00:00"
+            assert rows[0]["percent_used"] == 1.0
+
     def test_get_consumption_logs_by_user(self, app, sample_user, sample_item):
         """Test getting consumption logs by user."""
         with app.app_context():
@@ -153,3 +287,81 @@ class TestConsumptionLogService:
         with app.app_context():
             success = ConsumptionLogService.delete_consumption_log(99999)
             assert success is False
+
+
+def _database_urls():
+    urls = [pytest.param("sqlite", id="sqlite")]
+    mysql_url = os.getenv("MYSQL_TEST_DATABASE_URL")
+    urls.append(
+        pytest.param(
+            mysql_url,
+            id="mysql",
+            marks=pytest.mark.skipif(not mysql_url, reason="MYSQL_TEST_DATABASE_URL not set"),
+        )
+    )
+    return urls
+
+
+@pytest.fixture(params=_database_urls())
+def concurrent_app(request, tmp_path, monkeypatch):
+    """App backed by a real (file or server) database so threads get separate connections."""
+    url = request.param
+    if url == "sqlite":
+        url = f"sqlite:///{tmp_path / 'concurrency.db'}"
+    monkeypatch.setattr(TestingConfig, "SQLALCHEMY_DATABASE_URI", url)
+    test_app = create_app("testing")
+    yield test_app
+    with test_app.app_context():
+        db.session.remove()
+        db.drop_all()
+        db.engine.dispose()
+
+
+@pytest.mark.integration
+@pytest.mark.service
+class TestConsumptionLogConcurrency:
+    """Stress concurrent consumption logging against a shared item."""
+
+    THREADS = 8
+    LOGS_PER_THREAD = 10
+
+    def test_concurrent_consumption_loses_no_updates(self, concurrent_app):
+        """Test that parallel decrements are all applied exactly once."""
+        with concurrent_app.app_context():
+            kitchen = Kitchen(code="654321", name="Stress Kitchen")
+            db.session.add(kitchen)
+            db.session.flush()
+            user = User(display_name="Stress", kitchen_id=kitchen.id, password_hash="x")
+            item = Item(name="Flour", kitchen_id=kitchen.id, quantity_percent=100.0)
+            db.session.add_all([user, item])
+            db.session.commit()
+            user_id, item_id = user.id, item.id
+
+        barrier = threading.Barrier(self.THREADS)
+        errors = []
+
+        def worker():
+            try:
+                with concurrent_app.app_context():
+                    barrier.wait()
+                    for _ in range(self.LOGS_PER_THREAD):
+                        ConsumptionLogService.create_consumption_log(
+                            user_id=user_id,
+                            item_id=item_id,
+                            percent_used=1.0,
+                        )
+            except Exception as exc:  # pragma: no cover - surfaced by the assertion below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        total = self.THREADS * self.LOGS_PER_THREAD
+        with concurrent_app.app_context():
+            item = db.session.get(Item, item_id)
+            assert item.quantity_percent == 100.0 - total
+            assert len(ConsumptionLogService.get_consumption_logs_by_item(item_id)) == total
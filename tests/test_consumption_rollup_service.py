@@ -0,0 +1,131 @@
+"""
+Unit tests for ConsumptionRollupService.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.models.consumption_daily import ConsumptionDaily
+from app.models.consumption_log import ConsumptionLog
+from app.services.consumption_log_service import ConsumptionLogService
+from app.services.consumption_rollup_service import ConsumptionRollupService
+
+
+def _rollup() -> dict:
+    return {
+        (row.item_id, row.day): (round(row.percent_used, 6), row.events)
+        for row in ConsumptionDaily.query.all()
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestConsumptionRollupService:
+    """Test incremental maintenance, rebuild and queries of the daily rollup."""
+
+    def test_log_writes_keep_rollup_in_step(self, app, sample_user, sample_item):
+        """Test that single, batch and delete writes adjust the day's totals."""
+        today = datetime.utcnow().date()
+        yesterday = datetime.utcnow() - timedelta(days=1)
+
+        first = ConsumptionLogService.create_consumption_log(sample_user.id, sample_item.id, 10.0)
+        ConsumptionLogService.create_consumption_log(sample_user.id, sample_item.id, 5.0)
+        ConsumptionLogService.create_consumption_logs(
+            sample_user.id,
+            [
+                {"item_id": sample_item.id, "percent_used": 1.0},
+                {"item_id": sample_item.id, "percent_used": 2.0, "occurred_at": yesterday},
+                {"item_id": sample_item.id, "percent_used": 3.0, "occurred_at": yesterday},
+            ],
+        )
+        assert _rollup() == {
+            (sample_item.id, today): (16.0, 3),
+            (sample_item.id, yesterday.date()): (5.0, 2),
+        }
+
+        ConsumptionLogService.delete_consumption_log(first.id)
+        assert _rollup()[(sample_item.id, today)] == (6.0, 2)
+
+        for log in ConsumptionLog.query.filter(ConsumptionLog.created_at < today).all():
+            ConsumptionLogService.delete_consumption_log(log.id)
+        assert (sample_item.id, yesterday.date()) not in _rollup()
+
+    def test_rebuild_matches_incremental_rollup(self, app, db_session, sample_user, sample_item):
+        """Test that backfilling from the log reproduces the same rows."""
+        base = datetime(2026, 3, 1, 12)
+        db_session.add_all(
+            ConsumptionLog(
+                user_id=sample_user.id,
+                item_id=sample_item.id,
+                percent_used=1.5,
+                created_at=base + timedelta(hours=7 * i),
+            )
+            for i in range(20)
+        )
+        db_session.commit()
+
+        assert ConsumptionRollupService.rebuild() == 7
+        rebuilt = _rollup()
+        assert sum(events for _, events in rebuilt.values()) == 20
+        assert rebuilt[(sample_item.id, date(2026, 3, 1))] == (3.0, 2)
+
+        db_session.query(ConsumptionDaily).delete()
+        db_session.commit()
+        ConsumptionRollupService.record(
+            (log.item_id, log.created_at, log.percent_used) for log in ConsumptionLog.query
+        )
+        db_session.commit()
+        assert _rollup() == rebuilt
+
+        # A ranged rebuild only replaces rows inside the range.
+        db_session.query(ConsumptionDaily).update({"events": 99})
+        db_session.commit()
+        assert ConsumptionRollupService.rebuild(date(2026, 3, 2), date(2026, 3, 3)) == 1
+        assert _rollup()[(sample_item.id, date(2026, 3, 2))][1] == 4
+        assert _rollup()[(sample_item.id, date(2026, 3, 1))][1] == 99
+
+    def test_get_daily_usage(self, app, db_session, sample_user, sample_item, sample_kitchen):
+        """Test that queries are bounded by day and scoped to the item or kitchen."""
+        ConsumptionRollupService.record(
+            (sample_item.id, datetime(2026, 1, 1) + timedelta(days=i), 10.0) for i in range(150)
+        )
+        db_session.commit()
+
+        rows = ConsumptionRollupService.get_daily_usage(
+            date(2026, 2, 1), date(2026, 5, 2), item_id=sample_item.id
+        )
+        assert len(rows) == 90
+        assert rows[0].day == date(2026, 2, 1)
+        assert rows[-1].to_dict() == {
+            "item_id": sample_item.id,
+            "day": "2026-05-01",
+            "percent_used": 10.0,
+            "events": 1,
+        }
+        by_kitchen = ConsumptionRollupService.get_daily_usage(
+            date(2026, 1, 1), date(2026, 1, 8), kitchen_id=sample_kitchen.id
+        )
+        assert len(by_kitchen) == 7
+        assert not ConsumptionRollupService.get_daily_usage(
+            date(2026, 1, 1), date(2026, 1, 8), kitchen_id=sample_kitchen.id + 1
+        )
+
+    def test_backfill_command(self, app, db_session, sample_user, sample_item):
+        """Test that the CLI rebuilds the rollup."""
+        db_session.add(
+            ConsumptionLog(
+                user_id=sample_user.id,
+                item_id=sample_item.id,
+                percent_used=4.0,
+                created_at=datetime(2026, 2, 3, 8),
+            )
+        )
+        db_session.commit()
+
+        result = app.test_cli_runner().invoke(
+            args=["consumptions", "backfill", "--from", "2026-02-01", "--to", "2026-03-01"]
+        )
+        assert result.exit_code == 0
+        assert "Wrote 1 daily rollup row(s)" in result.output
+        assert _rollup() == {(sample_item.id, date(2026, 2, 3)): (4.0, 1)}
@@ -0,0 +1,102 @@
+"""
+Unit tests for ForecastService.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.models.consumption_log import ConsumptionLog
+from app.models.item import Item
+from app.models.restock_log import RestockLog
+from app.services.forecast_service import ForecastService
+
+NOW = datetime(2026, 6, 1, 12)
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestForecastService:
+    """Test burn-rate fitting and low-stock projections."""
+
+    def test_burn_rates_weight_recent_usage(self):
+        """Test that steady usage gives its daily rate and recent usage outweighs old usage."""
+        rates, counts = ForecastService.burn_rates(
+            np.array([1, 2, 3]),
+            np.full(3, 20.0),
+            np.concatenate([np.full(20, 1), [2, 3]]),
+            np.concatenate([np.arange(20) + 0.5, [1.0, 19.5]]),
+            np.concatenate([np.full(20, 10.0), [50.0, 50.0]]),
+            half_life_days=7,
+            min_span_days=1,
+        )
+        assert rates[0] == pytest.approx(10.0, rel=0.01)
+        assert rates[1] > rates[2] > 0
+        assert counts.tolist() == [20, 1, 1]
+
+    def test_forecast_kitchen(self, app, db_session, sample_kitchen, sample_user):
+        """Test projections, ordering, and that usage before the last restock is ignored."""
+        steady = Item(name="Steady", kitchen_id=sample_kitchen.id, quantity_percent=60.0)
+        idle = Item(name="Idle", kitchen_id=sample_kitchen.id, quantity_percent=80.0)
+        low = Item(name="Low", kitchen_id=sample_kitchen.id, quantity_percent=10.0)
+        restocked = Item(name="Restocked", kitchen_id=sample_kitchen.id, quantity_percent=100.0)
+        db_session.add_all([steady, idle, low, restocked])
+        db_session.flush()
+
+        logs = [
+            ConsumptionLog(
+                user_id=sample_user.id,
+                item_id=steady.id,
+                percent_used=10.0,
+                created_at=NOW - timedelta(days=i + 0.5),
+            )
+            for i in range(20)
+        ]
+        logs.append(
+            ConsumptionLog(
+                user_id=sample_user.id,
+                item_id=restocked.id,
+                percent_used=90.0,
+                created_at=NOW - timedelta(days=3),
+            )
+        )
+        db_session.add_all(logs)
+        db_session.add_all(
+            [
+                RestockLog(
+                    user_id=sample_user.id, item_id=steady.id, created_at=NOW - timedelta(days=20)
+                ),
+                RestockLog(
+                    user_id=sample_user.id,
+                    item_id=restocked.id,
+                    created_at=NOW - timedelta(days=2),
+                ),
+            ]
+        )
+        db_session.commit()
+
+        forecast = ForecastService.forecast_kitchen(sample_kitchen.id, now=NOW)
+        by_name = {item["name"]: item for item in forecast["items"]}
+        assert [item["name"] for item in forecast["items"]] == [
+            "Low",
+            "Steady",
+            "Idle",
+            "Restocked",
+        ]
+
+        assert by_name["Low"]["days_until_low_stock"] == 0.0
+        assert by_name["Steady"]["burn_rate_per_day"] == pytest.approx(10.0, rel=0.01)
+        assert by_name["Steady"]["days_until_low_stock"] == pytest.approx(4.0, abs=0.1)
+        assert by_name["Steady"]["days_until_empty"] == pytest.approx(6.0, abs=0.1)
+        assert by_name["Steady"]["low_stock_at"].startswith("2026-06-05")
+        assert by_name["Steady"]["samples"] == 20
+        for name in ("Idle", "Restocked"):
+            assert by_name[name]["burn_rate_per_day"] == 0
+            assert by_name[name]["samples"] == 0
+            assert by_name[name]["days_until_low_stock"] is None
+            assert by_name[name]["low_stock_at"] is None
+
+    def test_forecast_empty_kitchen(self, app, sample_kitchen):
+        """Test that a kitchen without items gets an empty forecast."""
+        assert ForecastService.forecast_kitchen(sample_kitchen.id, now=NOW)["items"] == []
@@ -0,0 +1,124 @@
+"""
+Unit tests for ItemImportService and the items import command.
+"""
+
+import csv
+import io
+
+import pytest
+
+from app.models.item import Item, ItemStatus
+from app.services.item_import_service import (
+    ImportFileError,
+    ImportKitchenNotFound,
+    ItemImportService,
+)
+
+
+def _stream(text: str) -> io.BytesIO:
+    return io.BytesIO(text.encode())
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestItemImportService:
+    """Test ItemImportService methods."""
+
+    def test_import_csv(self, app, sample_kitchen):
+        """Test importing CSV rows, with defaults and per-row errors."""
+        with app.app_context():
+            data = (
+                "name,category,quantity_percent,low_stock_threshold,status\n"
+                "Milk,Dairy,80,25,in_stock\n"
+                "Eggs,,,,\n"
+                ",Dairy,50,10,in_stock\n"
+                "Flour,Baking,150,10,needed\n"
+            )
+            report = ItemImportService.import_items(
+                sample_kitchen.id, _stream(data), "csv", batch_size=1
+            )
+            assert report["imported"] == 2
+            assert report["failed"] == 2
+            assert report["errors"][0] == {"row": 4, "errors": {"name": "name is required"}}
+            assert "quantity_percent" in report["errors"][1]["errors"]
+
+            eggs = Item.query.filter_by(name="Eggs").one()
+            assert eggs.kitchen_id == sample_kitchen.id
+            assert eggs.category is None
+            assert eggs.quantity_percent == 100.0
+            assert eggs.low_stock_threshold == 20.0
+            assert eggs.status == ItemStatus.IN_STOCK
+
+    def test_import_ndjson(self, app, sample_kitchen):
+        """Test importing NDJSON rows including malformed lines."""
+        with app.app_context():
+            data = (
+                '{"name": "Rice", "status": "needed"}\n'
+                "\n"
+                "not json\n"
+                '["a list"]\n'
+                '{"name": "' + "x" * 121 + '"}\n'
+                '{"name": "Oil", "status": "gone"}\n'
+            )
+            report = ItemImportService.import_items(sample_kitchen.id, _stream(data), "ndjson")
+            assert report["imported"] == 1
+            assert [error["row"] for error in report["errors"]] == [3, 4, 5, 6]
+            assert Item.query.filter_by(name="Rice").one().status == ItemStatus.NEEDED
+
+    def test_import_truncates_errors(self, app, sample_kitchen):
+        """Test that the error list is capped."""
+        with app.app_context():
+            data = "name\n" + ",\n" * 5
+            report = ItemImportService.import_items(
+                sample_kitchen.id, _stream(data), "csv", max_errors=2
+            )
+            assert report["failed"] == 5
+            assert len(report["errors"]) == 2
+            assert report["errors_truncated"] is True
+
+    def test_import_unknown_kitchen(self, app):
+        """Test importing into a missing kitchen or with an unknown format."""
+        with app.app_context():
+            with pytest.raises(ImportKitchenNotFound):
+                ItemImportService.import_items(99999, _stream("name\nMilk\n"), "csv")
+            with pytest.raises(ValueError):
+                ItemImportService.import_items(99999, _stream(""), "xml")
+
+    def test_import_unreadable_file(self, app, sample_kitchen):
+        """Test that undecodable bytes and broken CSV stop the import with ImportFileError."""
+        with app.app_context():
+            data = b"name\nMilk\n" + b"x" * 10000 + b"\nCaf\xe9\n"
+            with pytest.raises(ImportFileError, match="UTF-8") as excinfo:
+                ItemImportService.import_items(sample_kitchen.id, io.BytesIO(data), "csv")
+            assert excinfo.value.imported == 1
+            assert Item.query.filter_by(name="Milk").count() == 1
+
+            oversized = "name\n" + "x" * (csv.field_size_limit() + 1) + "\n"
+            with pytest.raises(ImportFileError, match="Malformed CSV"):
+                ItemImportService.import_items(sample_kitchen.id, _stream(oversized), "csv")
+
+
+@pytest.mark.integration
+class TestItemImportCommand:
+    """Test the items import CLI command."""
+
+    def test_import_command(self, app, sample_kitchen, tmp_path):
+        """Test importing a file from the command line."""
+        path = tmp_path / "items.jsonl"
+        path.write_text('{"name": "Salt"}\n{"name": ""}\n')
+        result = app.test_cli_runner().invoke(
+            args=["items", "import", str(sample_kitchen.id), str(path)]
+        )
+        assert result.exit_code == 0
+        assert "Imported 1 item(s), 1 row(s) failed" in result.output
+        assert "row 2: name: name is required" in result.output
+
+    def test_import_command_errors(self, app, tmp_path):
+        """Test unknown extensions and kitchens are reported."""
+        path = tmp_path / "items.txt"
+        path.write_text("name\nSalt\n")
+        runner = app.test_cli_runner()
+        assert runner.invoke(args=["items", "import", "1", str(path)]).exit_code != 0
+        result = runner.invoke(args=["items", "import", "99999", str(path), "--format", "csv"])
+        assert result.exit_code != 0
+        assert "Kitchen not found" in result.output
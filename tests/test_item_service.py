@@ -65,6 +65,139 @@ class TestItemService:
             assert len(items) >= 1
             assert any(i.id == sample_item.id for i in items)
 
+    def test_get_items_by_kitchen_paginates(self, app, sample_kitchen):
+        """Test keyset pagination over a kitchen's items."""
+        with app.app_context():
+            created = [
+                ItemService.create_item(name=f"Item {i}", kitchen_id=sample_kitchen.id)
+                for i in range(5)
+            ]
+            first = ItemService.get_items_by_kitchen(sample_kitchen.id, limit=2)
+            assert [i.id for i in first] == [created[0].id, created[1].id]
+
+            cursor = ItemService.cursor_for(first[-1])
+            second = ItemService.get_items_by_kitchen(sample_kitchen.id, limit=2, cursor=cursor)
+            assert [i.id for i in second] == [created[2].id, created[3].id]
+
+    def test_get_items_by_kitchen_rejects_foreign_cursor(self, app, sample_item):
+        """Test that a cursor from another kitchen is rejected."""
+        with app.app_context():
+            cursor = ItemService.cursor_for(sample_item)
+            with pytest.raises(ValueError):
+                ItemService.get_items_by_kitchen(sample_item.kitchen_id + 1, cursor=cursor)
+            with pytest.raises(ValueError):
+                ItemService.get_items_by_kitchen(sample_item.kitchen_id, cursor="not-a-cursor")
+
+    def _make_inventory(self, kitchen_id):
+        specs = [
+            ("Milk", "Dairy", 10.0, ItemStatus.IN_STOCK),
+            ("Butter", "Dairy", 60.0, ItemStatus.IN_STOCK),
+            ("Bread", "Bakery", 0.0, ItemStatus.NEEDED),
+            ("Brie_50%", "Dairy", 60.0, ItemStatus.IN_STOCK),
+        ]
+        return {
+            name: ItemService.create_item(
+                name=name,
+                kitchen_id=kitchen_id,
+                category=category,
+                quantity_percent=quantity,
+                status=status,
+            ).id
+            for name, category, quantity, status in specs
+        }
+
+    def test_get_items_by_kitchen_filters(self, app, sample_kitchen):
+        """Test SQL-side filters on a kitchen's items."""
+        with app.app_context():
+            ids = self._make_inventory(sample_kitchen.id)
+            kitchen_id = sample_kitchen.id
+
+            def names(**filters):
+                return {i.name for i in ItemService.get_items_by_kitchen(kitchen_id, **filters)}
+
+            assert names(status=ItemStatus.NEEDED) == {"Bread"}
+            assert names(category="Dairy") == {"Milk", "Butter", "Brie_50%"}
+            assert names(name_prefix="B") == {"Butter", "Bread", "Brie_50%"}
+            assert names(name_prefix="Brie_5") == {"Brie_50%"}
+            assert names(name_prefix="Bri%") == set()
+            assert names(low_stock=True) == {"Milk", "Bread"}
+            assert ItemService.count_items_by_kitchen(kitchen_id, category="Dairy") == 3
+            assert ids
+
+    def test_get_items_by_kitchen_sorted_pages(self, app, sample_kitchen):
+        """Test keyset pages under non-id sorts, including ties."""
+        with app.app_context():
+            self._make_inventory(sample_kitchen.id)
+            for sort, expected in (
+                ("name", ["Bread", "Brie_50%", "Butter", "Milk"]),
+                ("-quantity", ["Brie_50%", "Butter", "Milk", "Bread"]),
+                ("-id", ["Brie_50%", "Bread", "Butter", "Milk"]),
+            ):
+                seen, cursor = [], None
+                while True:
+                    page = ItemService.get_items_by_kitchen(
+                        sample_kitchen.id, limit=1, cursor=cursor, sort=sort
+                    )
+                    if not page:
+                        break
+                    seen.append(page[0].name)
+                    cursor = ItemService.cursor_for(page[0], sort)
+                assert seen == expected, sort
+
+    def test_get_items_by_kitchen_sort_validation(self, app, sample_item):
+        """Test unknown sorts and cursors issued for another sort are rejected."""
+        with app.app_context():
+            with pytest.raises(ValueError):
+                ItemService.get_items_by_kitchen(sample_item.kitchen_id, sort="price")
+            cursor = ItemService.cursor_for(sample_item, "name")
+            with pytest.raises(ValueError):
+                ItemService.get_items_by_kitchen(sample_item.kitchen_id, cursor=cursor)
+
+    def test_count_items_by_kitchen(self, app, sample_kitchen, sample_item):
+        """Test counting a kitchen's items."""
+        with app.app_context():
+            assert ItemService.count_items_by_kitchen(sample_kitchen.id) == 1
+            assert ItemService.count_items_by_kitchen(99999) == 0
+
+    def test_get_item_changes(self, app, sample_kitchen, sample_user):
+        """Test delta sync over creates, updates, consumption and deletes."""
+        from app.services.consumption_log_service import ConsumptionLogService
+        from app.services.restock_log_service import RestockLogService
+
+        with app.app_context():
+            milk = ItemService.create_item(name="Milk", kitchen_id=sample_kitchen.id)
+            eggs = ItemService.create_item(name="Eggs", kitchen_id=sample_kitchen.id)
+            bread = ItemService.create_item(name="Bread", kitchen_id=sample_kitchen.id)
+            assert milk.version < eggs.version < bread.version
+
+            full = ItemService.get_item_changes(sample_kitchen.id)
+            assert [i.id for i in full["items"]] == [milk.id, eggs.id, bread.id]
+            assert full["deleted"] == []
+            assert full["has_more"] is False
+
+            since = full["next_cursor"]
+            assert ItemService.get_item_changes(sample_kitchen.id, since)["items"] == []
+
+            ConsumptionLogService.create_consumption_log(sample_user.id, milk.id, 10.0)
+            RestockLogService.bulk_restock(sample_user.id, item_ids=[eggs.id])
+            ItemService.delete_item(bread.id)
+
+            changes = ItemService.get_item_changes(sample_kitchen.id, since, limit=2)
+            assert [i.id for i in changes["items"]] == [milk.id, eggs.id]
+            assert changes["has_more"] is True
+
+            rest = ItemService.get_item_changes(sample_kitchen.id, changes["next_cursor"])
+            assert rest["items"] == []
+            assert [t.item_id for t in rest["deleted"]] == [bread.id]
+            assert rest["has_more"] is False
+
+    def test_get_item_changes_rejects_foreign_cursor(self, app, sample_kitchen, sample_item):
+        """Test that a sync cursor from another kitchen is rejected."""
+        with app.app_context():
+            cursor = ItemService.get_item_changes(sample_kitchen.id)["next_cursor"]
+            with pytest.raises(ValueError):
+                ItemService.get_item_changes(sample_kitchen.id + 1, cursor)
+
     def test_update_item(self, app, sample_item):
         """Test updating item."""
         with app.app_context():
@@ -151,3 +284,14 @@ class TestItemService:
         with app.app_context():
             updated = ItemService.update_quantity(99999, 50.0)
             assert updated is None
+
+    def test_updates_lock_kitchen_before_item(self, app, sample_item, statements):
+        """Test that the kitchen row is written before the item row on update paths."""
+        for update in (
+            lambda: ItemService.update_item(sample_item.id, name="Renamed", quantity_percent=40.0),
+            lambda: ItemService.update_quantity(sample_item.id, 0.0),
+        ):
+            statements.clear()
+            update()
+            writes = [s.split()[:2] for s in statements if s.startswith(("UPDATE", "INSERT"))]
+            assert writes[:2] == [["UPDATE", "kitchens"], ["UPDATE", "items"]]
@@ -0,0 +1,127 @@
+"""
+Unit tests for KitchenEventService and the in-process EventBroker.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.extensions import db
+from app.models.kitchen import Kitchen
+from app.services.consumption_log_service import ConsumptionLogService
+from app.services.item_service import ItemService
+from app.services.kitchen_event_service import KitchenEventService
+from app.services.restock_log_service import RestockLogService
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestKitchenEventService:
+    """Test that service writes publish events and how they are read back."""
+
+    def test_service_writes_publish_events(self, app, sample_kitchen, sample_user):
+        """Test that item, consumption and restock writes land in the outbox."""
+        with app.app_context():
+            item = ItemService.create_item(name="Milk", kitchen_id=sample_kitchen.id)
+            ConsumptionLogService.create_consumption_log(sample_user.id, item.id, 30.0)
+            RestockLogService.bulk_restock(
+                sample_user.id, kitchen_id=sample_kitchen.id, item_filter="all"
+            )
+            ItemService.update_item(item.id, name="Whole milk")
+
+            events = KitchenEventService.get_events_since(sample_kitchen.id, 0)
+            assert [e.type for e in events] == [
+                "item.created",
+                "consumption.created",
+                "items.changed",
+                "item.updated",
+            ]
+            assert [e.version for e in events] == sorted(e.version for e in events)
+            assert events[1].payload["item"]["quantity_percent"] == 70.0
+            assert events[2].payload == {"reason": "restock_bulk", "item_ids": [item.id]}
+
+    def test_get_events_for_kitchens(self, app, sample_kitchen):
+        """Test per-kitchen cursors when polling several kitchens at once."""
+        with app.app_context():
+            other = Kitchen(code="654321", name="Other")
+            db.session.add(other)
+            db.session.commit()
+            first = ItemService.create_item(name="Milk", kitchen_id=sample_kitchen.id)
+            ItemService.create_item(name="Eggs", kitchen_id=other.id)
+            ItemService.create_item(name="Bread", kitchen_id=sample_kitchen.id)
+
+            last_first = KitchenEventService.get_events_since(sample_kitchen.id, 0)[0].id
+            events = KitchenEventService.get_events_for_kitchens(
+                {sample_kitchen.id: last_first, other.id: 0}
+            )
+            assert [e.payload["name"] for e in events] == ["Eggs", "Bread"]
+            assert first.id != events[-1].payload["id"]
+
+    def test_prune_events(self, app, sample_kitchen):
+        """Test deleting events older than a cutoff in batches."""
+        with app.app_context():
+            for name in ("Milk", "Eggs", "Bread"):
+                ItemService.create_item(name=name, kitchen_id=sample_kitchen.id)
+            deleted = KitchenEventService.prune_events(
+                datetime.utcnow() + timedelta(seconds=1), batch_size=2
+            )
+            assert deleted == 3
+            assert KitchenEventService.get_last_event_id(sample_kitchen.id) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestEventBroker:
+    """Test fan-out from the outbox to subscriber queues."""
+
+    def test_poll_fans_out_to_subscribers(self, app, sample_kitchen):
+        """Test that every subscriber of a kitchen gets each new event once."""
+        with app.app_context():
+            broker = app.extensions["event_broker"]
+            ItemService.create_item(name="Before", kitchen_id=sample_kitchen.id)
+            first = broker.subscribe(sample_kitchen.id)
+            second = broker.subscribe(sample_kitchen.id)
+
+            ItemService.create_item(name="After", kitchen_id=sample_kitchen.id)
+            broker.poll_once()
+
+            for subscription in (first, second):
+                messages = []
+                while not subscription.queue.empty():
+                    messages.append(subscription.queue.get_nowait()[1])
+                # Only events committed after subscribing are delivered.
+                assert len(messages) == 1
+                assert "event: item.created" in messages[0]
+                data = json.loads(messages[0].split("data: ", 1)[1])
+                assert data["data"]["name"] == "After"
+
+            broker.unsubscribe(first)
+            broker.unsubscribe(second)
+            assert broker.subscriber_count() == 0
+
+    def test_slow_subscriber_is_dropped(self, app, sample_kitchen):
+        """Test that a full queue closes the subscription instead of blocking."""
+        with app.app_context():
+            broker = app.extensions["event_broker"]
+            broker.queue_size = 1
+            subscription = broker.subscribe(sample_kitchen.id)
+            ItemService.create_item(name="Milk", kitchen_id=sample_kitchen.id)
+            ItemService.create_item(name="Eggs", kitchen_id=sample_kitchen.id)
+            broker.poll_once()
+
+            assert subscription.closed is True
+            assert subscription.queue.qsize() == 1
+            assert broker.subscriber_count() == 0
+
+    def test_stream_ticket_is_scoped_and_expires(self, app, sample_kitchen, sample_user):
+        """Test that a stream ticket names its user for one kitchen until it expires."""
+        with app.app_context():
+            ticket = KitchenEventService.create_stream_ticket(sample_user.id, sample_kitchen.id)
+            assert KitchenEventService.verify_stream_ticket(ticket, sample_kitchen.id) == (
+                sample_user.id
+            )
+            assert KitchenEventService.verify_stream_ticket(ticket, sample_kitchen.id + 1) is None
+
+            app.config["EVENT_TICKET_SECONDS"] = -1
+            assert KitchenEventService.verify_stream_ticket(ticket, sample_kitchen.id) is None
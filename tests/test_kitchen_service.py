@@ -2,10 +2,13 @@
 Unit tests for KitchenService.
 """
 
+from datetime import datetime, timedelta
+
 import pytest
 
 from app.models.kitchen import Kitchen
-from app.services.kitchen_service import KitchenService
+from app.services import kitchen_service
+from app.services.kitchen_service import KitchenCodeUnavailable, KitchenService
 
 
 @pytest.mark.unit
@@ -30,6 +33,28 @@ class TestKitchenService:
             assert len(kitchen.code) == 6
             assert kitchen.code.isdigit()
 
+    def test_create_kitchen_retries_taken_code(self, app, sample_kitchen, monkeypatch):
+        """Test that a random code already in use falls back to a free one in its window."""
+        monkeypatch.setattr(kitchen_service, "CODE_SPACE", 4)
+        monkeypatch.setattr(kitchen_service.secrets, "randbelow", lambda n: 0)
+        sample_kitchen.code = "000000"
+        Kitchen.query.session.commit()
+
+        kitchen = KitchenService.create_kitchen(name="Second")
+        assert kitchen.code in {"000001", "000002", "000003"}
+        assert Kitchen.query.count() == 2
+
+    def test_create_kitchen_when_code_space_is_full(self, app, sample_kitchen, monkeypatch):
+        """Test that allocation gives up after a bounded number of attempts."""
+        monkeypatch.setattr(kitchen_service, "CODE_SPACE", 1)
+        sample_kitchen.code = "000000"
+        Kitchen.query.session.commit()
+
+        with pytest.raises(KitchenCodeUnavailable):
+            KitchenService.create_kitchen(name="No room")
+        assert KitchenService.generate_unique_code() is None
+        assert Kitchen.query.count() == 1
+
     def test_get_kitchen_by_id(self, app, sample_kitchen):
         """Test getting kitchen by ID."""
         with app.app_context():
@@ -64,6 +89,38 @@ class TestKitchenService:
             assert len(kitchens) >= 1
             assert any(k.id == sample_kitchen.id for k in kitchens)
 
+    def test_get_all_kitchens_keyset_pages_and_filters(self, app, db_session):
+        """Test name/created_at keyset pages with prefix and created_at range filters."""
+        base = datetime(2026, 1, 1)
+        names = ["Beta", "alpha", "Alpha 2", "Al_pha", "Gamma"]
+        for i, name in enumerate(names):
+            db_session.add(Kitchen(code=f"{i:06d}", name=name, created_at=base + timedelta(days=i)))
+        db_session.commit()
+
+        pages, cursor = [], None
+        while True:
+            page = KitchenService.get_all_kitchens(limit=2, cursor=cursor, sort="-created_at")
+            pages.append([k.name for k in page])
+            if len(page) < 2:
+                break
+            cursor = KitchenService.cursor_for(page[-1], "-created_at")
+        assert sum(pages, []) == list(reversed(names))
+
+        by_name = KitchenService.get_all_kitchens(sort="name", name_prefix="Al")
+        # LIKE is case-insensitive under SQLite and MySQL's default collations.
+        assert [k.name for k in by_name] == ["Al_pha", "Alpha 2", "alpha"]
+        assert [k.name for k in KitchenService.get_all_kitchens(name_prefix="Al_")] == ["Al_pha"]
+
+        in_range = KitchenService.get_all_kitchens(
+            created_from=base + timedelta(days=1), created_to=base + timedelta(days=3)
+        )
+        assert [k.name for k in in_range] == ["alpha", "Alpha 2"]
+
+        with pytest.raises(ValueError):
+            KitchenService.get_all_kitchens(cursor=cursor, sort="name")
+        with pytest.raises(ValueError):
+            KitchenService.get_all_kitchens(sort="code")
+
     def test_update_kitchen(self, app, sample_kitchen):
         """Test updating kitchen name."""
         with app.app_context():
@@ -71,6 +128,7 @@ class TestKitchenService:
             assert updated is not None
             assert updated.name == "Updated Kitchen"
             assert updated.id == sample_kitchen.id
+            assert updated.change_version == 1
 
     def test_update_kitchen_not_found(self, app):
         """Test updating non-existent kitchen."""
@@ -0,0 +1,66 @@
+"""
+Unit tests for KitchenSummaryService.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.consumption_log import ConsumptionLog
+from app.models.item import Item, ItemStatus
+from app.models.restock_log import RestockLog
+from app.models.user_model import User
+from app.services.kitchen_summary_service import KitchenSummaryService
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestKitchenSummaryService:
+    """Test KitchenSummaryService aggregates."""
+
+    def test_compute_summary(self, app, db_session, sample_kitchen, sample_user, sample_item):
+        """Test item counts, last restock, consumption window and top consumers."""
+        other = User(display_name="Other", kitchen_id=sample_kitchen.id, password_hash="x")
+        low = Item(
+            name="Low",
+            kitchen_id=sample_kitchen.id,
+            quantity_percent=0.0,
+            status=ItemStatus.NEEDED,
+        )
+        db_session.add_all([other, low])
+        db_session.flush()
+
+        now = datetime.utcnow()
+        restocked_at = now - timedelta(days=2)
+        db_session.add_all(
+            [
+                RestockLog(user_id=sample_user.id, item_id=sample_item.id, created_at=restocked_at),
+                ConsumptionLog(user_id=sample_user.id, item_id=low.id, percent_used=30.0),
+                ConsumptionLog(user_id=sample_user.id, item_id=low.id, percent_used=20.0),
+                ConsumptionLog(user_id=other.id, item_id=sample_item.id, percent_used=10.0),
+                # Outside the 7-day window.
+                ConsumptionLog(
+                    user_id=other.id,
+                    item_id=sample_item.id,
+                    percent_used=90.0,
+                    created_at=now - timedelta(days=30),
+                ),
+            ]
+        )
+        db_session.commit()
+
+        summary = KitchenSummaryService.compute_summary(sample_kitchen.id, days=7)
+        assert summary["items"] == {"total": 2, "needed": 1, "in_stock": 1, "low_stock": 1}
+        assert summary["last_restock_at"] == restocked_at.isoformat()
+        assert summary["consumption"] == {"days": 7, "count": 3, "percent_used": 60.0}
+        assert [c["display_name"] for c in summary["top_consumers"]] == ["TestUser", "Other"]
+        assert summary["top_consumers"][0]["percent_used"] == 50.0
+        assert summary["members"] == 2
+
+    def test_compute_summary_empty_kitchen(self, app, sample_kitchen):
+        """Test that a kitchen with no data gets zeroes rather than nulls."""
+        summary = KitchenSummaryService.compute_summary(sample_kitchen.id)
+        assert summary["items"] == {"total": 0, "needed": 0, "in_stock": 0, "low_stock": 0}
+        assert summary["last_restock_at"] is None
+        assert summary["consumption"]["count"] == 0
+        assert summary["top_consumers"] == []
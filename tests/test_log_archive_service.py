@@ -0,0 +1,167 @@
+"""
+Unit tests for LogArchiveService.
+"""
+
+import gzip
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.models.consumption_daily import ConsumptionDaily
+from app.models.consumption_log import ConsumptionLog
+from app.models.log_archive import LogArchive
+from app.models.restock_log import RestockLog
+from app.services.consumption_log_service import ConsumptionLogService
+from app.services.consumption_rollup_service import ConsumptionRollupService
+from app.services.log_archive_service import LogArchiveService
+
+NOW = datetime(2026, 6, 1, 9)
+
+
+def _read(path) -> list[dict]:
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle]
+
+
+@pytest.fixture
+def old_logs(db_session, sample_user, sample_item):
+    """Three consumption logs over two old days, one recent, and two old restocks."""
+    ConsumptionLogService.create_consumption_logs(
+        sample_user.id,
+        [
+            {
+                "item_id": sample_item.id,
+                "percent_used": 1.0,
+                "occurred_at": datetime(2025, 1, 2, 8),
+            },
+            {
+                "item_id": sample_item.id,
+                "percent_used": 2.0,
+                "occurred_at": datetime(2025, 1, 2, 20),
+            },
+            {
+                "item_id": sample_item.id,
+                "percent_used": 4.0,
+                "occurred_at": datetime(2025, 2, 3, 12),
+            },
+            {
+                "item_id": sample_item.id,
+                "percent_used": 8.0,
+                "occurred_at": NOW - timedelta(days=1),
+            },
+        ],
+    )
+    db_session.add_all(
+        RestockLog(user_id=sample_user.id, item_id=sample_item.id, created_at=created_at)
+        for created_at in (datetime(2025, 1, 5), datetime(2025, 3, 1))
+    )
+    db_session.commit()
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestLogArchiveService:
+    """Test archiving, deletion, resumption and the rollup guard."""
+
+    def test_archive_writes_daily_files_and_deletes_rows(
+        self, app, old_logs, sample_item, sample_kitchen, tmp_path
+    ):
+        """Test that each old day becomes one file and leaves the hot table."""
+        version = sample_kitchen.change_version
+        report = LogArchiveService.archive(30, str(tmp_path), chunk_size=1, now=NOW)
+
+        assert report["cutoff"] == "2026-05-02T00:00:00"
+        assert report["tables"]["consumption_logs"] == {
+            "days": 2,
+            "archived": 3,
+            "deleted": 3,
+            "resumed": 0,
+        }
+        assert report["tables"]["restock_logs"]["archived"] == 2
+        assert ConsumptionLog.query.count() == 1
+        assert RestockLog.query.count() == 0
+
+        manifests = LogArchiveService.get_archives("consumption_logs")
+        assert [(m.day, m.row_count, m.percent_used) for m in manifests] == [
+            (date(2025, 1, 2), 2, 3.0),
+            (date(2025, 2, 3), 1, 4.0),
+        ]
+        assert all(m.deleted_at is not None for m in manifests)
+        first = manifests[0]
+        assert first.path.startswith("consumption_logs/2025/01/consumption_logs-2025-01-02-")
+        rows = _read(tmp_path / first.path)
+        assert [row["percent_used"] for row in rows] == [1.0, 2.0]
+        assert rows[0]["item_id"] == sample_item.id
+        assert rows[0]["created_at"] == "2025-01-02T08:00:00"
+        assert [row["id"] for row in rows] == [first.first_id, first.last_id]
+        assert not list(tmp_path.rglob("*.part"))
+
+        # Rollup rows of archived days stay, and rebuilding does not touch them.
+        assert ConsumptionDaily.query.count() == 3
+        assert ConsumptionRollupService.rebuild() == 1
+        assert ConsumptionRollupService.rebuild(end=date(2025, 2, 1)) == 0
+        assert ConsumptionDaily.query.count() == 3
+        assert sample_kitchen.change_version > version
+
+        again = LogArchiveService.archive(30, str(tmp_path), now=NOW)
+        assert again["tables"]["consumption_logs"]["days"] == 0
+
+    def test_archive_resumes_interrupted_deletion(self, app, db_session, old_logs, tmp_path):
+        """Test that rows of a manifest left without deleted_at are deleted on the next run."""
+        rows = ConsumptionLog.query.filter(ConsumptionLog.created_at < datetime(2025, 1, 3)).all()
+        db_session.add(
+            LogArchive(
+                table_name="consumption_logs",
+                day=date(2025, 1, 2),
+                path="consumption_logs/2025/01/interrupted.ndjson.gz",
+                first_id=min(row.id for row in rows),
+                last_id=max(row.id for row in rows),
+                row_count=2,
+                percent_used=3.0,
+            )
+        )
+        db_session.commit()
+
+        report = LogArchiveService.archive(30, str(tmp_path), tables=["consumption_logs"], now=NOW)
+        counts = report["tables"]["consumption_logs"]
+        assert counts == {"days": 1, "archived": 1, "deleted": 3, "resumed": 1}
+        assert LogArchive.query.filter(LogArchive.deleted_at.is_(None)).count() == 0
+        assert RestockLog.query.count() == 2
+
+    def test_archive_rejects_bad_arguments(self, app, tmp_path):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            LogArchiveService.archive(0, str(tmp_path))
+        with pytest.raises(ValueError):
+            LogArchiveService.archive(30, str(tmp_path), chunk_size=0)
+        with pytest.raises(ValueError):
+            LogArchiveService.archive(30, str(tmp_path), tables=["items"])
+
+    def test_cli(self, app, old_logs, tmp_path):
+        """Test the logs archive and logs archives commands."""
+        runner = app.test_cli_runner()
+        result = runner.invoke(
+            args=[
+                "logs",
+                "archive",
+                "--older-than-days",
+                "30",
+                "--table",
+                "restock_logs",
+                "--dir",
+                str(tmp_path),
+            ]
+        )
+        assert result.exit_code == 0
+        assert "restock_logs: archived 2 row(s) from 2 day(s), deleted 2" in result.output
+        assert "consumption_logs" not in result.output
+
+        result = runner.invoke(args=["logs", "archives"])
+        assert result.exit_code == 0
+        assert "2025-01-05" in result.output
+
+        result = runner.invoke(
+            args=["logs", "archive", "--chunk-size", "0", "--dir", str(tmp_path)]
+        )
+        assert result.exit_code != 0
@@ -0,0 +1,132 @@
+"""
+Unit tests for the lookup caches.
+"""
+
+import pytest
+
+from app.extensions import db
+from app.models.user_model import User
+from app.services.auth_service import AuthService
+from app.services.kitchen_service import KitchenService
+from app.services.lookup_cache import StaleWhileRevalidateCache, TTLCache, kitchen_cache, user_cache
+
+
+@pytest.mark.unit
+class TestStaleWhileRevalidateCache:
+    """Test fresh, stale and expired reads of StaleWhileRevalidateCache."""
+
+    def test_stale_entry_is_served_then_refreshed(self, app, clock):
+        """Test that a stale read returns the old value and reloads it once."""
+        cache = StaleWhileRevalidateCache("test", fresh=10, stale=100, clock=clock)
+        cache.configure(maxsize=4, fresh=10, stale=100, background=False)
+        loads = []
+
+        def loader():
+            loads.append(clock.now)
+            return len(loads)
+
+        assert cache.get_or_load("k", loader) == 1
+        clock.now = 9
+        assert cache.get_or_load("k", loader) == 1
+        clock.now = 50
+        assert cache.get_or_load("k", loader) == 1
+        assert cache.get_or_load("k", loader) == 2
+        clock.now = 500
+        assert cache.get_or_load("k", loader) == 3
+
+        assert loads == [0, 50, 500]
+        stats = cache.stats()
+        assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (2, 1, 2)
+        assert stats["refreshes"] == 1
+
+    def test_background_refresh_runs_in_app_context(self, app, clock):
+        """Test that a background reload replaces the stale entry."""
+        cache = StaleWhileRevalidateCache("test", fresh=10, stale=100, clock=clock)
+        values = iter(["old", "new"])
+        assert cache.get_or_load("k", lambda: next(values)) == "old"
+
+        clock.now = 20
+        assert cache.get_or_load("k", lambda: next(values)) == "old"
+        cache._executor.shutdown(wait=True)
+        assert cache.get_or_load("k", lambda: "unused") == "new"
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test TTLCache expiry, eviction and counters."""
+
+    def test_entries_expire_after_ttl(self, clock):
+        """Test that an entry is served until its TTL passes."""
+        cache = TTLCache("test", maxsize=4, ttl=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test LRU eviction once maxsize is reached."""
+        cache = TTLCache("test", maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_get_or_load_skips_none_and_stale_loads(self):
+        """Test that misses are not cached and loads racing an invalidation are dropped."""
+        cache = TTLCache("test", maxsize=4, ttl=60)
+        assert cache.get_or_load("a", lambda: None) is None
+        assert cache.stats()["size"] == 0
+
+        def racing_load():
+            cache.invalidate("a")
+            return "stale"
+
+        assert cache.get_or_load("a", racing_load) == "stale"
+        assert cache.get("a") is None
+        assert cache.get_or_load("a", lambda: "fresh") == "fresh"
+        assert cache.get("a") == "fresh"
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that a TTL of 0 turns caching off."""
+        cache = TTLCache("test", maxsize=4, ttl=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestLookupCaches:
+    """Test the kitchen and user lookup caches through the services."""
+
+    def test_kitchen_by_code_is_cached_and_invalidated(self, app, sample_kitchen):
+        """Test caching kitchens by code and invalidation on update and delete."""
+        with app.app_context():
+            first = KitchenService.get_cached_kitchen_by_code(sample_kitchen.code)
+            second = KitchenService.get_cached_kitchen_by_code(sample_kitchen.code)
+            assert first == second
+            assert kitchen_cache.stats()["hits"] == 1
+
+            KitchenService.update_kitchen(sample_kitchen.id, "Renamed")
+            renamed = KitchenService.get_cached_kitchen_by_code(sample_kitchen.code)
+            assert renamed["name"] == "Renamed"
+
+            KitchenService.delete_kitchen(sample_kitchen.id)
+            assert KitchenService.get_cached_kitchen_by_code(sample_kitchen.code) is None
+
+    def test_user_profile_is_invalidated_on_update(self, app, sample_user):
+        """Test that committing a user change drops the cached profile."""
+        with app.app_context():
+            assert AuthService.get_user_profile(sample_user.id)["is_active"] is True
+
+            user = db.session.get(User, sample_user.id)
+            user.is_active = False
+            db.session.commit()
+
+            assert AuthService.get_user_profile(sample_user.id)["is_active"] is False
+            assert user_cache.stats()["hits"] == 0
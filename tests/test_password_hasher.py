@@ -0,0 +1,51 @@
+"""
+Unit tests for the bounded password hashing pool.
+"""
+
+import threading
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+from app.services.password_hasher import PasswordHasher, PasswordHasherBusy, normalize_method
+
+
+@pytest.mark.unit
+class TestPasswordHasher:
+    """Test PasswordHasher hashing, rehash detection and load shedding."""
+
+    def test_normalize_method_fills_werkzeug_defaults(self):
+        """Test that short method strings match the prefix werkzeug stores."""
+        for method in ("scrypt", "scrypt:16384", "pbkdf2", "pbkdf2:sha256:1000"):
+            stored = generate_password_hash("x", normalize_method(method)).split("$", 1)[0]
+            assert stored == normalize_method(method)
+        assert normalize_method("scrypt") == generate_password_hash("x").split("$", 1)[0]
+
+    def test_hash_verify_and_needs_rehash(self, app):
+        """Test round-tripping a password and spotting outdated parameters."""
+        hasher = app.extensions["password_hasher"]
+        password_hash = hasher.hash("Test#123")
+        assert hasher.verify(password_hash, "Test#123")
+        assert not hasher.verify(password_hash, "wrong")
+        assert not hasher.needs_rehash(password_hash)
+        assert hasher.needs_rehash(generate_password_hash("Test#123", "pbkdf2:sha256:500"))
+
+    def test_full_pool_rejects_immediately(self, app):
+        """Test that work beyond workers + queue limit raises instead of queueing."""
+        app.config.update(PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_QUEUE_LIMIT=0)
+        hasher = PasswordHasher(app)
+        started, release = threading.Event(), threading.Event()
+
+        def slow(_password, _method):
+            started.set()
+            release.wait(5)
+            return "hash"
+
+        hasher_thread = threading.Thread(target=lambda: hasher._run(slow, "x", "m"))
+        hasher_thread.start()
+        assert started.wait(5)
+        with pytest.raises(PasswordHasherBusy):
+            hasher.hash("Test#123")
+        release.set()
+        hasher_thread.join(5)
+        assert hasher.verify(hasher.hash("Test#123"), "Test#123")
@@ -0,0 +1,47 @@
+"""
+Tests for the explain-queries CLI command.
+"""
+
+import pytest
+
+
+@pytest.mark.integration
+class TestExplainQueriesCommand:
+    """Test the query-plan report."""
+
+    def test_explain_with_seed(self, app):
+        """Test that every service query is explained and indexed lookups are not flagged."""
+        result = app.test_cli_runner().invoke(args=["explain-queries", "--seed", "20"])
+        assert result.exit_code == 0
+        assert "ConsumptionLogService.get_consumption_logs_by_item" in result.output
+        assert "[ok] ConsumptionLogService.get_consumption_logs_by_user" in result.output
+        assert "[ok] ItemService.get_items_by_kitchen" in result.output
+
+    def test_explain_rolls_back_seed(self, app):
+        """Test that seeded rows are not left behind."""
+        from app.models.kitchen import Kitchen
+
+        app.test_cli_runner().invoke(args=["explain-queries", "--seed", "5"])
+        assert Kitchen.query.count() == 0
+
+    def test_explain_empty_database(self, app):
+        """Test that an empty database without --seed is reported."""
+        result = app.test_cli_runner().invoke(args=["explain-queries"])
+        assert result.exit_code != 0
+        assert "--seed" in result.output
+
+    def test_explain_flags_only_stored_table_scans(self, app):
+        """Test that scanning a table is flagged and scanning a derived table is not."""
+        from app.commands.query_plan_commands import explain
+
+        assert explain("SELECT * FROM items", ())[1]
+        plan, full_scan = explain("SELECT kitchen_id FROM items ORDER BY kitchen_id", ())
+        assert "USING COVERING INDEX" in plan[0]
+        assert full_scan
+        assert not explain("SELECT name FROM items WHERE kitchen_id = ?", (1,))[1]
+        _, full_scan = explain(
+            "SELECT * FROM (SELECT item_id, row_number() OVER (ORDER BY created_at) AS n "
+            "FROM restock_logs WHERE item_id = ?) AS ranked",
+            (1,),
+        )
+        assert not full_scan
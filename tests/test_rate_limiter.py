@@ -0,0 +1,87 @@
+"""
+Unit and integration tests for token-bucket rate limiting.
+"""
+
+import pytest
+
+from app.services.rate_limiter import MemoryBucketStore, parse_limit
+
+
+@pytest.mark.unit
+class TestTokenBuckets:
+    """Test limit parsing and the in-memory bucket store."""
+
+    def test_parse_limit(self):
+        """Test that limits become a refill rate per second and a capacity."""
+        assert parse_limit("10/minute") == (10 / 60, 10)
+        assert parse_limit("5/second") == (5, 5)
+        for invalid in ("10", "ten/minute", "10/fortnight", "0/minute"):
+            with pytest.raises(ValueError):
+                parse_limit(invalid)
+
+    def test_bucket_drains_and_refills(self, clock):
+        """Test that a bucket allows a burst, then one request per refill interval."""
+        store = MemoryBucketStore(clock=clock)
+        rate, capacity = parse_limit("3/minute")
+
+        assert [store.take("k", rate, capacity) for _ in range(3)] == [0, 0, 0]
+        assert store.take("k", rate, capacity) == pytest.approx(20)
+
+        clock.now = 20
+        assert store.take("k", rate, capacity) == 0
+        assert store.take("k", rate, capacity) > 0
+        assert store.take("other", rate, capacity) == 0
+
+    def test_store_evicts_least_recently_used(self, clock):
+        """Test that the store stays bounded and forgets the oldest bucket."""
+        store = MemoryBucketStore(max_keys=2, clock=clock)
+        rate, capacity = parse_limit("1/hour")
+        for key in ("a", "b", "c"):
+            store.take(key, rate, capacity)
+
+        assert store.take("a", rate, capacity) == 0
+        assert store.take("c", rate, capacity) > 0
+
+
+@pytest.mark.integration
+class TestRateLimitedEndpoints:
+    """Test 429 responses from the before-request hook."""
+
+    @pytest.fixture
+    def limiter(self, app, monkeypatch):
+        limiter = app.extensions["rate_limiter"]
+        monkeypatch.setattr(limiter, "enabled", True)
+        monkeypatch.setattr(limiter, "store", MemoryBucketStore())
+        return limiter
+
+    def test_login_limited_per_ip(self, client, limiter, monkeypatch):
+        """Test that repeated logins from one address get 429 with Retry-After."""
+        monkeypatch.setattr(limiter, "rules", {"auth": {"ip": parse_limit("2/minute")}})
+        payload = {"display_name": "nobody", "kitchen_code": "000000", "password": "x"}
+
+        statuses = [client.post("/auth/login", json=payload).status_code for _ in range(3)]
+        assert 429 not in statuses[:2]
+        assert statuses[2] == 429
+
+        response = client.post("/auth/login", json=payload)
+        assert response.headers["Retry-After"] == "30"
+        assert response.get_json() == {
+            "code": "rate_limited",
+            "message": "Too many requests, retry later",
+            "scope": "ip",
+        }
+        assert client.get("/health/").status_code == 200
+
+    def test_writes_limited_per_kitchen(self, client, limiter, monkeypatch, auth_headers):
+        """Test that the kitchen bucket uses the claim in the access token."""
+        monkeypatch.setattr(limiter, "rules", {"default": {"kitchen": parse_limit("1/hour")}})
+
+        assert client.get("/items", headers=auth_headers).status_code != 429
+        first = client.post("/items", json={}, headers=auth_headers)
+        second = client.post("/items", json={}, headers=auth_headers)
+        anonymous = client.post("/items", json={})
+
+        assert first.status_code == 400
+        assert second.status_code == 429
+        assert second.get_json()["scope"] == "kitchen"
+        assert anonymous.status_code == 401
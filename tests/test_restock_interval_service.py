@@ -0,0 +1,108 @@
+"""
+Unit tests for RestockIntervalService.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.item import Item
+from app.models.kitchen import Kitchen
+from app.models.restock_log import RestockLog
+from app.services.kitchen_version_service import KitchenVersionService
+from app.services.restock_interval_service import RestockIntervalService
+
+START = datetime(2026, 1, 1, 9)
+
+
+@pytest.fixture
+def restock_history(db_session, sample_kitchen, sample_user, sample_item):
+    """sample_item restocked after 1, 2, 4 and 7 days; two items that must not be reported."""
+    once = Item(name="Once", kitchen_id=sample_kitchen.id)
+    other_kitchen = Kitchen(code="654321", name="Other")
+    db_session.add_all([once, other_kitchen])
+    db_session.flush()
+    elsewhere = Item(name="Elsewhere", kitchen_id=other_kitchen.id)
+    db_session.add(elsewhere)
+    db_session.flush()
+
+    logs = [
+        RestockLog(user_id=sample_user.id, item_id=sample_item.id, created_at=START + timedelta(d))
+        for d in (7, 0, 3, 14, 1)
+    ]
+    logs.append(RestockLog(user_id=sample_user.id, item_id=once.id, created_at=START))
+    logs += [
+        RestockLog(user_id=sample_user.id, item_id=elsewhere.id, created_at=START + timedelta(d))
+        for d in (0, 30)
+    ]
+    db_session.add_all(logs)
+    db_session.commit()
+    return sample_item
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestRestockIntervalService:
+    """Test interval statistics, the fallback path and caching."""
+
+    EXPECTED = {
+        "restocks": 5,
+        "mean_days": 3.5,
+        "stddev_days": 2.291,
+        "p50_days": 2.0,
+        "p90_days": 7.0,
+        "min_days": 1.0,
+        "max_days": 7.0,
+    }
+
+    def test_compute_intervals_with_window_functions(self, app, restock_history):
+        """Test mean, spread and nearest-rank percentiles from LAG()."""
+        assert RestockIntervalService.supports_window_functions()
+        (stats,) = RestockIntervalService.compute_intervals(restock_history.kitchen_id)
+        assert stats == {"item_id": restock_history.id, "name": "Test Item", **self.EXPECTED}
+
+    def test_fallback_matches_window_functions(self, app, restock_history, monkeypatch):
+        """Test that the correlated-subquery path gives the same figures."""
+        monkeypatch.setattr(
+            RestockIntervalService, "supports_window_functions", staticmethod(lambda: False)
+        )
+        (stats,) = RestockIntervalService.compute_intervals(restock_history.kitchen_id)
+        assert stats == {"item_id": restock_history.id, "name": "Test Item", **self.EXPECTED}
+
+    def test_fallback_breaks_timestamp_ties_on_id(
+        self, app, db_session, restock_history, sample_user, monkeypatch
+    ):
+        """Test that two restocks at the same second give one 0 interval on both paths."""
+        db_session.add(
+            RestockLog(
+                user_id=sample_user.id,
+                item_id=restock_history.id,
+                created_at=START + timedelta(14),
+            )
+        )
+        db_session.commit()
+        (expected,) = RestockIntervalService.compute_intervals(restock_history.kitchen_id)
+        assert expected["restocks"] == 6
+        assert expected["min_days"] == 0.0
+
+        monkeypatch.setattr(
+            RestockIntervalService, "supports_window_functions", staticmethod(lambda: False)
+        )
+        (stats,) = RestockIntervalService.compute_intervals(restock_history.kitchen_id)
+        assert stats == expected
+
+    def test_cached_per_kitchen_version(
+        self, app, db_session, restock_history, sample_user, statements
+    ):
+        """Test that repeat reads hit the cache and any version bump, in any worker, misses it."""
+        kitchen_id = restock_history.kitchen_id
+        RestockIntervalService.get_intervals(kitchen_id)
+        statements.clear()
+        assert RestockIntervalService.get_intervals(kitchen_id)[0]["restocks"] == 5
+        assert len(statements) == 1 and "change_version" in statements[0]
+
+        # A restock written elsewhere: no local invalidation, only the version bump.
+        db_session.add(RestockLog(user_id=sample_user.id, item_id=restock_history.id))
+        KitchenVersionService.bump(kitchen_id)
+        db_session.commit()
+        assert RestockIntervalService.get_intervals(kitchen_id)[0]["restocks"] == 6
@@ -4,7 +4,8 @@ Unit tests for RestockLogService.
 
 import pytest
 
-from app.models.item import ItemStatus
+from app.extensions import db
+from app.models.item import Item, ItemStatus
 from app.services.restock_log_service import RestockLogService
 
 
@@ -82,6 +83,16 @@ class TestRestockLogService:
             assert log1.id in log_ids
             assert log2.id in log_ids
 
+    def test_create_restock_log_locks_kitchen_first(
+        self, app, sample_user, sample_item, statements
+    ):
+        """Test that the kitchen row is written before the log and item rows."""
+        statements.clear()
+        RestockLogService.create_restock_log(user_id=sample_user.id, item_id=sample_item.id)
+        writes = [s.split()[:3] for s in statements if s.startswith(("UPDATE", "INSERT"))]
+        assert writes[0] == ["UPDATE", "kitchens", "SET"]
+        assert ["UPDATE", "items", "SET"] in writes
+
     def test_get_restock_logs_by_kitchen(self, app, sample_user, sample_item, sample_kitchen):
         """Test getting restock logs by kitchen."""
         with app.app_context():
@@ -106,6 +117,33 @@ class TestRestockLogService:
             assert len(logs) >= 1
             assert any(log_entry.id == log.id for log_entry in logs)
 
+    def test_get_restock_logs_pages_and_range(self, app, db_session, sample_user, sample_item):
+        """Test from/to bounds and cursor paging of restock logs."""
+        from datetime import datetime
+
+        from app.models.restock_log import RestockLog
+        from app.services.pagination import created_at_cursor
+
+        with app.app_context():
+            db_session.add_all(
+                RestockLog(
+                    user_id=sample_user.id, item_id=sample_item.id, created_at=datetime(2026, 2, d)
+                )
+                for d in (1, 2, 3, 4)
+            )
+            db_session.commit()
+
+            first = RestockLogService.get_restock_logs_by_user(sample_user.id, limit=3)
+            rest = RestockLogService.get_restock_logs_by_user(
+                sample_user.id, cursor=created_at_cursor(first[-1]), limit=3
+            )
+            assert [log.created_at.day for log in first + rest] == [4, 3, 2, 1]
+
+            logs = RestockLogService.get_restock_logs_by_item(
+                sample_item.id, start=datetime(2026, 2, 2), end=datetime(2026, 2, 4)
+            )
+            assert [log.created_at.day for log in logs] == [3, 2]
+
     def test_delete_restock_log(self, app, sample_user, sample_item):
         """Test deleting a restock log."""
         with app.app_context():
@@ -125,3 +163,84 @@ class TestRestockLogService:
         with app.app_context():
             success = RestockLogService.delete_restock_log(99999)
             assert success is False
+
+    def test_iter_restock_logs_by_kitchen(self, app, sample_user, sample_item, sample_kitchen):
+        """Test streaming a kitchen's restock logs."""
+        with app.app_context():
+            from datetime import datetime, timedelta
+
+            RestockLogService.create_restock_log(sample_user.id, sample_item.id)
+            rows = list(RestockLogService.iter_restock_logs_by_kitchen(sample_kitchen.id))
+            assert [row["item_id"] for row in rows] == [sample_item.id]
+
+            later = datetime.utcnow() + timedelta(days=1)
+            assert (
+                list(RestockLogService.iter_restock_logs_by_kitchen(sample_kitchen.id, start=later))
+                == []
+            )
+            assert list(
+                RestockLogService.iter_restock_logs_by_kitchen(sample_kitchen.id, end=later)
+            )
+
+    def _make_items(self, db_session, kitchen_id):
+        items = [
+            Item(
+                name="Needed",
+                kitchen_id=kitchen_id,
+                quantity_percent=50.0,
+                status=ItemStatus.NEEDED,
+            ),
+            Item(
+                name="Low", kitchen_id=kitchen_id, quantity_percent=10.0, status=ItemStatus.IN_STOCK
+            ),
+            Item(
+                name="Fine",
+                kitchen_id=kitchen_id,
+                quantity_percent=90.0,
+                status=ItemStatus.IN_STOCK,
+            ),
+        ]
+        db_session.add_all(items)
+        db_session.commit()
+        return [item.id for item in items]
+
+    def test_bulk_restock_needed(self, app, db_session, sample_user, sample_kitchen):
+        """Test bulk restocking a kitchen's NEEDED items."""
+        with app.app_context():
+            needed, low, fine = self._make_items(db_session, sample_kitchen.id)
+            restocked = RestockLogService.bulk_restock(
+                sample_user.id, kitchen_id=sample_kitchen.id, item_filter="needed"
+            )
+            assert restocked == [needed]
+            item = db.session.get(Item, needed)
+            assert item.quantity_percent == 100.0
+            assert item.status == ItemStatus.IN_STOCK
+            assert len(RestockLogService.get_restock_logs_by_item(needed)) == 1
+            assert RestockLogService.get_restock_logs_by_item(fine) == []
+
+    def test_bulk_restock_below_threshold(self, app, db_session, sample_user, sample_kitchen):
+        """Test bulk restocking items at or below their low-stock threshold."""
+        with app.app_context():
+            needed, low, fine = self._make_items(db_session, sample_kitchen.id)
+            restocked = RestockLogService.bulk_restock(
+                sample_user.id, kitchen_id=sample_kitchen.id, item_filter="below_threshold"
+            )
+            assert restocked == [low]
+
+    def test_bulk_restock_item_ids(self, app, db_session, sample_user, sample_kitchen):
+        """Test bulk restocking an explicit list of items."""
+        with app.app_context():
+            needed, low, fine = self._make_items(db_session, sample_kitchen.id)
+            restocked = RestockLogService.bulk_restock(sample_user.id, item_ids=[low, fine, 99999])
+            assert restocked == [low, fine]
+            assert RestockLogService.bulk_restock(sample_user.id, item_ids=[99999]) == []
+
+    def test_bulk_restock_invalid_arguments(self, app, sample_user, sample_kitchen):
+        """Test that a missing target or unknown filter is rejected."""
+        with app.app_context():
+            with pytest.raises(ValueError):
+                RestockLogService.bulk_restock(sample_user.id)
+            with pytest.raises(ValueError):
+                RestockLogService.bulk_restock(
+                    sample_user.id, kitchen_id=sample_kitchen.id, item_filter="bogus"
+                )
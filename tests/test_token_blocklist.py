@@ -0,0 +1,153 @@
+"""
+Unit and integration tests for JWT revocation.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.revoked_token import RevokedToken
+from app.services.auth_service import AuthService
+from app.services.token_blocklist import BloomFilter
+
+
+def _login(client, sample_user, sample_kitchen) -> dict:
+    response = client.post(
+        "/auth/login",
+        json={
+            "display_name": sample_user.display_name,
+            "kitchen_code": sample_kitchen.code,
+            "password": "Test#123",
+        },
+    )
+    return response.get_json()
+
+
+@pytest.mark.unit
+class TestBloomFilter:
+    """Test Bloom filter membership and sizing."""
+
+    def test_no_false_negatives_and_low_false_positive_rate(self):
+        """Test that added keys are always found and others rarely are."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti:{i}")
+
+        assert all(f"jti:{i}" in bloom for i in range(1000))
+        false_positives = sum(f"other:{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+        # Keys that collide with earlier ones are not counted twice.
+        count = bloom.count
+        assert 980 <= count <= 1000
+
+        bloom.add("jti:0")
+        assert bloom.count == count
+
+
+@pytest.mark.integration
+class TestTokenRevocation:
+    """Test logout, user revocation and the blocklist refresh."""
+
+    def test_logout_revokes_access_and_refresh_tokens(self, client, sample_user, sample_kitchen):
+        """Test that both tokens stop working after logout."""
+        tokens = _login(client, sample_user, sample_kitchen)
+        access = {"Authorization": f"Bearer {tokens['access_token']}"}
+        refresh = {"Authorization": f"Bearer {tokens['refresh_token']}"}
+
+        response = client.post(
+            "/auth/logout", json={"refresh_token": tokens["refresh_token"]}, headers=access
+        )
+        assert response.status_code == 200
+
+        assert client.get("/auth/me", headers=access).status_code == 401
+        assert client.post("/auth/refresh", headers=refresh).status_code == 401
+        assert RevokedToken.query.count() == 2
+
+        fresh = _login(client, sample_user, sample_kitchen)
+        headers = {"Authorization": f"Bearer {fresh['access_token']}"}
+        assert client.get("/auth/me", headers=headers).status_code == 200
+
+    def test_logout_rejects_invalid_refresh_token(self, client, auth_headers):
+        """Test that a bad refresh token is reported and nothing is revoked."""
+        response = client.post(
+            "/auth/logout", json={"refresh_token": "not-a-token"}, headers=auth_headers
+        )
+        assert response.status_code == 400
+        assert response.get_json()["field"] == "refresh_token"
+        assert client.get("/auth/me", headers=auth_headers).status_code == 200
+
+    def test_deactivate_user_revokes_existing_tokens(
+        self, app, client, sample_user, sample_kitchen
+    ):
+        """Test that deactivation cuts off tokens issued before it."""
+        tokens = _login(client, sample_user, sample_kitchen)
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        assert client.get("/auth/me", headers=headers).status_code == 200
+
+        assert AuthService.deactivate_user(sample_user.id)
+        assert client.get("/auth/me", headers=headers).status_code == 401
+        assert not AuthService.deactivate_user(9999)
+
+    def test_unrevoked_tokens_skip_the_database(self, app, client, auth_headers, statements):
+        """Test that the filter answers "not revoked" without a blocklist query."""
+        blocklist = app.extensions["token_blocklist"]
+        blocklist.refresh(force=True)
+        AuthService.revoke_token("someone-else", int(datetime.utcnow().timestamp()) + 60)
+
+        statements.clear()
+        client.get("/items", headers=auth_headers)
+        assert blocklist.db_checks == 0
+        assert not [s for s in statements if "revoked_tokens" in s]
+
+    def test_refresh_picks_up_rows_from_other_workers(self, app, db_session):
+        """Test that rows written elsewhere are seen after the next refresh."""
+        blocklist = app.extensions["token_blocklist"]
+        payload = {"jti": "remote", "sub": "1", "iat": int(datetime.utcnow().timestamp())}
+        blocklist.refresh(force=True)
+
+        db_session.add(RevokedToken(jti="remote", expires_at=datetime.utcnow() + timedelta(1)))
+        db_session.commit()
+        assert not blocklist.is_revoked(payload)
+
+        blocklist.refresh(force=True)
+        assert blocklist.is_revoked(payload)
+
+    def test_refresh_does_not_recount_overlap_rows(self, app, db_session):
+        """Test that rows re-read inside the refresh overlap do not inflate the filter count."""
+        blocklist = app.extensions["token_blocklist"]
+        db_session.add(RevokedToken(jti="again", expires_at=datetime.utcnow() + timedelta(1)))
+        db_session.commit()
+        blocklist.refresh(force=True)
+        count = blocklist._filter.count
+
+        blocklist.refresh(force=True)
+        blocklist.add("jti:again")
+        assert blocklist._filter.count == count
+
+    def test_user_revocation_compares_whole_seconds(self, app, db_session, sample_user):
+        """Test that tokens of the revocation's second are revoked and later ones are not."""
+        blocklist = app.extensions["token_blocklist"]
+        AuthService.revoke_user_tokens(sample_user.id)
+        revoked_at = RevokedToken.query.filter_by(user_id=sample_user.id).one().revoked_at
+        assert revoked_at.microsecond == 0
+
+        def payload(issued_at):
+            iat = int((issued_at - datetime(1970, 1, 1)).total_seconds())
+            return {"jti": f"t{iat}", "sub": str(sample_user.id), "iat": iat}
+
+        assert blocklist.is_revoked(payload(revoked_at - timedelta(seconds=1)))
+        assert not blocklist.is_revoked(payload(revoked_at))
+
+    def test_purge_removes_expired_entries(self, db_session):
+        """Test that expired blocklist rows are deleted and live ones kept."""
+        now = datetime.utcnow()
+        db_session.add_all(
+            [
+                RevokedToken(jti="old", expires_at=now - timedelta(minutes=1)),
+                RevokedToken(jti="live", expires_at=now + timedelta(minutes=1)),
+            ]
+        )
+        db_session.commit()
+
+        assert AuthService.purge_revoked_tokens() == 1
+        assert [row.jti for row in RevokedToken.query.all()] == ["live"]